@@ -31,6 +31,15 @@ class DiscordSettings(BaseSettings):
     reconnect_delay: int = Field(
         default=1, description="Delay between reconnection attempts in seconds"
     )
+    max_concurrent_requests: int = Field(
+        default=8, description="Maximum concurrent REST requests issued by batch tools"
+    )
+    attachment_dir: str | None = Field(
+        default=None,
+        description=(
+            "Directory that server-side attachment paths are resolved in; unset disables them"
+        ),
+    )
 
 
 class EventStreamSettings(BaseSettings):
@@ -45,11 +54,51 @@ class EventStreamSettings(BaseSettings):
     timeout: int = Field(default=30, description="Event stream timeout in seconds")
 
 
+class StorageSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    data_dir: str = Field(default=".discord-mcp", description="Directory for persistent state")
+
+
+class SearchSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    message_index_enabled: bool = Field(
+        default=False, description="Index message content on disk for search_messages"
+    )
+
+
+class RaidSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    detection_enabled: bool = Field(
+        default=True, description="Analyze member joins for raids; per-guild policies still apply"
+    )
+
+
 class Settings:
     def __init__(self):
         self.mcp = MCPSettings()
         self.discord = DiscordSettings()
         self.event_stream = EventStreamSettings()
+        self.storage = StorageSettings()
+        self.search = SearchSettings()
+        self.raid = RaidSettings()
 
     @property
     def project_root(self) -> Path:
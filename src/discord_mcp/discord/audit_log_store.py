@@ -0,0 +1,261 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    action INTEGER NOT NULL,
+    user_id INTEGER,
+    target_id INTEGER,
+    reason TEXT,
+    changes TEXT
+);
+CREATE INDEX IF NOT EXISTS audit_log_guild ON audit_log (guild_id, id);
+CREATE INDEX IF NOT EXISTS audit_log_action ON audit_log (guild_id, action, id);
+CREATE INDEX IF NOT EXISTS audit_log_user ON audit_log (guild_id, user_id, id);
+CREATE INDEX IF NOT EXISTS audit_log_target ON audit_log (guild_id, target_id, id);
+CREATE TABLE IF NOT EXISTS audit_log_state (
+    guild_id INTEGER PRIMARY KEY,
+    oldest_id INTEGER,
+    newest_id INTEGER,
+    complete INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+"""
+
+_UPSERT = """
+INSERT INTO audit_log (id, guild_id, action, user_id, target_id, reason, changes)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO NOTHING
+"""
+
+# Rows written per transaction while paging; also the resume granularity of a sync.
+_SYNC_BATCH = 500
+
+
+def _change_dicts(changes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "attribute": change.get("key"),
+            "before": change.get("old_value"),
+            "after": change.get("new_value"),
+        }
+        for change in changes
+    ]
+
+
+def entry_changes(entry: discord.AuditLogEntry) -> list[dict[str, Any]]:
+    """The entry's changes as the API sent them, without building discord.py objects.
+
+    ``AuditLogEntry.changes`` converts every value into models (and drops the raw data
+    once read); the raw ``key``/``old_value``/``new_value`` triples are already JSON.
+    """
+    return _change_dicts(getattr(entry, "_changes", None) or [])
+
+
+def _entry_row(guild_id: int, entry: discord.AuditLogEntry) -> tuple[Any, ...]:
+    changes = getattr(entry, "_changes", None)
+    return (
+        entry.id,
+        guild_id,
+        entry.action.value,
+        entry.user_id,
+        entry._target_id,
+        entry.reason,
+        json.dumps(changes, separators=(",", ":")) if changes else None,
+    )
+
+
+class AuditLogStore:
+    """Per-bot SQLite copy of guild audit logs.
+
+    ``sync`` pages a guild's full history once (Discord keeps 45 days), newest first,
+    checkpointing the oldest stored ID so an interrupted sync resumes. Later syncs only
+    page forward from the newest synced ID, and ``on_audit_log_entry_create`` adds new
+    entries as they happen. Queries filter on indexed columns and never call the API.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._locks: dict[int, asyncio.Lock] = {}
+        # Guilds synced since start-up; the gateway event keeps them current from then on.
+        self._live: set[int] = set()
+        logger.info("audit_log_store_opened", path=str(path))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add_entry(self, entry: discord.AuditLogEntry) -> None:
+        with self._conn:
+            self._conn.execute(_UPSERT, _entry_row(entry.guild.id, entry))
+
+    def _add_entries(self, guild_id: int, entries: Iterable[discord.AuditLogEntry]) -> None:
+        self._conn.executemany(_UPSERT, [_entry_row(guild_id, entry) for entry in entries])
+
+    def state(self, guild_id: int) -> Optional[dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT oldest_id, newest_id, complete, synced_at FROM audit_log_state "
+            "WHERE guild_id = ?",
+            (guild_id,),
+        ).fetchone()
+        if not row:
+            return None
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM audit_log WHERE guild_id = ?", (guild_id,)
+        ).fetchone()[0]
+        return {
+            "oldest_id": row[0],
+            "newest_id": row[1],
+            "complete": bool(row[2]),
+            "synced_at": row[3],
+            "entry_count": count,
+        }
+
+    def is_live(self, guild_id: int) -> bool:
+        return guild_id in self._live
+
+    def _checkpoint(self, guild_id: int, **fields: Any) -> None:
+        self._conn.execute(
+            "INSERT INTO audit_log_state (guild_id) VALUES (?) ON CONFLICT DO NOTHING",
+            (guild_id,),
+        )
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._conn.execute(
+            f"UPDATE audit_log_state SET {assignments} WHERE guild_id = ?",
+            (*fields.values(), guild_id),
+        )
+
+    async def sync(
+        self,
+        guild: discord.Guild,
+        progress: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> int:
+        """Page entries not stored yet; the number fetched.
+
+        Fetches backwards until the history is exhausted, then forwards from the newest
+        synced entry to cover any time the bot was offline.
+        """
+        lock = self._locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            state = self.state(guild.id) or {
+                "oldest_id": None,
+                "newest_id": None,
+                "complete": False,
+            }
+            started = discord.utils.time_snowflake(discord.utils.utcnow())
+            fetched = 0
+
+            async def store(batch: list[discord.AuditLogEntry], **checkpoint: Any) -> None:
+                nonlocal fetched
+                with self._conn:
+                    self._add_entries(guild.id, batch)
+                    self._checkpoint(guild.id, **checkpoint)
+                fetched += len(batch)
+                if progress:
+                    await progress(fetched)
+
+            newest = state["newest_id"]
+            if not state["complete"]:
+                oldest = state["oldest_id"]
+                batch: list[discord.AuditLogEntry] = []
+                async for entry in guild.audit_logs(
+                    limit=None, before=discord.Object(id=oldest) if oldest else None
+                ):
+                    newest = max(newest or 0, entry.id)
+                    batch.append(entry)
+                    if len(batch) >= _SYNC_BATCH:
+                        await store(batch, oldest_id=batch[-1].id, newest_id=newest)
+                        batch = []
+                if batch:
+                    await store(batch, oldest_id=batch[-1].id, newest_id=newest)
+                # An empty history still needs a starting point for forward catch-up.
+                newest = newest or started
+                with self._conn:
+                    self._checkpoint(guild.id, newest_id=newest, complete=1)
+
+            batch = []
+            async for entry in guild.audit_logs(
+                limit=None, after=discord.Object(id=newest), oldest_first=True
+            ):
+                batch.append(entry)
+                if len(batch) >= _SYNC_BATCH:
+                    await store(batch, newest_id=batch[-1].id)
+                    batch = []
+            if batch:
+                await store(batch, newest_id=batch[-1].id)
+
+            with self._conn:
+                self._checkpoint(guild.id, synced_at=time.time())
+            self._live.add(guild.id)
+            logger.info("audit_log_synced", guild_id=guild.id, fetched=fetched)
+            return fetched
+
+    def query(
+        self,
+        guild_id: int,
+        action: Optional[int] = None,
+        user_id: Optional[int] = None,
+        target_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Entries newest first; entry IDs are snowflakes, so time bounds are ID bounds."""
+        clauses = ["guild_id = ?"]
+        params: list[Any] = [guild_id]
+        for column, value in (("action", action), ("user_id", user_id), ("target_id", target_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(after_id)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        params.append(limit)
+
+        rows = self._conn.execute(
+            f"""
+            SELECT id, action, user_id, target_id, reason, changes FROM audit_log
+            WHERE {" AND ".join(clauses)}
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+        return [
+            {
+                "id": row[0],
+                "action": row[1],
+                "user_id": row[2],
+                "target_id": row[3],
+                "reason": row[4],
+                "changes": _change_dicts(json.loads(row[5])) if row[5] else [],
+            }
+            for row in rows
+        ]
+
+    def remove_guild(self, guild_id: int) -> None:
+        self._live.discard(guild_id)
+
+    def clear(self) -> None:
+        # A new gateway session may have missed entries; the next query catches up.
+        self._live.clear()
@@ -0,0 +1,108 @@
+import asyncio
+import bisect
+import time
+from typing import Optional
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _GuildBans:
+    def __init__(self):
+        # user ID -> (username, reason), plus the IDs sorted for cursor pagination.
+        self.bans: dict[int, tuple[str, Optional[str]]] = {}
+        self.ids: list[int] = []
+        self.loaded_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+        # Gateway events seen while a load is paging, replayed once it finishes.
+        self.pending: Optional[list[tuple[bool, discord.abc.User]]] = None
+
+
+class BanCache:
+    """Per-guild ban lists, read once over REST and kept current from ban/unban events.
+
+    The REST endpoint pages in ascending user ID order with ``after`` cursors, 1000 bans
+    per request. Once loaded, ``on_member_ban`` and ``on_member_unban`` keep the list
+    exact, so later reads never touch the API.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildBans] = {}
+
+    def _state(self, guild_id: int) -> _GuildBans:
+        state = self._guilds.get(guild_id)
+        if state is None:
+            state = _GuildBans()
+            self._guilds[guild_id] = state
+        return state
+
+    def loaded_at(self, guild_id: int) -> Optional[float]:
+        state = self._guilds.get(guild_id)
+        return state.loaded_at if state else None
+
+    async def load(
+        self, guild: discord.Guild, refresh: bool = False
+    ) -> dict[int, tuple[str, Optional[str]]]:
+        state = self._state(guild.id)
+        async with state.lock:
+            if state.loaded_at is not None and not refresh:
+                return state.bans
+
+            state.pending = []
+            bans: dict[int, tuple[str, Optional[str]]] = {}
+            try:
+                async for entry in guild.bans(limit=None):
+                    bans[entry.user.id] = (entry.user.name, entry.reason)
+            except BaseException:
+                state.pending = None
+                raise
+
+            for banned, user in state.pending:
+                if banned:
+                    bans.setdefault(user.id, (user.name, None))
+                else:
+                    bans.pop(user.id, None)
+            state.pending = None
+            state.bans = bans
+            state.ids = sorted(bans)
+            state.loaded_at = time.time()
+            logger.info("ban_list_loaded", guild_id=guild.id, ban_count=len(bans))
+            return state.bans
+
+    def page(
+        self, guild_id: int, after: int = 0, limit: int = 100
+    ) -> tuple[list[tuple[int, str, Optional[str]]], bool]:
+        """Bans with user IDs above ``after`` from a loaded list, and whether more follow."""
+        state = self._state(guild_id)
+        start = bisect.bisect_right(state.ids, after)
+        rows = [(user_id, *state.bans[user_id]) for user_id in state.ids[start : start + limit]]
+        return rows, start + limit < len(state.ids)
+
+    def member_banned(self, guild: discord.Guild, user: discord.abc.User) -> None:
+        state = self._guilds.get(guild.id)
+        if state is None:
+            return
+        if state.pending is not None:
+            state.pending.append((True, user))
+        if state.loaded_at is not None and user.id not in state.bans:
+            # Event payloads carry no reason; a refresh picks it up.
+            state.bans[user.id] = (user.name, None)
+            bisect.insort(state.ids, user.id)
+
+    def member_unbanned(self, guild: discord.Guild, user: discord.abc.User) -> None:
+        state = self._guilds.get(guild.id)
+        if state is None:
+            return
+        if state.pending is not None:
+            state.pending.append((False, user))
+        if state.bans.pop(user.id, None) is not None:
+            del state.ids[bisect.bisect_left(state.ids, user.id)]
+
+    def remove_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
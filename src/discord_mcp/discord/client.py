@@ -1,16 +1,31 @@
 import asyncio
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Coroutine
+from pathlib import Path
 from typing import Any, Optional
 
 import discord
 from discord.ext import commands
 
 from discord_mcp.config import settings
+from discord_mcp.discord.audit_log_store import AuditLogStore
+from discord_mcp.discord.ban_cache import BanCache
 from discord_mcp.discord.exceptions import DiscordAPIException
+from discord_mcp.discord.member_index import MemberNameIndex, member_names
+from discord_mcp.discord.member_snapshot import MemberSnapshotCache
+from discord_mcp.discord.permission_cache import PermissionCache
+from discord_mcp.discord.raid_detector import RaidDetector
+from discord_mcp.discord.scheduler import ActionScheduler, execute_action
+from discord_mcp.discord.search_index import MessageSearchIndex
+from discord_mcp.discord.timeout_index import TimeoutIndex
+from discord_mcp.utils.concurrency import gather_limited
 from discord_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Suspicious joins during a raid are collected this long so bans go out as one bulk request.
+RAID_RESPONSE_DELAY = 1.0
+
 
 class DiscordBotClient(commands.Bot):
     def __init__(
@@ -44,6 +59,18 @@ class DiscordBotClient(commands.Bot):
         self._ready_event = asyncio.Event()
         self._ready = False
         self._current_activity = None
+        self.search_index: Optional[MessageSearchIndex] = None
+        self.audit_log_store: Optional[AuditLogStore] = None
+        self.permission_cache = PermissionCache()
+        self.member_index = MemberNameIndex()
+        self.member_snapshots = MemberSnapshotCache()
+        self.raid_detector = RaidDetector()
+        self.ban_cache = BanCache()
+        self.timeout_index = TimeoutIndex()
+        self.scheduler: Optional[ActionScheduler] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._raid_targets: dict[int, list[int]] = {}
+        self._raid_tasks: set[asyncio.Task] = set()
 
     async def set_activity(
         self, activity_type: str = "playing", name: str = None, status: str = "online"
@@ -87,6 +114,25 @@ class DiscordBotClient(commands.Bot):
         logger.info("bot_activity_cleared")
 
     async def on_ready(self):
+        if settings.search.message_index_enabled and self.search_index is None:
+            index_path = Path(settings.storage.data_dir) / "search" / f"{self.user.id}.sqlite3"
+            self.search_index = MessageSearchIndex(index_path)
+
+        if self.scheduler is None:
+            scheduler_path = (
+                Path(settings.storage.data_dir) / "scheduler" / f"{self.user.id}.sqlite3"
+            )
+            self.scheduler = ActionScheduler(scheduler_path)
+            self._scheduler_task = asyncio.create_task(self._run_scheduler())
+
+        if self.audit_log_store is None:
+            audit_log_path = (
+                Path(settings.storage.data_dir) / "audit_log" / f"{self.user.id}.sqlite3"
+            )
+            self.audit_log_store = AuditLogStore(audit_log_path)
+        else:
+            self.audit_log_store.clear()
+
         self._ready = True
         self._ready_event.set()
         logger.info("bot_ready", session_id=self.session_id, user=str(self.user))
@@ -103,7 +149,37 @@ class DiscordBotClient(commands.Bot):
                 }
             )
 
+    async def _run_scheduler(self) -> None:
+        while self.scheduler is not None:
+            try:
+                rows = self.scheduler.due(time.time())
+                if rows:
+                    await gather_limited(rows, self._run_scheduled_action)
+            except Exception as e:
+                logger.error("scheduler_tick_failed", error=str(e))
+            await asyncio.sleep(1)
+
+    async def _run_scheduled_action(self, row: dict[str, Any]) -> None:
+        try:
+            error = await execute_action(self, row)
+        except Exception as e:
+            # Record it, or the action stays pending until the next restart retries it.
+            error = str(e) or type(e).__name__
+        if self.scheduler is None:
+            return
+        self.scheduler.finish(row["id"], error)
+        logger.info(
+            "scheduled_action_executed",
+            action_id=row["id"],
+            action=row["action"],
+            guild_id=row["guild_id"],
+            error=error,
+        )
+
     async def on_message(self, message: discord.Message):
+        if self.search_index:
+            self.search_index.add_message(message)
+
         if self.event_callback and not message.author.bot:
             self.event_callback(
                 {
@@ -124,7 +200,28 @@ class DiscordBotClient(commands.Bot):
                 }
             )
 
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        if self.search_index and "content" in payload.data:
+            self.search_index.update_content(payload.message_id, payload.data["content"])
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if self.search_index:
+            self.search_index.remove_message(payload.message_id)
+
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        if self.search_index:
+            for message_id in payload.message_ids:
+                self.search_index.remove_message(message_id)
+
     async def on_member_join(self, member: discord.Member):
+        self.permission_cache.member_changed(member)
+        self.member_index.member_changed(member)
+        self.member_snapshots.member_changed(member)
+        # Timeouts persist across leaving and rejoining.
+        self.timeout_index.member_changed(member)
+        if settings.raid.detection_enabled:
+            self._check_raid(member)
+
         if self.event_callback:
             self.event_callback(
                 {
@@ -140,7 +237,84 @@ class DiscordBotClient(commands.Bot):
                 }
             )
 
+    def _check_raid(self, member: discord.Member) -> None:
+        detected = self.raid_detector.record_join(member)
+        if detected is None:
+            return
+        started, targets = detected
+        guild = member.guild
+        policy = self.raid_detector.policy(guild.id)
+
+        if started:
+            if self.event_callback:
+                status = self.raid_detector.status(guild.id)
+                self.event_callback(
+                    {
+                        "type": "raid_detected",
+                        "session_id": self.session_id,
+                        "guild_id": str(guild.id),
+                        "window": status["window"],
+                        "response": policy.response,
+                    }
+                )
+            if policy.raise_verification:
+                self._spawn_raid_task(self._raise_verification(guild))
+
+        if policy.response == "alert" or not targets:
+            return
+        if guild.id not in self._raid_targets:
+            self._spawn_raid_task(self._respond_to_raid(guild))
+        self._raid_targets.setdefault(guild.id, []).extend(targets)
+
+    def _spawn_raid_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        # The event loop only keeps weak references to tasks.
+        task = asyncio.create_task(coro)
+        self._raid_tasks.add(task)
+        task.add_done_callback(self._raid_tasks.discard)
+
+    async def _raise_verification(self, guild: discord.Guild) -> None:
+        if guild.verification_level >= discord.VerificationLevel.high:
+            return
+        try:
+            await guild.edit(
+                verification_level=discord.VerificationLevel.high,
+                reason="Raid detected",
+            )
+            logger.warning("raid_verification_raised", guild_id=guild.id)
+        except discord.HTTPException as e:
+            logger.error("raid_verification_failed", guild_id=guild.id, error=str(e))
+
+    async def _respond_to_raid(self, guild: discord.Guild) -> None:
+        from discord_mcp.tools.moderation import moderate_members
+
+        await asyncio.sleep(RAID_RESPONSE_DELAY)
+        targets = self._raid_targets.pop(guild.id, [])
+        policy = self.raid_detector.policy(guild.id)
+        try:
+            results = await moderate_members(
+                guild,
+                targets,
+                policy.response,
+                reason="Raid response",
+                duration_seconds=policy.timeout_seconds,
+            )
+        except Exception as e:
+            logger.error("raid_response_failed", guild_id=guild.id, error=str(e))
+            return
+        logger.warning(
+            "raid_response_applied",
+            guild_id=guild.id,
+            action=policy.response,
+            target_count=len(targets),
+            failed=sum(1 for result in results.values() if result["status"] == "failed"),
+        )
+
     async def on_member_remove(self, member: discord.Member):
+        self.permission_cache.member_changed(member)
+        self.member_index.member_changed(member)
+        self.member_snapshots.member_changed(member)
+        self.timeout_index.member_removed(member)
+
         if self.event_callback:
             self.event_callback(
                 {
@@ -155,7 +329,25 @@ class DiscordBotClient(commands.Bot):
                 }
             )
 
+    async def on_audit_log_entry_create(self, entry: discord.AuditLogEntry):
+        if self.audit_log_store:
+            self.audit_log_store.add_entry(entry)
+
+    async def on_member_ban(self, guild: discord.Guild, user: discord.User | discord.Member):
+        self.ban_cache.member_banned(guild, user)
+
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User):
+        self.ban_cache.member_unbanned(guild, user)
+
     async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before._roles != after._roles or before.is_timed_out() != after.is_timed_out():
+            self.permission_cache.member_changed(after)
+        if member_names(before) != member_names(after):
+            self.member_index.member_changed(after)
+        self.member_snapshots.member_changed(after)
+        if before.timed_out_until != after.timed_out_until:
+            self.timeout_index.member_changed(after)
+
         if self.event_callback:
             changes = {}
             if before.display_name != after.display_name:
@@ -177,9 +369,29 @@ class DiscordBotClient(commands.Bot):
                     }
                 )
 
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # Username and global name changes arrive once per user, not per guild.
+        renamed = before.name != after.name or before.global_name != after.global_name
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member is None:
+                continue
+            if renamed:
+                self.member_index.member_changed(member)
+            # Avatar changes move members in and out of the default-avatar bitmap.
+            self.member_snapshots.member_changed(member)
+
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.permission_cache.invalidate_guild(channel.guild.id)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.permission_cache.invalidate_guild(channel.guild.id)
+
     async def on_guild_channel_update(
         self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
     ):
+        self.permission_cache.channel_changed(before, after)
+
         if self.event_callback:
             changes = {}
             if before.name != after.name:
@@ -205,7 +417,17 @@ class DiscordBotClient(commands.Bot):
                     }
                 )
 
-    async def on_role_update(self, before: discord.Role, after: discord.Role):
+    async def on_guild_role_create(self, role: discord.Role):
+        self.permission_cache.role_changed(role)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.permission_cache.role_changed(role)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.permission_cache.role_changed(
+            after, permissions_changed=before.permissions != after.permissions
+        )
+
         if self.event_callback:
             changes = {}
             if before.name != after.name:
@@ -228,6 +450,19 @@ class DiscordBotClient(commands.Bot):
                     }
                 )
 
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        self.permission_cache.guild_changed(before, after)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.permission_cache.remove_guild(guild.id)
+        self.member_index.remove_guild(guild.id)
+        self.member_snapshots.remove_guild(guild.id)
+        self.raid_detector.remove_guild(guild.id)
+        self.ban_cache.remove_guild(guild.id)
+        self.timeout_index.remove_guild(guild.id)
+        if self.audit_log_store:
+            self.audit_log_store.remove_guild(guild.id)
+
     async def setup_hook(self):
         logger.info("setting_up_bot", session_id=self.session_id)
 
@@ -253,3 +488,24 @@ class DiscordBotClient(commands.Bot):
         logger.info("closing_session", session_id=self.session_id)
         if self.is_ready:
             await self.close()
+        if self.search_index:
+            self.search_index.close()
+            self.search_index = None
+        if self._scheduler_task:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+        if self.scheduler:
+            self.scheduler.close()
+            self.scheduler = None
+        if self.audit_log_store:
+            self.audit_log_store.close()
+            self.audit_log_store = None
+        self.permission_cache.clear()
+        self.member_index.clear()
+        self.member_snapshots.clear()
+        self.raid_detector.clear()
+        self.ban_cache.clear()
+        self.timeout_index.clear()
+        for task in list(self._raid_tasks):
+            task.cancel()
+        self._raid_targets.clear()
@@ -0,0 +1,178 @@
+import bisect
+import math
+from typing import Any
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fuzzy matches sharing fewer trigrams than this fraction of the union are dropped.
+MIN_FUZZY_SCORE = 0.3
+
+
+def member_names(member: discord.Member) -> tuple[str, ...]:
+    """Casefolded username, global name and nickname, without duplicates."""
+    names: list[str] = []
+    for name in (member.name, member.global_name, member.nick):
+        if name:
+            folded = name.casefold()
+            if folded not in names:
+                names.append(folded)
+    return tuple(names)
+
+
+def trigrams(name: str) -> set[str]:
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _GuildNames:
+    def __init__(self, guild: discord.Guild):
+        self.names: dict[int, tuple[str, ...]] = {}
+        # Sorted (name, member_id) pairs; a prefix query is a bisect plus a short scan.
+        self.sorted: list[tuple[str, int]] = []
+        self.grams: dict[str, set[int]] = {}
+        entries = []
+        for member in guild.members:
+            names = member_names(member)
+            self.names[member.id] = names
+            for name in names:
+                entries.append((name, member.id))
+                for gram in trigrams(name):
+                    self.grams.setdefault(gram, set()).add(member.id)
+        entries.sort()
+        self.sorted = entries
+
+    def _unlink(self, member_id: int, names: tuple[str, ...]) -> None:
+        for name in names:
+            position = bisect.bisect_left(self.sorted, (name, member_id))
+            if position < len(self.sorted) and self.sorted[position] == (name, member_id):
+                del self.sorted[position]
+        grams = set().union(*(trigrams(name) for name in names)) if names else set()
+        for gram in grams:
+            posting = self.grams.get(gram)
+            if posting is not None:
+                posting.discard(member_id)
+                if not posting:
+                    del self.grams[gram]
+
+    def add(self, member: discord.Member) -> None:
+        names = member_names(member)
+        previous = self.names.get(member.id)
+        if previous == names:
+            return
+        if previous is not None:
+            self._unlink(member.id, previous)
+        self.names[member.id] = names
+        for name in names:
+            bisect.insort(self.sorted, (name, member.id))
+            for gram in trigrams(name):
+                self.grams.setdefault(gram, set()).add(member.id)
+
+    def remove(self, member_id: int) -> None:
+        names = self.names.pop(member_id, None)
+        if names is not None:
+            self._unlink(member_id, names)
+
+    def prefix(self, query: str, limit: int) -> dict[int, str]:
+        matches: dict[int, str] = {}
+        position = bisect.bisect_left(self.sorted, (query, 0))
+        while position < len(self.sorted) and len(matches) < limit:
+            name, member_id = self.sorted[position]
+            if not name.startswith(query):
+                break
+            matches.setdefault(member_id, name)
+            position += 1
+        return matches
+
+    def fuzzy(self, query: str, limit: int, exclude: dict[int, str]) -> list[tuple[float, int]]:
+        query_grams = trigrams(query)
+        # A name scoring MIN_FUZZY_SCORE shares at least ``needed`` query trigrams, so it
+        # must appear in one of the rarest ``len - needed + 1``; only those are scanned.
+        needed = max(1, math.ceil(MIN_FUZZY_SCORE * len(query_grams)))
+        postings = sorted((self.grams.get(gram, set()) for gram in query_grams), key=len)
+        candidates: set[int] = set().union(*postings[: len(postings) - needed + 1])
+        scored = []
+        for member_id in candidates:
+            if member_id in exclude:
+                continue
+            best = 0.0
+            for name in self.names[member_id]:
+                name_grams = trigrams(name)
+                shared = len(query_grams & name_grams)
+                best = max(best, shared / (len(query_grams) + len(name_grams) - shared))
+            if best >= MIN_FUZZY_SCORE:
+                scored.append((best, member_id))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored[:limit]
+
+
+class MemberNameIndex:
+    """Per-guild name index over the member cache, for prefix and fuzzy member lookup.
+
+    Prefix queries bisect a sorted array of casefolded names; fuzzy queries score
+    members by the share of trigrams their closest name has in common with the query.
+    Gateway member events keep it current without rescanning the guild.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildNames] = {}
+
+    def _entry(self, guild: discord.Guild) -> _GuildNames:
+        entry = self._guilds.get(guild.id)
+        # Member chunking fills the cache without per-member events; rebuild if it grew.
+        if entry is None or len(entry.names) != len(guild._members):
+            entry = _GuildNames(guild)
+            self._guilds[guild.id] = entry
+            logger.debug("member_name_index_built", guild_id=guild.id, members=len(entry.names))
+        return entry
+
+    def search(
+        self, guild: discord.Guild, query: str, limit: int = 25, fuzzy: bool = True
+    ) -> list[dict[str, Any]]:
+        query = query.casefold().strip()
+        entry = self._entry(guild)
+        prefix = entry.prefix(query, limit)
+        hits: list[dict[str, Any]] = [
+            {
+                "member_id": member_id,
+                "matched_name": name,
+                "match": "exact" if name == query else "prefix",
+                "score": 1.0 if name == query else round(len(query) / len(name), 3),
+            }
+            for member_id, name in prefix.items()
+        ]
+        hits.sort(key=lambda hit: (-hit["score"], hit["member_id"]))
+
+        if fuzzy and len(hits) < limit and len(query) >= 2:
+            for score, member_id in entry.fuzzy(query, limit - len(hits), prefix):
+                hits.append(
+                    {
+                        "member_id": member_id,
+                        "matched_name": max(
+                            entry.names[member_id],
+                            key=lambda name: len(trigrams(query) & trigrams(name)),
+                        ),
+                        "match": "fuzzy",
+                        "score": round(score, 3),
+                    }
+                )
+        return hits
+
+    def member_changed(self, member: discord.Member) -> None:
+        """Handle a member joining, leaving, or changing username, global name or nickname."""
+        entry = self._guilds.get(member.guild.id)
+        if entry is None:
+            return
+        if member.guild.get_member(member.id) is None:
+            entry.remove(member.id)
+        else:
+            entry.add(member)
+
+    def remove_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
@@ -0,0 +1,122 @@
+import bisect
+import time
+from array import array
+from collections.abc import Iterable
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# A snapshot older than this is rebuilt on the next query once a member event marks it stale.
+MAX_SNAPSHOT_AGE = 60.0
+
+
+def _bitmap(indices: Iterable[int], size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for index in indices:
+        bits[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _bits(mask: int) -> str:
+    """Binary digits of ``mask`` least significant first, so ``_bits(mask)[i]`` is bit ``i``."""
+    return bin(mask)[:1:-1]
+
+
+class MemberSnapshot:
+    """Columnar copy of a guild's cached members for aggregate queries.
+
+    Members are stored in join order, so a join-time range is a contiguous index range.
+    Flags and role membership are bitmaps over those indices held as Python ints, so
+    counts and intersections are ``&`` and ``int.bit_count`` rather than per-member loops.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        members = sorted(
+            guild.members,
+            key=lambda m: (m.joined_at.timestamp() if m.joined_at else 0.0, m.id),
+        )
+        size = len(members)
+        self.guild_id = guild.id
+        self.built_at = time.time()
+        self.size = size
+        self.all = (1 << size) - 1
+        self.ids = array("Q", (m.id for m in members))
+        self.joined = array("d", (m.joined_at.timestamp() if m.joined_at else 0.0 for m in members))
+        self.created = array("d", (m.created_at.timestamp() for m in members))
+        self.created_sorted = array("d", sorted(self.created))
+
+        self.bots = _bitmap((i for i, m in enumerate(members) if m.bot), size)
+        self.pending = _bitmap((i for i, m in enumerate(members) if m.pending), size)
+        self.boosting = _bitmap((i for i, m in enumerate(members) if m.premium_since), size)
+        self.default_avatar = _bitmap((i for i, m in enumerate(members) if m.avatar is None), size)
+        self.timeouts = {
+            i: m.timed_out_until.timestamp() for i, m in enumerate(members) if m.timed_out_until
+        }
+
+        holders: dict[int, list[int]] = {}
+        for i, member in enumerate(members):
+            for role_id in member._roles:
+                holders.setdefault(role_id, []).append(i)
+        self.roles = {role_id: _bitmap(indices, size) for role_id, indices in holders.items()}
+        self.any_role = 0
+        for bitmap in self.roles.values():
+            self.any_role |= bitmap
+
+    def join_range(self, start: float, end: float) -> int:
+        """Bitmap of members who joined in ``[start, end)``."""
+        low = bisect.bisect_left(self.joined, start)
+        high = bisect.bisect_left(self.joined, end)
+        return ((1 << (high - low)) - 1) << low
+
+    def created_since(self, since: float, mask: int) -> int:
+        if mask == self.all:
+            return self.size - bisect.bisect_left(self.created_sorted, since)
+        bits = _bits(mask)
+        created = self.created
+        return sum(1 for i, bit in enumerate(bits) if bit == "1" and created[i] >= since)
+
+    def timed_out(self, now: float, mask: int) -> int:
+        bits = _bits(mask)
+        return sum(
+            1
+            for i, until in self.timeouts.items()
+            if until > now and i < len(bits) and bits[i] == "1"
+        )
+
+
+class MemberSnapshotCache:
+    """Per-guild ``MemberSnapshot`` instances, rebuilt lazily after member events."""
+
+    def __init__(self):
+        self._snapshots: dict[int, MemberSnapshot] = {}
+        self._stale: set[int] = set()
+
+    def get(self, guild: discord.Guild) -> MemberSnapshot:
+        snapshot = self._snapshots.get(guild.id)
+        # Chunking grows the cache without member events, so a size mismatch without a
+        # pending event means the snapshot predates a chunk and is rebuilt at once.
+        if (
+            snapshot is None
+            or (snapshot.size != len(guild._members) and guild.id not in self._stale)
+            or (guild.id in self._stale and time.time() - snapshot.built_at > MAX_SNAPSHOT_AGE)
+        ):
+            snapshot = MemberSnapshot(guild)
+            self._snapshots[guild.id] = snapshot
+            self._stale.discard(guild.id)
+            logger.debug("member_snapshot_built", guild_id=guild.id, members=snapshot.size)
+        return snapshot
+
+    def member_changed(self, member: discord.Member) -> None:
+        if member.guild.id in self._snapshots:
+            self._stale.add(member.guild.id)
+
+    def remove_guild(self, guild_id: int) -> None:
+        self._snapshots.pop(guild_id, None)
+        self._stale.discard(guild_id)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._stale.clear()
@@ -0,0 +1,260 @@
+from collections.abc import Collection
+from typing import Optional
+
+import discord
+
+from discord_mcp.discord.permission_engine import (
+    GuildPermissionTable,
+    Overwrite,
+    channel_sort_key,
+    member_role_ids,
+    split_overwrites,
+)
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Cached rows per guild before the oldest entries are dropped.
+MAX_CACHED_TARGETS = 5000
+
+
+class _MemberRow:
+    __slots__ = ("role_ids", "timed_out", "row")
+
+    def __init__(self, role_ids: frozenset[int], timed_out: bool, row: list[int]):
+        self.role_ids = role_ids
+        self.timed_out = timed_out
+        self.row = row
+
+
+class _GuildEntry:
+    def __init__(self, table: GuildPermissionTable):
+        self.table = table
+        self.roles: dict[int, list[int]] = {}
+        self.members: dict[int, _MemberRow] = {}
+
+    def trim(self) -> None:
+        # Dicts keep insertion order, so the first keys are the oldest entries.
+        for rows in (self.roles, self.members):
+            while len(rows) > MAX_CACHED_TARGETS:
+                del rows[next(iter(rows))]
+
+
+class RoleMemberIndex:
+    """Reverse index of role ID -> IDs of cached members holding that role."""
+
+    def __init__(self, guild: discord.Guild):
+        self.members: dict[int, set[int]] = {}
+        self.member_roles: dict[int, frozenset[int]] = {}
+        for member in guild.members:
+            self.add_member(member)
+
+    def add_member(self, member: discord.Member) -> None:
+        role_ids = frozenset(member_role_ids(member))
+        previous = self.member_roles.get(member.id, frozenset())
+        for role_id in previous - role_ids:
+            self.members.get(role_id, set()).discard(member.id)
+        for role_id in role_ids - previous:
+            self.members.setdefault(role_id, set()).add(member.id)
+        self.member_roles[member.id] = role_ids
+
+    def remove_member(self, member_id: int) -> None:
+        for role_id in self.member_roles.pop(member_id, frozenset()):
+            self.members.get(role_id, set()).discard(member_id)
+
+    def remove_role(self, role_id: int) -> None:
+        for member_id in self.members.pop(role_id, set()):
+            self.member_roles[member_id] = self.member_roles[member_id] - {role_id}
+
+    def members_of(self, role_id: int) -> set[int]:
+        return self.members.get(role_id, set())
+
+
+def _changed_keys(before: dict[int, Overwrite], after: dict[int, Overwrite]) -> set[int]:
+    return {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+
+
+class PermissionCache:
+    """Per-guild cache of resolved permission rows, kept current from gateway events.
+
+    A row holds one target's permission bitmask for every channel of the guild's
+    ``GuildPermissionTable``, so ``(target, channel)`` lookups are two dict hits. Events
+    evict only the rows they can affect: a role's permission change drops that role and
+    the members holding it, an overwrite change drops the targets named in the changed
+    overwrites, and a member's role or timeout change drops that member.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildEntry] = {}
+        # Kept apart from the guild entries so table rebuilds do not rescan members.
+        self._role_members: dict[int, RoleMemberIndex] = {}
+
+    def _entry(self, guild: discord.Guild) -> _GuildEntry:
+        entry = self._guilds.get(guild.id)
+        if entry is None:
+            entry = _GuildEntry(GuildPermissionTable.from_guild(guild))
+            self._guilds[guild.id] = entry
+        return entry
+
+    def table(self, guild: discord.Guild) -> GuildPermissionTable:
+        return self._entry(guild).table
+
+    def role_members(self, guild: discord.Guild) -> RoleMemberIndex:
+        index = self._role_members.get(guild.id)
+        # Member chunking fills the cache without per-member events; rebuild if it grew.
+        if index is None or len(index.member_roles) != len(guild._members):
+            index = RoleMemberIndex(guild)
+            self._role_members[guild.id] = index
+        return index
+
+    def resolve_role(self, guild: discord.Guild, role_id: int) -> list[int]:
+        entry = self._entry(guild)
+        row = entry.roles.get(role_id)
+        if row is None:
+            row = entry.table.resolve_role(role_id)
+            entry.roles[role_id] = row
+            entry.trim()
+        return row
+
+    def resolve_members(
+        self, guild: discord.Guild, members: Collection[discord.Member]
+    ) -> list[list[int]]:
+        entry = self._entry(guild)
+        rows: list[Optional[list[int]]] = []
+        missing: list[discord.Member] = []
+        missing_slots: list[int] = []
+        for member in members:
+            cached = entry.members.get(member.id)
+            # Timeouts expire without a gateway event, so the flag is rechecked here.
+            if cached is not None and cached.timed_out == member.is_timed_out():
+                rows.append(cached.row)
+            else:
+                missing_slots.append(len(rows))
+                missing.append(member)
+                rows.append(None)
+
+        if missing:
+            for slot, member, row in zip(
+                missing_slots, missing, entry.table.resolve_members(missing)
+            ):
+                entry.members[member.id] = _MemberRow(
+                    frozenset(member_role_ids(member)), member.is_timed_out(), row
+                )
+                rows[slot] = row
+            entry.trim()
+        return rows  # type: ignore[return-value]
+
+    def resolve(
+        self, guild: discord.Guild, target: discord.Role | discord.Member
+    ) -> list[int]:
+        """Permission bitmask of ``target`` in each channel of ``table(guild).channels``."""
+        if isinstance(target, discord.Role):
+            return self.resolve_role(guild, target.id)
+        return self.resolve_members(guild, [target])[0]
+
+    def channel_permissions(
+        self,
+        guild: discord.Guild,
+        target: discord.Role | discord.Member,
+        channel: discord.abc.GuildChannel,
+    ) -> int:
+        index = self.table(guild).channel_index.get(channel.id)
+        if index is None:
+            return channel.permissions_for(target).value
+        return self.resolve(guild, target)[index]
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        if self._guilds.pop(guild_id, None):
+            logger.debug("permission_cache_guild_invalidated", guild_id=guild_id)
+
+    def remove_guild(self, guild_id: int) -> None:
+        self.invalidate_guild(guild_id)
+        self._role_members.pop(guild_id, None)
+
+    def _evict_roles(self, entry: _GuildEntry, role_ids: set[int]) -> None:
+        if entry.table.guild_id in role_ids:
+            entry.roles.clear()
+            entry.members.clear()
+            return
+        for role_id in role_ids:
+            entry.roles.pop(role_id, None)
+        stale = [
+            member_id
+            for member_id, cached in entry.members.items()
+            if not cached.role_ids.isdisjoint(role_ids)
+        ]
+        for member_id in stale:
+            del entry.members[member_id]
+
+    def role_changed(self, role: discord.Role, permissions_changed: bool = True) -> None:
+        """Handle a role being created, updated or deleted."""
+        deleted = role.guild.get_role(role.id) is None
+        index = self._role_members.get(role.guild.id)
+        if deleted and index is not None:
+            index.remove_role(role.id)
+
+        entry = self._guilds.get(role.guild.id)
+        if entry is None or not permissions_changed:
+            return
+        if deleted:
+            entry.table.role_permissions.pop(role.id, None)
+        else:
+            entry.table.role_permissions[role.id] = role.permissions.value
+        self._evict_roles(entry, {role.id})
+
+    def member_changed(self, member: discord.Member) -> None:
+        """Handle a member joining, leaving, or changing roles or timeout."""
+        entry = self._guilds.get(member.guild.id)
+        if entry is not None:
+            entry.members.pop(member.id, None)
+        index = self._role_members.get(member.guild.id)
+        if index is not None:
+            if member.guild.get_member(member.id) is None:
+                index.remove_member(member.id)
+            else:
+                index.add_member(member)
+
+    def channel_changed(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        entry = self._guilds.get(after.guild.id)
+        if entry is None:
+            return
+        if channel_sort_key(before) != channel_sort_key(after):
+            # Display order is baked into the table's channel list.
+            self.invalidate_guild(after.guild.id)
+            return
+
+        table = entry.table
+        index = table.channel_index.get(after.id)
+        if index is None:
+            self.invalidate_guild(after.guild.id)
+            return
+        everyone, roles, members = split_overwrites(table.guild_id, after)
+        if (everyone, roles, members) == (
+            table.everyone_overwrites[index],
+            table.role_overwrites[index],
+            table.member_overwrites[index],
+        ):
+            table.channels[index] = after
+            return
+
+        everyone_changed = everyone != table.everyone_overwrites[index]
+        changed_roles = _changed_keys(table.role_overwrites[index], roles)
+        changed_members = _changed_keys(table.member_overwrites[index], members)
+        table.replace_channel(after)
+
+        if everyone_changed:
+            self._evict_roles(entry, {table.guild_id})
+            return
+        self._evict_roles(entry, changed_roles)
+        for member_id in changed_members:
+            entry.members.pop(member_id, None)
+
+    def guild_changed(self, before: discord.Guild, after: discord.Guild) -> None:
+        if before.owner_id != after.owner_id:
+            self.invalidate_guild(after.id)
+
+    def clear(self) -> None:
+        self._guilds.clear()
+        self._role_members.clear()
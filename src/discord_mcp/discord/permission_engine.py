@@ -0,0 +1,372 @@
+from collections.abc import Collection
+from typing import Optional
+
+import discord
+
+PERMISSION_FLAGS: list[tuple[str, int]] = [
+    (name, getattr(discord.Permissions, name).flag) for name, _ in discord.Permissions.none()
+]
+
+ALL_PERMISSIONS = discord.Permissions.all().value
+ALL_CHANNEL_PERMISSIONS = discord.Permissions.all_channel().value
+VOICE_PERMISSIONS = discord.Permissions.voice().value
+
+ADMINISTRATOR = discord.Permissions.administrator.flag
+VIEW_CHANNEL = discord.Permissions.view_channel.flag
+SEND_MESSAGES = discord.Permissions.send_messages.flag
+CONNECT = discord.Permissions.connect.flag
+READ_MESSAGE_HISTORY = discord.Permissions.read_message_history.flag
+MANAGE_CHANNELS = discord.Permissions.manage_channels.flag
+MANAGE_ROLES = discord.Permissions.manage_roles.flag
+
+# Permissions that require send_messages in the same channel.
+_SEND_DEPENDENT = (
+    discord.Permissions.send_tts_messages.flag
+    | discord.Permissions.mention_everyone.flag
+    | discord.Permissions.embed_links.flag
+    | discord.Permissions.attach_files.flag
+)
+# Timed out members keep only these.
+_TIMEOUT_KEEP = VIEW_CHANNEL | READ_MESSAGE_HISTORY
+_VOICE_LOCKED = VOICE_PERMISSIONS | MANAGE_CHANNELS | MANAGE_ROLES
+
+KIND_PLAIN = 0
+KIND_TEXT = 1
+KIND_VOICE = 2
+
+_ROLE_OVERWRITE = 0
+_MEMBER_OVERWRITE = 1
+
+Overwrite = tuple[int, int]
+
+
+def channel_sort_key(channel: discord.abc.GuildChannel) -> tuple[int, int, int, int]:
+    category = getattr(channel, "category", None)
+    category_position = category.position if category else -1
+    category_id = category.id if category else 0
+    return (category_position, category_id, channel.position, channel.id)
+
+
+def member_role_ids(member: discord.Member) -> Collection[int]:
+    """Role IDs of a member without building the sorted ``Member.roles`` list."""
+    return member._roles
+
+
+def _channel_kind(channel: discord.abc.GuildChannel) -> int:
+    if isinstance(channel, discord.channel.VocalGuildChannel):
+        return KIND_VOICE
+    if isinstance(channel, (discord.TextChannel, discord.ForumChannel)):
+        return KIND_TEXT
+    return KIND_PLAIN
+
+
+def apply_channel_kind(value: int, kind: int) -> int:
+    """Apply the implicit permission rules discord.py applies per channel type."""
+    if kind == KIND_PLAIN:
+        return value
+    if not value & SEND_MESSAGES:
+        value &= ~_SEND_DEPENDENT
+    if not value & VIEW_CHANNEL:
+        value &= ~ALL_CHANNEL_PERMISSIONS
+    if kind == KIND_TEXT:
+        return value & ~VOICE_PERMISSIONS
+    if not value & CONNECT:
+        value &= ~_VOICE_LOCKED
+    return value
+
+
+def split_overwrites(
+    guild_id: int, channel: discord.abc.GuildChannel
+) -> tuple[Overwrite, dict[int, Overwrite], dict[int, Overwrite]]:
+    """A channel's overwrites as (@everyone, {role ID: ...}, {member ID: ...}) pairs."""
+    everyone: Overwrite = (0, 0)
+    roles: dict[int, Overwrite] = {}
+    members: dict[int, Overwrite] = {}
+    # The raw overwrite list is what permissions_for reads; it avoids building a
+    # PermissionOverwrite object per entry.
+    for overwrite in channel._overwrites:
+        if overwrite.type == _MEMBER_OVERWRITE:
+            members[overwrite.id] = (overwrite.allow, overwrite.deny)
+        elif overwrite.id == guild_id:
+            everyone = (overwrite.allow, overwrite.deny)
+        else:
+            roles[overwrite.id] = (overwrite.allow, overwrite.deny)
+    return everyone, roles, members
+
+
+class GuildPermissionTable:
+    """Integer snapshot of a guild's role permissions and channel overwrites.
+
+    Channels are stored once in display order as parallel lists, so resolving a target
+    across the whole guild is a single pass of bitwise operations instead of one
+    ``permissions_for`` call (and one ``discord.Permissions`` object) per channel. The
+    results match ``GuildChannel.permissions_for``.
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        owner_id: Optional[int],
+        role_permissions: dict[int, int],
+        channels: list[discord.abc.GuildChannel],
+        kinds: list[int],
+        everyone_overwrites: list[Overwrite],
+        role_overwrites: list[dict[int, Overwrite]],
+        member_overwrites: list[dict[int, Overwrite]],
+    ):
+        self.guild_id = guild_id
+        self.owner_id = owner_id
+        self.role_permissions = role_permissions
+        self.channels = channels
+        self.kinds = kinds
+        self.everyone_overwrites = everyone_overwrites
+        self.role_overwrites = role_overwrites
+        self.member_overwrites = member_overwrites
+        self.channel_index = {channel.id: i for i, channel in enumerate(channels)}
+        self._index_member_overwrites()
+
+    @classmethod
+    def from_guild(cls, guild: discord.Guild) -> "GuildPermissionTable":
+        channels = sorted(guild.channels, key=channel_sort_key)
+        kinds: list[int] = []
+        everyone_overwrites: list[Overwrite] = []
+        role_overwrites: list[dict[int, Overwrite]] = []
+        member_overwrites: list[dict[int, Overwrite]] = []
+
+        for channel in channels:
+            kinds.append(_channel_kind(channel))
+            everyone, roles, members = split_overwrites(guild.id, channel)
+            everyone_overwrites.append(everyone)
+            role_overwrites.append(roles)
+            member_overwrites.append(members)
+
+        return cls(
+            guild_id=guild.id,
+            owner_id=guild.owner_id,
+            role_permissions={role.id: role.permissions.value for role in guild.roles},
+            channels=channels,
+            kinds=kinds,
+            everyone_overwrites=everyone_overwrites,
+            role_overwrites=role_overwrites,
+            member_overwrites=member_overwrites,
+        )
+
+    def _index_member_overwrites(self) -> None:
+        # member ID -> [(channel index, allow, deny)], so a member's personal overwrites
+        # can be applied without scanning every channel.
+        self.member_overwrite_index: dict[int, list[tuple[int, int, int]]] = {}
+        for index, members in enumerate(self.member_overwrites):
+            for member_id, (allow, deny) in members.items():
+                self.member_overwrite_index.setdefault(member_id, []).append(
+                    (index, allow, deny)
+                )
+
+    def replace_channel(self, channel: discord.abc.GuildChannel) -> bool:
+        """Swap in a channel's current overwrites. Returns False if it is not in the table."""
+        index = self.channel_index.get(channel.id)
+        if index is None:
+            return False
+        everyone, roles, members = split_overwrites(self.guild_id, channel)
+        self.channels[index] = channel
+        self.everyone_overwrites[index] = everyone
+        self.role_overwrites[index] = roles
+        if members != self.member_overwrites[index]:
+            self.member_overwrites[index] = members
+            self._index_member_overwrites()
+        return True
+
+    def copy(self) -> "GuildPermissionTable":
+        """Independent copy for what-if edits; channel objects themselves are shared."""
+        return GuildPermissionTable(
+            guild_id=self.guild_id,
+            owner_id=self.owner_id,
+            role_permissions=dict(self.role_permissions),
+            channels=list(self.channels),
+            kinds=list(self.kinds),
+            everyone_overwrites=list(self.everyone_overwrites),
+            role_overwrites=[dict(roles) for roles in self.role_overwrites],
+            member_overwrites=[dict(members) for members in self.member_overwrites],
+        )
+
+    def set_overwrite(
+        self,
+        index: int,
+        target_id: int,
+        is_member: bool,
+        overwrite: Optional[Overwrite],
+    ) -> None:
+        """Set or (with ``None``) remove one overwrite of the channel at ``index``."""
+        if not is_member and target_id == self.guild_id:
+            self.everyone_overwrites[index] = overwrite or (0, 0)
+            return
+        overwrites = (self.member_overwrites if is_member else self.role_overwrites)[index]
+        if overwrite is None:
+            overwrites.pop(target_id, None)
+        else:
+            overwrites[target_id] = overwrite
+        if is_member:
+            self._index_member_overwrites()
+
+    @property
+    def everyone_permissions(self) -> int:
+        return self.role_permissions.get(self.guild_id, 0)
+
+    def base_permissions(self, role_ids: Collection[int]) -> int:
+        value = self.everyone_permissions
+        for role_id in role_ids:
+            value |= self.role_permissions.get(role_id, 0)
+        return value
+
+    def baseline_permissions(self, target: discord.Role | discord.Member) -> int:
+        """Guild-level permissions of a target (with @everyone), before any overwrite.
+
+        A timed-out member is masked the same way ``resolve_member`` masks each channel.
+        """
+        if isinstance(target, discord.Role):
+            base = self.base_permissions((target.id,))
+            return ALL_PERMISSIONS if base & ADMINISTRATOR else base
+        base = self.base_permissions(member_role_ids(target))
+        if target.id == self.owner_id or base & ADMINISTRATOR:
+            return ALL_PERMISSIONS
+        return base & _TIMEOUT_KEEP if target.is_timed_out() else base
+
+    def resolve_role(self, role_id: int) -> list[int]:
+        """Effective permissions of a role (with @everyone) in every channel."""
+        base = self.base_permissions((role_id,))
+        if base & ADMINISTRATOR:
+            return [apply_channel_kind(ALL_PERMISSIONS, kind) for kind in self.kinds]
+
+        is_default = role_id == self.guild_id
+        results = []
+        channels = zip(self.everyone_overwrites, self.role_overwrites, self.kinds)
+        for everyone, roles, kind in channels:
+            value = (base & ~everyone[1]) | everyone[0]
+            if not is_default:
+                overwrite = roles.get(role_id)
+                if overwrite:
+                    value = (value & ~overwrite[1]) | overwrite[0]
+            results.append(apply_channel_kind(value, kind))
+        return results
+
+    def _role_set_row(self, base: int, role_ids: Collection[int]) -> list[int]:
+        """Permissions after @everyone and role overwrites, before member rules."""
+        role_set = role_ids if isinstance(role_ids, (set, frozenset)) else set(role_ids)
+        role_list = [role_id for role_id in role_set if role_id != self.guild_id]
+        role_count = len(role_list)
+        results = []
+        for everyone, roles in zip(self.everyone_overwrites, self.role_overwrites):
+            value = (base & ~everyone[1]) | everyone[0]
+            if roles and role_list:
+                allow = deny = 0
+                # Walk whichever side is smaller: the member's roles or the overwrites.
+                if role_count < len(roles):
+                    for role_id in role_list:
+                        overwrite = roles.get(role_id)
+                        if overwrite:
+                            allow |= overwrite[0]
+                            deny |= overwrite[1]
+                else:
+                    for role_id, overwrite in roles.items():
+                        if role_id in role_set:
+                            allow |= overwrite[0]
+                            deny |= overwrite[1]
+                value = (value & ~deny) | allow
+            results.append(value)
+        return results
+
+    def _finish_member_row(
+        self, member_id: int, row: list[int], timed_out: bool
+    ) -> list[int]:
+        overwrites = self.member_overwrite_index.get(member_id)
+        if overwrites:
+            row = list(row)
+            for index, allow, deny in overwrites:
+                row[index] = (row[index] & ~deny) | allow
+        if timed_out:
+            row = [value & _TIMEOUT_KEEP for value in row]
+        return [apply_channel_kind(value, kind) for value, kind in zip(row, self.kinds)]
+
+    def resolve_member(
+        self,
+        member_id: int,
+        role_ids: Collection[int],
+        timed_out: bool = False,
+    ) -> list[int]:
+        """Effective permissions of a member with the given roles in every channel."""
+        base = self.base_permissions(role_ids)
+        if member_id == self.owner_id or base & ADMINISTRATOR:
+            return [apply_channel_kind(ALL_PERMISSIONS, kind) for kind in self.kinds]
+        return self._finish_member_row(
+            member_id, self._role_set_row(base, role_ids), timed_out
+        )
+
+    def resolve_channel(
+        self,
+        index: int,
+        member_id: Optional[int],
+        role_ids: Collection[int],
+        timed_out: bool = False,
+    ) -> int:
+        """Effective permissions in the channel at ``index`` only."""
+        base = self.base_permissions(role_ids)
+        if member_id == self.owner_id or base & ADMINISTRATOR:
+            return apply_channel_kind(ALL_PERMISSIONS, self.kinds[index])
+        everyone = self.everyone_overwrites[index]
+        value = (base & ~everyone[1]) | everyone[0]
+        roles = self.role_overwrites[index]
+        if roles:
+            allow = deny = 0
+            for role_id in role_ids:
+                overwrite = roles.get(role_id)
+                if overwrite:
+                    allow |= overwrite[0]
+                    deny |= overwrite[1]
+            value = (value & ~deny) | allow
+        if member_id is not None:
+            overwrite = self.member_overwrites[index].get(member_id)
+            if overwrite:
+                value = (value & ~overwrite[1]) | overwrite[0]
+        if timed_out:
+            value &= _TIMEOUT_KEEP
+        return apply_channel_kind(value, self.kinds[index])
+
+    def resolve_target(self, target: discord.Role | discord.Member) -> list[int]:
+        if isinstance(target, discord.Role):
+            return self.resolve_role(target.id)
+        return self.resolve_member(
+            target.id,
+            set(member_role_ids(target)),
+            timed_out=target.is_timed_out(),
+        )
+
+    def resolve_members(self, members: Collection[discord.Member]) -> list[list[int]]:
+        """Resolve many members, computing each distinct role combination only once.
+
+        Members sharing a role set share the role-overwrite pass; personal overwrites
+        and timeouts are then applied per member from the overwrite index.
+        """
+        raw_rows: dict[frozenset[int], list[int]] = {}
+        final_rows: dict[frozenset[int], list[int]] = {}
+        results = []
+        for member in members:
+            role_ids = frozenset(member_role_ids(member))
+            timed_out = member.is_timed_out()
+            plain = not timed_out and member.id not in self.member_overwrite_index
+            if plain and role_ids in final_rows:
+                results.append(final_rows[role_ids])
+                continue
+
+            base = self.base_permissions(role_ids)
+            if member.id == self.owner_id or base & ADMINISTRATOR:
+                results.append(self.resolve_member(member.id, role_ids))
+                continue
+
+            raw = raw_rows.get(role_ids)
+            if raw is None:
+                raw = self._role_set_row(base, role_ids)
+                raw_rows[role_ids] = raw
+            row = self._finish_member_row(member.id, raw, timed_out)
+            if plain:
+                final_rows[role_ids] = row
+            results.append(row)
+        return results
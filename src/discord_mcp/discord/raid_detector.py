@@ -0,0 +1,190 @@
+import re
+import time
+from collections import Counter, deque
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.models.moderation import RaidPolicy
+from discord_mcp.utils.logging import get_logger
+from discord_mcp.utils.storage import data_path, read_json, write_json
+
+logger = get_logger(__name__)
+
+# Raids kept per guild for get_raid_status.
+MAX_RAID_HISTORY = 20
+# Member IDs recorded per raid; the counts stay exact past this.
+MAX_RAID_MEMBERS = 1000
+
+_SKELETON_STRIP = re.compile(r"[\W\d_]+")
+
+
+def name_skeleton(name: str) -> Optional[str]:
+    """Name with case, digits and punctuation removed, so ``Spam_Bot42`` and ``spambot7`` match."""
+    skeleton = _SKELETON_STRIP.sub("", name.casefold())
+    return skeleton if len(skeleton) >= 3 else None
+
+
+class _Join:
+    __slots__ = ("member_id", "joined", "new_account", "default_avatar", "skeleton")
+
+    def __init__(
+        self,
+        member_id: int,
+        joined: float,
+        new_account: bool,
+        default_avatar: bool,
+        skeleton: Optional[str],
+    ):
+        self.member_id = member_id
+        self.joined = joined
+        self.new_account = new_account
+        self.default_avatar = default_avatar
+        self.skeleton = skeleton
+
+
+class _GuildJoins:
+    def __init__(self, policy: RaidPolicy):
+        self.policy = policy
+        self.joins: deque[_Join] = deque()
+        self.skeletons: Counter[str] = Counter()
+        self.new_accounts = 0
+        self.default_avatars = 0
+        self.raid: Optional[dict[str, Any]] = None
+        self.history: deque[dict[str, Any]] = deque(maxlen=MAX_RAID_HISTORY)
+
+    def expire(self, now: float) -> None:
+        cutoff = now - self.policy.window_seconds
+        while self.joins and self.joins[0].joined < cutoff:
+            join = self.joins.popleft()
+            self.new_accounts -= join.new_account
+            self.default_avatars -= join.default_avatar
+            if join.skeleton:
+                self.skeletons[join.skeleton] -= 1
+                if not self.skeletons[join.skeleton]:
+                    del self.skeletons[join.skeleton]
+        if self.raid is not None and len(self.joins) < self.policy.join_threshold:
+            self.raid["ended_at"] = now
+            self.raid = None
+
+    def suspicious(self, join: _Join) -> bool:
+        # Any two signals: a fresh account, the default avatar, or a name shared by a cluster.
+        clustered = (
+            join.skeleton is not None
+            and self.skeletons[join.skeleton] >= self.policy.cluster_min_size
+        )
+        return join.new_account + join.default_avatar + clustered >= 2
+
+
+class RaidDetector:
+    """Sliding-window join-rate detector, fed from ``on_member_join``.
+
+    Each guild keeps the joins inside its policy window in a deque, with running counts of
+    new accounts, default avatars and name skeletons, so recording a join is amortized
+    O(1). A raid starts when the window holds ``join_threshold`` joins and ends when it
+    drops below that again.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildJoins] = {}
+
+    def _state(self, guild_id: int) -> _GuildJoins:
+        state = self._guilds.get(guild_id)
+        if state is None:
+            stored = read_json(data_path("raid_policies", f"{guild_id}.json"))
+            state = _GuildJoins(RaidPolicy(**stored) if stored else RaidPolicy())
+            self._guilds[guild_id] = state
+        return state
+
+    def policy(self, guild_id: int) -> RaidPolicy:
+        return self._state(guild_id).policy
+
+    def set_policy(self, guild_id: int, policy: RaidPolicy) -> None:
+        state = self._state(guild_id)
+        state.policy = policy
+        write_json(data_path("raid_policies", f"{guild_id}.json"), policy.model_dump())
+        state.expire(time.time())
+
+    def record_join(
+        self, member: discord.Member, now: Optional[float] = None
+    ) -> Optional[tuple[bool, list[int]]]:
+        """Record a join; while a raid is active, return ``(started, suspicious member IDs)``.
+
+        ``started`` is true for the join that opened the raid, in which case the IDs cover
+        every suspicious join in the window; afterwards they hold only the new member.
+        """
+        state = self._state(member.guild.id)
+        policy = state.policy
+        if not policy.enabled:
+            return None
+
+        now = time.time() if now is None else now
+        state.expire(now)
+        age = now - member.created_at.timestamp()
+        join = _Join(
+            member.id,
+            now,
+            age < policy.new_account_days * 86400,
+            member.avatar is None,
+            name_skeleton(member.name),
+        )
+        state.joins.append(join)
+        state.new_accounts += join.new_account
+        state.default_avatars += join.default_avatar
+        if join.skeleton:
+            state.skeletons[join.skeleton] += 1
+
+        if state.raid is None:
+            if len(state.joins) < policy.join_threshold:
+                return None
+            state.raid = {
+                "started_at": now,
+                "ended_at": None,
+                "join_count": len(state.joins),
+                "suspicious_count": 0,
+                "member_ids": [j.member_id for j in state.joins][:MAX_RAID_MEMBERS],
+            }
+            state.history.append(state.raid)
+            targets = [j.member_id for j in state.joins if state.suspicious(j)]
+            state.raid["suspicious_count"] = len(targets)
+            logger.warning(
+                "raid_detected",
+                guild_id=member.guild.id,
+                join_count=len(state.joins),
+                suspicious_count=len(targets),
+            )
+            return True, targets
+
+        state.raid["join_count"] += 1
+        if len(state.raid["member_ids"]) < MAX_RAID_MEMBERS:
+            state.raid["member_ids"].append(member.id)
+        if state.suspicious(join):
+            state.raid["suspicious_count"] += 1
+            return False, [member.id]
+        return False, []
+
+    def status(self, guild_id: int, now: Optional[float] = None) -> dict[str, Any]:
+        state = self._state(guild_id)
+        state.expire(time.time() if now is None else now)
+        clusters = [
+            {"skeleton": skeleton, "count": count}
+            for skeleton, count in state.skeletons.most_common(10)
+            if count >= state.policy.cluster_min_size
+        ]
+        return {
+            "policy": state.policy.model_dump(),
+            "window": {
+                "join_count": len(state.joins),
+                "new_account_count": state.new_accounts,
+                "default_avatar_count": state.default_avatars,
+                "name_clusters": clusters,
+            },
+            "raid_active": state.raid is not None,
+            "raids": list(reversed(state.history)),
+        }
+
+    def remove_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
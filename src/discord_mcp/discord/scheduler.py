@@ -0,0 +1,280 @@
+import math
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCHEDULED_ACTIONS = ("unban", "remove_role", "delete_message")
+
+# Actions due within this many seconds are held in the timer wheel; later ones stay on
+# disk until a refill brings them into range, so memory does not grow with the backlog.
+LOAD_HORIZON = 6 * 60 * 60
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_LEVELS = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_actions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    due_at REAL NOT NULL,
+    user_id INTEGER,
+    role_id INTEGER,
+    channel_id INTEGER,
+    message_id INTEGER,
+    reason TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at REAL NOT NULL,
+    executed_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS scheduled_actions_pending
+    ON scheduled_actions (status, due_at);
+CREATE INDEX IF NOT EXISTS scheduled_actions_guild
+    ON scheduled_actions (guild_id, status, id);
+"""
+
+_COLUMNS = (
+    "id, guild_id, action, due_at, user_id, role_id, channel_id, message_id, reason, "
+    "status, created_at, executed_at, error"
+)
+
+
+class TimerWheel:
+    """Hierarchical timing wheel with one-second ticks.
+
+    Four levels of 64 slots cover 2**24 seconds. An entry goes to the lowest level whose
+    enclosing window it shares with the current tick, so inserting is O(1). When the
+    current tick enters a slot of a higher level, that slot's entries cascade down.
+    Entries beyond the top level wait in an overflow list.
+    """
+
+    def __init__(self, now: int):
+        self.current = now
+        self.levels: list[list[list[tuple[int, int]]]] = [
+            [[] for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+        self.overflow: list[tuple[int, int]] = []
+        self.ready: list[int] = []
+        self.size = 0
+
+    def insert(self, due: int, item: int) -> None:
+        self.size += 1
+        self._place(due, item)
+
+    def _place(self, due: int, item: int) -> None:
+        if due <= self.current:
+            self.ready.append(item)
+            return
+        for level in range(_LEVELS):
+            shift = _SLOT_BITS * (level + 1)
+            if due >> shift == self.current >> shift:
+                slot = (due >> (_SLOT_BITS * level)) & (_SLOTS - 1)
+                self.levels[level][slot].append((due, item))
+                return
+        self.overflow.append((due, item))
+
+    def advance(self, now: int) -> list[int]:
+        """Move to tick ``now`` and return the items that became due, in due order."""
+        due, self.ready = self.ready, []
+        while self.current < now:
+            self.current += 1
+            if self.current & ((1 << (_SLOT_BITS * _LEVELS)) - 1) == 0:
+                entries, self.overflow = self.overflow, []
+                for entry in entries:
+                    self._place(*entry)
+            # Cascade from the top so entries can fall through several levels this tick.
+            for level in range(_LEVELS - 1, 0, -1):
+                if self.current & ((1 << (_SLOT_BITS * level)) - 1) == 0:
+                    slot = (self.current >> (_SLOT_BITS * level)) & (_SLOTS - 1)
+                    entries, self.levels[level][slot] = self.levels[level][slot], []
+                    for entry in entries:
+                        self._place(*entry)
+            slot = self.current & (_SLOTS - 1)
+            entries, self.levels[0][slot] = self.levels[0][slot], []
+            due.extend(item for _, item in entries)
+            due.extend(self.ready)
+            self.ready = []
+        self.size -= len(due)
+        return due
+
+
+class ActionScheduler:
+    """Deferred moderation actions persisted in SQLite and timed by a ``TimerWheel``.
+
+    Rows are the source of truth, so pending actions survive restarts. Overdue actions
+    run on the first tick after start-up.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._wheel = TimerWheel(int(time.time()))
+        self._loaded_until = -math.inf
+        self._refill(time.time())
+        logger.info("action_scheduler_opened", path=str(path), loaded=self._wheel.size)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _refill(self, now: float) -> None:
+        until = now + LOAD_HORIZON
+        rows = self._conn.execute(
+            """
+            SELECT id, due_at FROM scheduled_actions
+            WHERE status = 'pending' AND due_at > ? AND due_at <= ?
+            """,
+            (self._loaded_until, until),
+        ).fetchall()
+        for action_id, due_at in rows:
+            self._wheel.insert(math.ceil(due_at), action_id)
+        self._loaded_until = until
+
+    def schedule(
+        self,
+        guild_id: int,
+        action: str,
+        due_at: float,
+        user_id: Optional[int] = None,
+        role_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        message_id: Optional[int] = None,
+        reason: Optional[str] = None,
+    ) -> int:
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO scheduled_actions
+                    (guild_id, action, due_at, user_id, role_id, channel_id, message_id,
+                     reason, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    guild_id,
+                    action,
+                    due_at,
+                    user_id,
+                    role_id,
+                    channel_id,
+                    message_id,
+                    reason,
+                    time.time(),
+                ),
+            )
+        action_id = cursor.lastrowid
+        if due_at <= self._loaded_until:
+            self._wheel.insert(math.ceil(due_at), action_id)
+        return action_id
+
+    def cancel(self, action_id: int) -> bool:
+        # The wheel entry stays; it is skipped at execution because the row is no longer
+        # pending.
+        with self._conn:
+            cursor = self._conn.execute(
+                "UPDATE scheduled_actions SET status = 'cancelled' "
+                "WHERE id = ? AND status = 'pending'",
+                (action_id,),
+            )
+        return cursor.rowcount > 0
+
+    def get(self, action_id: int) -> Optional[dict[str, Any]]:
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM scheduled_actions WHERE id = ?", (action_id,)
+        ).fetchone()
+        return _row_dict(row) if row else None
+
+    def list_actions(
+        self,
+        guild_id: int,
+        status: Optional[str] = "pending",
+        after_id: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        clauses = ["guild_id = ?", "id > ?"]
+        params: list[Any] = [guild_id, after_id]
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        params.append(limit)
+        rows = self._conn.execute(
+            f"""
+            SELECT {_COLUMNS} FROM scheduled_actions
+            WHERE {" AND ".join(clauses)}
+            ORDER BY id
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+        return [_row_dict(row) for row in rows]
+
+    def pending_count(self, guild_id: int) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM scheduled_actions WHERE guild_id = ? AND status = 'pending'",
+            (guild_id,),
+        ).fetchone()[0]
+
+    def due(self, now: float) -> list[dict[str, Any]]:
+        """Pending actions that came due since the last call."""
+        if now + LOAD_HORIZON / 2 > self._loaded_until:
+            self._refill(now)
+        rows = []
+        for action_id in self._wheel.advance(int(now)):
+            row = self.get(action_id)
+            if row and row["status"] == "pending":
+                rows.append(row)
+        return rows
+
+    def finish(self, action_id: int, error: Optional[str] = None) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE scheduled_actions SET status = ?, executed_at = ?, error = ? "
+                "WHERE id = ?",
+                ("failed" if error else "done", time.time(), error, action_id),
+            )
+
+
+def _row_dict(row: tuple[Any, ...]) -> dict[str, Any]:
+    return dict(zip([name.strip() for name in _COLUMNS.split(",")], row))
+
+
+async def execute_action(client: discord.Client, row: dict[str, Any]) -> Optional[str]:
+    """Run one scheduled action; the error message if it failed."""
+    guild = client.get_guild(row["guild_id"])
+    if guild is None:
+        return "Guild not available"
+    reason = row["reason"]
+    try:
+        if row["action"] == "unban":
+            await guild.unban(discord.Object(id=row["user_id"]), reason=reason)
+        elif row["action"] == "remove_role":
+            # Goes by ID so members missing from the cache are handled too.
+            await guild._state.http.remove_role(
+                guild.id, row["user_id"], row["role_id"], reason=reason
+            )
+        elif row["action"] == "delete_message":
+            channel = guild.get_channel_or_thread(row["channel_id"])
+            if channel is None:
+                return "Channel not found"
+            if not isinstance(channel, discord.abc.Messageable):
+                return "Channel does not contain messages"
+            await channel.get_partial_message(row["message_id"]).delete()
+        else:
+            return f"Unknown action {row['action']}"
+    except discord.NotFound:
+        # Already unbanned, role or message already gone: the desired state holds.
+        return None
+    except discord.HTTPException as e:
+        return str(e)
+    return None
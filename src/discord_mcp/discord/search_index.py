@@ -0,0 +1,209 @@
+import sqlite3
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER,
+    channel_id INTEGER NOT NULL,
+    author_id INTEGER NOT NULL,
+    author_name TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_scope
+    ON messages (guild_id, channel_id, created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+    USING fts5(content, content='messages', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE OF content ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TABLE IF NOT EXISTS channel_state (
+    channel_id INTEGER PRIMARY KEY,
+    guild_id INTEGER,
+    oldest_id INTEGER,
+    newest_id INTEGER
+);
+"""
+
+_UPSERT = """
+INSERT INTO messages (id, guild_id, channel_id, author_id, author_name, created_at, content)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET content = excluded.content
+"""
+
+
+def _message_row(message: discord.Message) -> tuple[Any, ...]:
+    return (
+        message.id,
+        message.guild.id if message.guild else None,
+        message.channel.id,
+        message.author.id,
+        message.author.name,
+        message.created_at.timestamp(),
+        message.content,
+    )
+
+
+def _match_expression(query: str) -> str:
+    """Quote each query term so user input never reaches FTS5 query syntax."""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class MessageSearchIndex:
+    """On-disk full-text index of message content, backed by SQLite FTS5.
+
+    Fed incrementally from gateway message events and from explicit history backfills;
+    queries never touch the Discord API.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        logger.info("message_search_index_opened", path=str(path))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add_message(self, message: discord.Message) -> None:
+        if not message.content:
+            return
+        # Only backfills move the channel watermarks, so oldest_id..newest_id stays a
+        # contiguous backfilled range; a live message must not hide history posted while
+        # the bot was offline from the next "newer" backfill.
+        with self._conn:
+            self._conn.execute(_UPSERT, _message_row(message))
+
+    def add_messages(self, messages: Iterable[discord.Message]) -> int:
+        rows = [_message_row(m) for m in messages if m.content]
+        if not rows:
+            return 0
+        with self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def remove_message(self, message_id: int) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM messages WHERE id = ?", (message_id,))
+
+    def update_content(self, message_id: int, content: str) -> None:
+        with self._conn:
+            if content:
+                self._conn.execute(
+                    "UPDATE messages SET content = ? WHERE id = ?", (content, message_id)
+                )
+            else:
+                self._conn.execute("DELETE FROM messages WHERE id = ?", (message_id,))
+
+    def record_backfill(
+        self, channel_id: int, guild: Optional[discord.Guild], message_ids: list[int]
+    ) -> None:
+        if not message_ids:
+            return
+        with self._conn:
+            self._update_channel_state(channel_id, guild, message_ids)
+
+    def _update_channel_state(
+        self, channel_id: int, guild: Optional[discord.Guild], message_ids: list[int]
+    ) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO channel_state (channel_id, guild_id, oldest_id, newest_id)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (channel_id) DO UPDATE SET
+                oldest_id = MIN(oldest_id, excluded.oldest_id),
+                newest_id = MAX(newest_id, excluded.newest_id)
+            """,
+            (channel_id, guild.id if guild else None, min(message_ids), max(message_ids)),
+        )
+
+    def channel_state(self, channel_id: int) -> Optional[dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT oldest_id, newest_id FROM channel_state WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()
+        if not row:
+            return None
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM messages WHERE channel_id = ?", (channel_id,)
+        ).fetchone()[0]
+        return {"oldest_id": row[0], "newest_id": row[1], "indexed_count": count}
+
+    def search(
+        self,
+        query: str,
+        guild_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        author_id: Optional[int] = None,
+        after: Optional[float] = None,
+        before: Optional[float] = None,
+        limit: int = 25,
+    ) -> list[dict[str, Any]]:
+        clauses = ["messages_fts MATCH ?"]
+        params: list[Any] = [_match_expression(query)]
+        if guild_id is not None:
+            clauses.append("m.guild_id = ?")
+            params.append(guild_id)
+        if channel_id is not None:
+            clauses.append("m.channel_id = ?")
+            params.append(channel_id)
+        if author_id is not None:
+            clauses.append("m.author_id = ?")
+            params.append(author_id)
+        if after is not None:
+            clauses.append("m.created_at >= ?")
+            params.append(after)
+        if before is not None:
+            clauses.append("m.created_at < ?")
+            params.append(before)
+        params.append(limit)
+
+        rows = self._conn.execute(
+            f"""
+            SELECT m.id, m.guild_id, m.channel_id, m.author_id, m.author_name, m.created_at,
+                   snippet(messages_fts, 0, '**', '**', '...', 24), bm25(messages_fts)
+            FROM messages_fts
+            JOIN messages AS m ON m.id = messages_fts.rowid
+            WHERE {" AND ".join(clauses)}
+            ORDER BY bm25(messages_fts)
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+
+        return [
+            {
+                "id": str(row[0]),
+                "guild_id": str(row[1]) if row[1] else None,
+                "channel_id": str(row[2]),
+                "author_id": str(row[3]),
+                "author_name": row[4],
+                "timestamp": datetime.fromtimestamp(row[5], tz=UTC).isoformat(),
+                "snippet": row[6],
+                "score": round(-row[7], 4),
+            }
+            for row in rows
+        ]
@@ -35,6 +35,8 @@ class DiscordSession:
         self.task: Optional[asyncio.Task] = None
         self.created_at = time.time()
         self.last_activity = time.time()
+        self.message_templates: dict[str, Any] = {}
+        self.permission_plans: dict[str, dict[str, Any]] = {}
 
     async def start(self) -> None:
         logger.info(
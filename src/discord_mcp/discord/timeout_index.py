@@ -0,0 +1,100 @@
+import heapq
+import time
+from typing import Optional
+
+import discord
+
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _GuildTimeouts:
+    def __init__(self, complete: bool):
+        # Min-heap of (expiry, version, member ID). ``live`` maps each timed-out member to
+        # the version of its current entry; any other entry is stale, even if its expiry
+        # matches again later, and is dropped when it reaches the top or on compaction.
+        self.heap: list[tuple[float, int, int]] = []
+        self.live: dict[int, int] = {}
+        self.version = 0
+        # Whether the build saw the full member list; a later chunk triggers a rebuild.
+        self.complete = complete
+
+    def push(self, member_id: int, expiry: float) -> None:
+        self.version += 1
+        self.live[member_id] = self.version
+        heapq.heappush(self.heap, (expiry, self.version, member_id))
+
+    def is_live(self, entry: tuple[float, int, int]) -> bool:
+        return self.live.get(entry[2]) == entry[1]
+
+
+class TimeoutIndex:
+    """Per-guild min-heaps of member timeout expiries.
+
+    A guild's heap is built from one scan of the member cache on first use and then kept
+    current from ``on_member_update``, ``on_member_join`` and ``on_member_remove``, so a
+    query only touches the members currently timed out. Timeouts lapse without a gateway
+    event; expired entries are popped off the top as queries pass them.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildTimeouts] = {}
+
+    def _state(self, guild: discord.Guild) -> _GuildTimeouts:
+        state = self._guilds.get(guild.id)
+        if state is None or (guild.chunked and not state.complete):
+            state = _GuildTimeouts(guild.chunked)
+            now = time.time()
+            for member in guild.members:
+                until = member.timed_out_until
+                if until is not None and until.timestamp() > now:
+                    state.push(member.id, until.timestamp())
+            self._guilds[guild.id] = state
+            logger.info("timeout_index_built", guild_id=guild.id, timed_out=len(state.live))
+        return state
+
+    def timed_out(
+        self, guild: discord.Guild, now: Optional[float] = None
+    ) -> list[tuple[int, float]]:
+        """``(member ID, expiry timestamp)`` for every timed-out member, soonest expiry first."""
+        state = self._state(guild)
+        now = time.time() if now is None else now
+        while state.heap and (state.heap[0][0] <= now or not state.is_live(state.heap[0])):
+            entry = heapq.heappop(state.heap)
+            if state.is_live(entry):
+                del state.live[entry[2]]
+        if len(state.heap) > 2 * len(state.live):
+            state.heap = [entry for entry in state.heap if state.is_live(entry)]
+            heapq.heapify(state.heap)
+        return [
+            (member_id, expiry)
+            for expiry, version, member_id in sorted(state.heap)
+            if state.live.get(member_id) == version
+        ]
+
+    def is_complete(self, guild_id: int) -> bool:
+        state = self._guilds.get(guild_id)
+        return state is not None and state.complete
+
+    def member_changed(self, member: discord.Member) -> None:
+        state = self._guilds.get(member.guild.id)
+        if state is None:
+            return
+        until = member.timed_out_until
+        expiry = until.timestamp() if until is not None else None
+        if expiry is None or expiry <= time.time():
+            state.live.pop(member.id, None)
+        else:
+            state.push(member.id, expiry)
+
+    def member_removed(self, member: discord.Member) -> None:
+        state = self._guilds.get(member.guild.id)
+        if state is not None:
+            state.live.pop(member.id, None)
+
+    def remove_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
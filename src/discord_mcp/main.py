@@ -1,18 +1,24 @@
 from typing import Any
 
 import uvicorn
+from fastmcp import Context
 
 from discord_mcp.config import settings
 from discord_mcp.discord.session import session_manager
 from discord_mcp.mcp.context import get_current_session
 from discord_mcp.mcp.server import mcp
 from discord_mcp.tools import (
+    apply_permission_plan as apply_permission_plan_impl,
     add_reaction,
     add_thread_member,
     assign_role,
+    backfill_message_index,
     ban_user,
+    bulk_update_member_roles,
     bulk_delete_messages,
+    cancel_scheduled_action as cancel_scheduled_action_impl,
     clear_reactions,
+    configure_raid_detection as configure_raid_detection_impl,
     create_automod_rule,
     create_channel,
     create_emoji,
@@ -28,10 +34,13 @@ from discord_mcp.tools import (
     delete_emoji,
     delete_invite,
     delete_message,
+    delete_message_template as delete_message_template_impl,
     delete_role,
     delete_scheduled_event,
     delete_thread,
     delete_webhook,
+    diff_permission_snapshots as diff_permission_snapshots_impl,
+    discard_permission_plan as discard_permission_plan_impl,
     edit_automod_rule,
     edit_channel,
     edit_guild_settings,
@@ -42,6 +51,7 @@ from discord_mcp.tools import (
     edit_thread,
     end_poll,
     enforce_role_policy,
+    export_guild_bans as export_guild_bans_impl,
     get_audit_log,
     get_category_permissions,
     get_channel,
@@ -51,8 +61,10 @@ from discord_mcp.tools import (
     get_guild_bans,
     get_guild_settings,
     get_member_info,
+    get_raid_status as get_raid_status_impl,
     get_member_timeout_status,
     get_message,
+    get_permission_matrix,
     get_poll_results,
     get_reaction_users,
     get_role,
@@ -60,14 +72,25 @@ from discord_mcp.tools import (
     get_scheduled_event_users,
     kick_user,
     list_automod_rules,
+    list_channel_audience as list_channel_audience_impl,
     list_emojis,
     list_invites,
     list_members,
+    mass_moderate,
+    member_stats as member_stats_impl,
+    list_message_templates as list_message_templates_impl,
+    list_scheduled_actions as list_scheduled_actions_impl,
+    list_permission_snapshots as list_permission_snapshots_impl,
     list_scheduled_events,
     list_stickers,
     list_threads,
+    list_timed_out_members as list_timed_out_members_impl,
     list_webhooks,
     move_channel,
+    plan_permission_changes as plan_permission_changes_impl,
+    query_audit_log,
+    register_message_template as register_message_template_impl,
+    schedule_action,
     inspect_effective_permissions,
     inspect_target_channel_permissions as inspect_target_channel_permissions_impl,
     list_target_accessible_channels as list_target_accessible_channels_impl,
@@ -77,8 +100,16 @@ from discord_mcp.tools import (
     remove_role,
     remove_thread_member,
     remove_timeout,
+    search_members as search_members_impl,
+    search_messages as search_messages_impl,
     send_message,
+    sweep_role_policy,
+    sync_audit_log,
+    sync_guild_bans as sync_guild_bans_impl,
+    send_message_batch,
     send_webhook_message,
+    simulate_permission_changes as simulate_permission_changes_impl,
+    snapshot_guild_permissions as snapshot_guild_permissions_impl,
     set_category_permissions,
     set_channel_permissions,
     set_role_permissions,
@@ -329,6 +360,33 @@ async def remove_role_from_member(
     return await remove_role(user_id=user_id, role_id=role_id, guild_id=guild_id)
 
 
+@mcp.tool()
+async def update_member_roles_bulk(
+    ctx: Context,
+    guild_id: str,
+    add_role_ids: list[str] | None = None,
+    remove_role_ids: list[str] | None = None,
+    member_ids: list[str] | None = None,
+    has_role_id: str | None = None,
+    missing_role_id: str | None = None,
+    include_bots: bool = True,
+    job_id: str | None = None,
+    batch_size: int = 1000,
+) -> dict[str, Any]:
+    return await bulk_update_member_roles(
+        guild_id=guild_id,
+        add_role_ids=add_role_ids,
+        remove_role_ids=remove_role_ids,
+        member_ids=member_ids,
+        has_role_id=has_role_id,
+        missing_role_id=missing_role_id,
+        include_bots=include_bots,
+        job_id=job_id,
+        batch_size=batch_size,
+        progress=ctx.report_progress,
+    )
+
+
 @mcp.tool()
 async def list_roles(guild_id: str) -> list[dict[str, Any]]:
     return await get_roles(guild_id=guild_id)
@@ -416,6 +474,9 @@ async def inspect_role_permissions(
     preview_limit: int = 20,
     include_permission_maps: bool = False,
     max_channels: int | None = None,
+    channel_page_size: int = 100,
+    channel_cursor: str | None = None,
+    only_differing: bool = False,
 ) -> dict[str, Any]:
     return await inspect_effective_permissions(
         guild_id=guild_id,
@@ -424,6 +485,9 @@ async def inspect_role_permissions(
         preview_limit=preview_limit,
         include_permission_maps=include_permission_maps,
         max_channels=max_channels,
+        channel_page_size=channel_page_size,
+        channel_cursor=channel_cursor,
+        only_differing=only_differing,
     )
 
 
@@ -434,6 +498,9 @@ async def inspect_member_permissions(
     preview_limit: int = 20,
     include_permission_maps: bool = False,
     max_channels: int | None = None,
+    channel_page_size: int = 100,
+    channel_cursor: str | None = None,
+    only_differing: bool = False,
 ) -> dict[str, Any]:
     return await inspect_effective_permissions(
         guild_id=guild_id,
@@ -442,6 +509,9 @@ async def inspect_member_permissions(
         preview_limit=preview_limit,
         include_permission_maps=include_permission_maps,
         max_channels=max_channels,
+        channel_page_size=channel_page_size,
+        channel_cursor=channel_cursor,
+        only_differing=only_differing,
     )
 
 
@@ -496,16 +566,138 @@ async def list_target_inaccessible_channels(
     )
 
 
+@mcp.tool()
+async def permission_matrix(
+    guild_id: str,
+    include_members: bool = False,
+    member_limit: int = 1000,
+    permissions: list[str] | None = None,
+) -> dict[str, Any]:
+    return await get_permission_matrix(
+        guild_id=guild_id,
+        include_members=include_members,
+        member_limit=member_limit,
+        permissions=permissions,
+    )
+
+
+@mcp.tool()
+async def list_channel_audience(
+    channel_id: str,
+    permission: str = "view_channel",
+    limit: int = 100,
+    after: str | None = None,
+) -> dict[str, Any]:
+    return await list_channel_audience_impl(
+        channel_id=channel_id,
+        permission=permission,
+        limit=limit,
+        after=after,
+    )
+
+
+@mcp.tool()
+async def plan_permission_changes(
+    guild_id: str,
+    roles: list[dict[str, Any]] | None = None,
+    overwrites: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    return await plan_permission_changes_impl(
+        guild_id=guild_id,
+        roles=roles,
+        overwrites=overwrites,
+    )
+
+
+@mcp.tool()
+async def apply_permission_plan(plan_id: str, ctx: Context) -> dict[str, Any]:
+    return await apply_permission_plan_impl(plan_id=plan_id, progress=ctx.report_progress)
+
+
+@mcp.tool()
+async def simulate_permission_changes(
+    guild_id: str,
+    roles: list[dict[str, Any]] | None = None,
+    overwrites: list[dict[str, Any]] | None = None,
+    plan_id: str | None = None,
+    member_limit: int = 100,
+) -> dict[str, Any]:
+    return await simulate_permission_changes_impl(
+        guild_id=guild_id,
+        roles=roles,
+        overwrites=overwrites,
+        plan_id=plan_id,
+        member_limit=member_limit,
+    )
+
+
+@mcp.tool()
+async def discard_permission_plan(plan_id: str) -> dict[str, Any]:
+    return await discard_permission_plan_impl(plan_id=plan_id)
+
+
+@mcp.tool()
+async def snapshot_guild_permissions(guild_id: str, label: str | None = None) -> dict[str, Any]:
+    return await snapshot_guild_permissions_impl(guild_id=guild_id, label=label)
+
+
+@mcp.tool()
+async def list_permission_snapshots(guild_id: str) -> list[dict[str, Any]]:
+    return await list_permission_snapshots_impl(guild_id=guild_id)
+
+
+@mcp.tool()
+async def diff_permission_snapshots(
+    guild_id: str,
+    from_snapshot_id: str,
+    to_snapshot_id: str | None = None,
+) -> dict[str, Any]:
+    return await diff_permission_snapshots_impl(
+        guild_id=guild_id,
+        from_snapshot_id=from_snapshot_id,
+        to_snapshot_id=to_snapshot_id,
+    )
+
+
 @mcp.tool()
 async def send_message_to_channel(
     channel_id: str,
-    content: str,
+    content: str | None = None,
     tts: bool = False,
+    attachments: list[dict[str, Any]] | None = None,
+    template: str | None = None,
+    template_variables: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     return await send_message(
         channel_id=channel_id,
         content=content,
         tts=tts,
+        attachments=attachments,
+        template=template,
+        template_variables=template_variables,
+    )
+
+
+@mcp.tool()
+async def send_message_to_channels(
+    content: str | None = None,
+    channel_ids: list[str] | None = None,
+    guild_id: str | None = None,
+    category_id: str | None = None,
+    name_pattern: str | None = None,
+    tts: bool = False,
+    template: str | None = None,
+    template_variables: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    return await send_message_batch(
+        content=content,
+        channel_ids=channel_ids,
+        guild_id=guild_id,
+        category_id=category_id,
+        name_pattern=name_pattern,
+        tts=tts,
+        template=template,
+        template_variables=template_variables,
     )
 
 
@@ -514,14 +706,49 @@ async def modify_message(
     channel_id: str,
     message_id: str,
     content: str | None = None,
+    minimal_response: bool = False,
+    template: str | None = None,
+    template_variables: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     return await edit_message(
         channel_id=channel_id,
         message_id=message_id,
         content=content,
+        minimal_response=minimal_response,
+        template=template,
+        template_variables=template_variables,
+    )
+
+
+@mcp.tool()
+async def register_message_template(
+    name: str,
+    content: str | None = None,
+    embeds: list[dict[str, Any]] | None = None,
+    allowed_mentions: dict[str, Any] | None = None,
+    tts: bool = False,
+    overwrite: bool = True,
+) -> dict[str, Any]:
+    return await register_message_template_impl(
+        name=name,
+        content=content,
+        embeds=embeds,
+        allowed_mentions=allowed_mentions,
+        tts=tts,
+        overwrite=overwrite,
     )
 
 
+@mcp.tool()
+async def list_message_templates() -> list[dict[str, Any]]:
+    return await list_message_templates_impl()
+
+
+@mcp.tool()
+async def delete_message_template(name: str) -> dict[str, Any]:
+    return await delete_message_template_impl(name=name)
+
+
 @mcp.tool()
 async def remove_message(
     channel_id: str, message_id: str, guild_id: str | None = None
@@ -566,6 +793,40 @@ async def fetch_channel_history(
     )
 
 
+@mcp.tool()
+async def index_channel_history(
+    channel_id: str,
+    limit: int = 1000,
+    direction: str = "older",
+) -> dict[str, Any]:
+    return await backfill_message_index(
+        channel_id=channel_id,
+        limit=limit,
+        direction=direction,
+    )
+
+
+@mcp.tool()
+async def search_messages(
+    query: str,
+    guild_id: str | None = None,
+    channel_id: str | None = None,
+    author_id: str | None = None,
+    after: str | None = None,
+    before: str | None = None,
+    limit: int = 25,
+) -> dict[str, Any]:
+    return await search_messages_impl(
+        query=query,
+        guild_id=guild_id,
+        channel_id=channel_id,
+        author_id=author_id,
+        after=after,
+        before=before,
+        limit=limit,
+    )
+
+
 @mcp.tool()
 async def timeout_member(
     user_id: str,
@@ -611,6 +872,27 @@ async def unban_member(user_id: str, guild_id: str, reason: str | None = None) -
     return await unban_user(user_id=user_id, guild_id=guild_id, reason=reason)
 
 
+@mcp.tool()
+async def mass_moderate_members(
+    ctx: Context,
+    guild_id: str,
+    user_ids: list[str],
+    action: str,
+    reason: str | None = None,
+    delete_message_seconds: int = 0,
+    duration_seconds: int | None = None,
+) -> dict[str, Any]:
+    return await mass_moderate(
+        guild_id=guild_id,
+        user_ids=user_ids,
+        action=action,
+        reason=reason,
+        delete_message_seconds=delete_message_seconds,
+        duration_seconds=duration_seconds,
+        progress=ctx.report_progress,
+    )
+
+
 @mcp.tool()
 async def enforce_member_role_policy(
     user_id: str,
@@ -629,8 +911,138 @@ async def enforce_member_role_policy(
 
 
 @mcp.tool()
-async def list_guild_bans(guild_id: str, limit: int = 100) -> list[dict[str, Any]]:
-    return await get_guild_bans(guild_id=guild_id, limit=limit)
+async def sweep_member_role_policy(
+    ctx: Context,
+    guild_id: str,
+    required_role_ids: list[str] | None = None,
+    action: str = "kick",
+    reason: str | None = None,
+    exempt_role_ids: list[str] | None = None,
+    include_bots: bool = False,
+    dry_run: bool = True,
+    job_id: str | None = None,
+    batch_size: int = 1000,
+) -> dict[str, Any]:
+    return await sweep_role_policy(
+        guild_id=guild_id,
+        required_role_ids=required_role_ids,
+        action=action,
+        reason=reason,
+        exempt_role_ids=exempt_role_ids,
+        include_bots=include_bots,
+        dry_run=dry_run,
+        job_id=job_id,
+        batch_size=batch_size,
+        progress=ctx.report_progress,
+    )
+
+
+@mcp.tool()
+async def list_guild_bans(
+    guild_id: str,
+    limit: int = 100,
+    after: str | None = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    return await get_guild_bans(guild_id=guild_id, limit=limit, after=after, refresh=refresh)
+
+
+@mcp.tool()
+async def export_guild_bans(guild_id: str, refresh: bool = False) -> dict[str, Any]:
+    return await export_guild_bans_impl(guild_id=guild_id, refresh=refresh)
+
+
+@mcp.tool()
+async def sync_guild_bans(
+    ctx: Context,
+    source_guild_id: str,
+    target_guild_id: str,
+    dry_run: bool = True,
+    reason: str | None = None,
+    delete_message_seconds: int = 0,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    return await sync_guild_bans_impl(
+        source_guild_id=source_guild_id,
+        target_guild_id=target_guild_id,
+        dry_run=dry_run,
+        reason=reason,
+        delete_message_seconds=delete_message_seconds,
+        refresh=refresh,
+        progress=ctx.report_progress,
+    )
+
+
+@mcp.tool()
+async def schedule_moderation_action(
+    guild_id: str,
+    action: str,
+    delay_seconds: int | None = None,
+    due_at: str | None = None,
+    user_id: str | None = None,
+    role_id: str | None = None,
+    channel_id: str | None = None,
+    message_id: str | None = None,
+    reason: str | None = None,
+) -> dict[str, Any]:
+    return await schedule_action(
+        guild_id=guild_id,
+        action=action,
+        delay_seconds=delay_seconds,
+        due_at=due_at,
+        user_id=user_id,
+        role_id=role_id,
+        channel_id=channel_id,
+        message_id=message_id,
+        reason=reason,
+    )
+
+
+@mcp.tool()
+async def list_scheduled_actions(
+    guild_id: str,
+    status: str | None = "pending",
+    after: str | None = None,
+    limit: int = 100,
+) -> dict[str, Any]:
+    return await list_scheduled_actions_impl(
+        guild_id=guild_id, status=status, after=after, limit=limit
+    )
+
+
+@mcp.tool()
+async def cancel_scheduled_action(action_id: str) -> dict[str, Any]:
+    return await cancel_scheduled_action_impl(action_id=action_id)
+
+
+@mcp.tool()
+async def get_raid_status(guild_id: str) -> dict[str, Any]:
+    return await get_raid_status_impl(guild_id=guild_id)
+
+
+@mcp.tool()
+async def configure_raid_detection(
+    guild_id: str,
+    enabled: bool | None = None,
+    join_threshold: int | None = None,
+    window_seconds: int | None = None,
+    new_account_days: int | None = None,
+    cluster_min_size: int | None = None,
+    response: str | None = None,
+    timeout_seconds: int | None = None,
+    raise_verification: bool | None = None,
+) -> dict[str, Any]:
+    return await configure_raid_detection_impl(
+        guild_id=guild_id,
+        enabled=enabled,
+        join_threshold=join_threshold,
+        window_seconds=window_seconds,
+        new_account_days=new_account_days,
+        cluster_min_size=cluster_min_size,
+        response=response,
+        timeout_seconds=timeout_seconds,
+        raise_verification=raise_verification,
+    )
 
 
 @mcp.tool()
@@ -672,6 +1084,11 @@ async def check_member_timeout_status(user_id: str, guild_id: str) -> dict[str,
     return await get_member_timeout_status(user_id=user_id, guild_id=guild_id)
 
 
+@mcp.tool()
+async def list_timed_out_members(guild_id: str, limit: int = 100) -> dict[str, Any]:
+    return await list_timed_out_members_impl(guild_id=guild_id, limit=limit)
+
+
 @mcp.tool()
 async def get_bot_status() -> dict[str, Any]:
     sessions = session_manager.get_all_sessions()
@@ -1055,14 +1472,89 @@ async def get_guild_audit_log(
     )
 
 
+@mcp.tool()
+async def sync_guild_audit_log(ctx: Context, guild_id: str) -> dict[str, Any]:
+    return await sync_audit_log(guild_id=guild_id, progress=ctx.report_progress)
+
+
+@mcp.tool()
+async def query_guild_audit_log(
+    guild_id: str,
+    action: str | None = None,
+    user_id: str | None = None,
+    target_id: str | None = None,
+    after: str | None = None,
+    before: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    return await query_audit_log(
+        guild_id=guild_id,
+        action=action,
+        user_id=user_id,
+        target_id=target_id,
+        after=after,
+        before=before,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
 @mcp.tool()
 async def get_guild_member_info(guild_id: str, user_id: str) -> dict[str, Any]:
     return await get_member_info(guild_id=guild_id, user_id=user_id)
 
 
 @mcp.tool()
-async def list_guild_members(guild_id: str, limit: int = 100) -> list[dict[str, Any]]:
-    return await list_members(guild_id=guild_id, limit=limit)
+async def list_guild_members(
+    guild_id: str,
+    limit: int = 100,
+    after: str | None = None,
+    role_id: str | None = None,
+    joined_after: str | None = None,
+    bot: bool | None = None,
+    name_prefix: str | None = None,
+    timed_out: bool | None = None,
+) -> dict[str, Any]:
+    return await list_members(
+        guild_id=guild_id,
+        limit=limit,
+        after=after,
+        role_id=role_id,
+        joined_after=joined_after,
+        bot=bot,
+        name_prefix=name_prefix,
+        timed_out=timed_out,
+    )
+
+
+@mcp.tool()
+async def search_members(
+    guild_id: str,
+    query: str,
+    limit: int = 25,
+    fuzzy: bool = True,
+) -> dict[str, Any]:
+    return await search_members_impl(guild_id=guild_id, query=query, limit=limit, fuzzy=fuzzy)
+
+
+@mcp.tool()
+async def member_stats(
+    guild_id: str,
+    role_id: str | None = None,
+    include_bots: bool = True,
+    join_bucket_days: int = 7,
+    join_buckets: int = 12,
+    top_roles: int = 20,
+) -> dict[str, Any]:
+    return await member_stats_impl(
+        guild_id=guild_id,
+        role_id=role_id,
+        include_bots=include_bots,
+        join_bucket_days=join_bucket_days,
+        join_buckets=join_buckets,
+        top_roles=top_roles,
+    )
 
 
 @mcp.tool()
@@ -7,6 +7,7 @@ from discord_mcp.models.channel import (
 )
 from discord_mcp.models.moderation import (
     ModerationResponse,
+    RaidPolicy,
     RolePolicyEnforce,
     UserBan,
     UserKick,
@@ -54,4 +55,5 @@ __all__ = [
     "UserUnban",
     "RolePolicyEnforce",
     "ModerationResponse",
+    "RaidPolicy",
 ]
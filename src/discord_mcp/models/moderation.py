@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -57,3 +57,24 @@ class ModerationResponse(BaseModel):
     user_id: str
     guild_id: str
     details: Optional[dict[str, str]] = None
+
+
+class RaidPolicy(BaseModel):
+    enabled: bool = Field(True, description="Run join-burst detection for the guild")
+    join_threshold: int = Field(
+        10, ge=2, le=1000, description="Joins within the window that count as a raid"
+    )
+    window_seconds: int = Field(30, ge=1, le=3600, description="Sliding window length")
+    new_account_days: int = Field(
+        7, ge=0, le=365, description="Accounts younger than this count as new"
+    )
+    cluster_min_size: int = Field(
+        3, ge=2, le=100, description="Joins sharing a name skeleton that form a cluster"
+    )
+    response: Literal["alert", "timeout", "kick", "ban"] = Field(
+        "alert", description="Action taken on suspicious joins while a raid is active"
+    )
+    timeout_seconds: int = Field(3600, ge=60, le=2419200, description="Timeout length")
+    raise_verification: bool = Field(
+        False, description="Raise the guild verification level to high when a raid starts"
+    )
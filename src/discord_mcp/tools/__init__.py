@@ -1,5 +1,7 @@
 from discord_mcp.tools.audit_log import (
     get_audit_log,
+    query_audit_log,
+    sync_audit_log,
 )
 from discord_mcp.tools.automod import (
     create_automod_rule,
@@ -41,6 +43,8 @@ from discord_mcp.tools.members import (
     edit_member,
     get_member_info,
     list_members,
+    member_stats,
+    search_members,
 )
 from discord_mcp.tools.messages import (
     bulk_delete_messages,
@@ -49,22 +53,41 @@ from discord_mcp.tools.messages import (
     get_channel_messages,
     get_message,
     send_message,
+    send_message_batch,
 )
 from discord_mcp.tools.moderation import (
     ban_user,
     enforce_role_policy,
+    export_guild_bans,
     get_guild_bans,
     get_member_timeout_status,
     kick_user,
+    list_timed_out_members,
+    mass_moderate,
     remove_timeout,
+    sweep_role_policy,
+    sync_guild_bans,
     timeout_user,
     unban_user,
 )
+from discord_mcp.tools.permission_plans import (
+    apply_permission_plan,
+    discard_permission_plan,
+    plan_permission_changes,
+    simulate_permission_changes,
+)
+from discord_mcp.tools.permission_snapshots import (
+    diff_permission_snapshots,
+    list_permission_snapshots,
+    snapshot_guild_permissions,
+)
 from discord_mcp.tools.permissions import (
     get_category_permissions,
     get_channel_permissions,
+    get_permission_matrix,
     inspect_effective_permissions,
     inspect_target_channel_permissions,
+    list_channel_audience,
     list_target_accessible_channels,
     list_target_inaccessible_channels,
     remove_channel_permissions,
@@ -77,6 +100,10 @@ from discord_mcp.tools.polls import (
     end_poll,
     get_poll_results,
 )
+from discord_mcp.tools.raid import (
+    configure_raid_detection,
+    get_raid_status,
+)
 from discord_mcp.tools.reactions import (
     add_reaction,
     clear_reactions,
@@ -85,6 +112,7 @@ from discord_mcp.tools.reactions import (
 )
 from discord_mcp.tools.roles import (
     assign_role,
+    bulk_update_member_roles,
     create_role,
     delete_role,
     edit_role,
@@ -92,6 +120,20 @@ from discord_mcp.tools.roles import (
     get_roles,
     remove_role,
 )
+from discord_mcp.tools.scheduled_actions import (
+    cancel_scheduled_action,
+    list_scheduled_actions,
+    schedule_action,
+)
+from discord_mcp.tools.search import (
+    backfill_message_index,
+    search_messages,
+)
+from discord_mcp.tools.templates import (
+    delete_message_template,
+    list_message_templates,
+    register_message_template,
+)
 from discord_mcp.tools.threads import (
     add_thread_member,
     create_forum_post,
@@ -124,6 +166,7 @@ __all__ = [
     "remove_role",
     "get_role",
     "get_roles",
+    "bulk_update_member_roles",
     # Permissions
     "set_channel_permissions",
     "set_category_permissions",
@@ -135,22 +178,51 @@ __all__ = [
     "inspect_target_channel_permissions",
     "list_target_accessible_channels",
     "list_target_inaccessible_channels",
+    "get_permission_matrix",
+    "list_channel_audience",
+    "plan_permission_changes",
+    "apply_permission_plan",
+    "discard_permission_plan",
+    "simulate_permission_changes",
+    "snapshot_guild_permissions",
+    "list_permission_snapshots",
+    "diff_permission_snapshots",
     # Messages
     "send_message",
+    "send_message_batch",
     "edit_message",
     "delete_message",
     "bulk_delete_messages",
     "get_message",
     "get_channel_messages",
+    # Message Search
+    "backfill_message_index",
+    "search_messages",
+    # Message Templates
+    "register_message_template",
+    "list_message_templates",
+    "delete_message_template",
     # Moderation
     "timeout_user",
     "remove_timeout",
     "kick_user",
     "ban_user",
     "unban_user",
+    "mass_moderate",
     "enforce_role_policy",
+    "sweep_role_policy",
     "get_guild_bans",
+    "export_guild_bans",
+    "sync_guild_bans",
     "get_member_timeout_status",
+    "list_timed_out_members",
+    # Scheduled Actions
+    "schedule_action",
+    "list_scheduled_actions",
+    "cancel_scheduled_action",
+    # Raid Detection
+    "get_raid_status",
+    "configure_raid_detection",
     # Guild
     "get_guild_settings",
     "edit_guild_settings",
@@ -198,8 +270,12 @@ __all__ = [
     "list_automod_rules",
     # Audit Log
     "get_audit_log",
+    "sync_audit_log",
+    "query_audit_log",
     # Members
     "get_member_info",
     "list_members",
+    "search_members",
+    "member_stats",
     "edit_member",
 ]
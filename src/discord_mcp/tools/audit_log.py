@@ -1,7 +1,10 @@
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 from typing import Any, Optional
 
 import discord
 
+from discord_mcp.discord.audit_log_store import AuditLogStore, entry_changes
 from discord_mcp.mcp.context import get_current_session, update_bot_status
 from discord_mcp.utils.logging import get_logger
 
@@ -36,15 +39,8 @@ async def get_audit_log(
     kwargs: dict[str, Any] = {"limit": min(limit, 100)}
 
     if user_id:
-        try:
-            user = await client.fetch_user(int(user_id))
-            kwargs["user"] = user
-        except discord.NotFound:
-            from discord_mcp.discord.exceptions import AuditLogException
-
-            raise AuditLogException(
-                f"User {user_id} not found", details={"user_id": user_id}
-            )
+        # The endpoint filters by ID; no need to resolve the user first.
+        kwargs["user"] = discord.Object(id=int(user_id))
 
     if action_type is not None:
         try:
@@ -77,14 +73,8 @@ async def get_audit_log(
                 "created_at": entry.created_at.isoformat() if entry.created_at else None,
             }
 
-            if entry.changes:
-                changes = []
-                for change in entry.changes:
-                    changes.append({
-                        "attribute": change.attribute,
-                        "before": str(change.before) if change.before is not None else None,
-                        "after": str(change.after) if change.after is not None else None,
-                    })
+            changes = entry_changes(entry)
+            if changes:
                 entry_data["changes"] = changes
 
             entries.append(entry_data)
@@ -104,3 +94,198 @@ async def get_audit_log(
         )
 
     return entries
+
+
+def _get_store(client: discord.Client) -> AuditLogStore:
+    store = getattr(client, "audit_log_store", None)
+    if store is None:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException("Audit log store is not open; the bot is not ready yet")
+    return store
+
+
+def _parse_action(action: str) -> int:
+    try:
+        if action.isdigit():
+            return discord.AuditLogAction(int(action)).value
+        return discord.AuditLogAction[action.lower()].value
+    except (KeyError, ValueError):
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(
+            f"Invalid action: {action}. Use an audit log action name such as 'ban' or its number",
+            details={"action": action},
+        )
+
+
+def _parse_time(name: str, value: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(
+            f"Invalid {name} timestamp: {value}. Use ISO 8601 format.",
+            details={name: value},
+        )
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _parse_id(name: str, value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(f"Invalid {name}: {value}", details={name: value})
+
+
+async def _sync(
+    store: AuditLogStore,
+    guild: discord.Guild,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]],
+) -> int:
+    async def report(fetched: int) -> None:
+        if progress:
+            await progress(fetched, None, f"Fetched {fetched} audit log entries")
+
+    try:
+        return await store.sync(guild, report)
+    except discord.Forbidden:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(
+            "Bot lacks permission to view audit logs",
+            details={"guild_id": str(guild.id)},
+        )
+    except discord.HTTPException as e:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(
+            f"Failed to fetch audit logs: {str(e)}",
+            details={"guild_id": str(guild.id), "original_error": str(e)},
+        )
+
+
+async def sync_audit_log(
+    guild_id: str,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+) -> dict[str, Any]:
+    """Copy a guild's audit log into the local store.
+
+    The first run pages the full history and resumes where it stopped if interrupted;
+    later runs only fetch entries newer than the last sync.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(f"Guild {guild_id} not found", details={"guild_id": guild_id})
+
+    store = _get_store(client)
+    await _with_status("Syncing audit log")
+    fetched = await _sync(store, guild, progress)
+    state = store.state(guild.id)
+
+    return {
+        "success": True,
+        "guild_id": guild_id,
+        "fetched_count": fetched,
+        "stored_count": state["entry_count"],
+    }
+
+
+async def query_audit_log(
+    guild_id: str,
+    action: Optional[str] = None,
+    user_id: Optional[str] = None,
+    target_id: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> dict[str, Any]:
+    """Filter the stored audit log by action, acting user, target and time range.
+
+    Entries come newest first; pass ``next_cursor`` back as ``cursor`` for the next page.
+    The guild is synced on first use and then kept current by gateway events.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import AuditLogException
+
+        raise AuditLogException(f"Guild {guild_id} not found", details={"guild_id": guild_id})
+
+    # Validate every filter before a sync that may page the whole history.
+    # Entry IDs are snowflakes, so time bounds become ID bounds on the primary key.
+    action_value = _parse_action(action) if action else None
+    user_value = _parse_id("user_id", user_id) if user_id else None
+    target_value = _parse_id("target_id", target_id) if target_id else None
+    after_id = (
+        discord.utils.time_snowflake(_parse_time("after", after), high=True) if after else None
+    )
+    before_ids = [_parse_id("cursor", cursor)] if cursor else []
+    if before:
+        before_ids.append(discord.utils.time_snowflake(_parse_time("before", before)))
+
+    store = _get_store(client)
+    if not store.is_live(guild.id):
+        await _sync(store, guild, None)
+
+    limit = max(1, min(limit, 1000))
+    rows = store.query(
+        guild.id,
+        action=action_value,
+        user_id=user_value,
+        target_id=target_value,
+        after_id=after_id,
+        before_id=min(before_ids) if before_ids else None,
+        limit=limit + 1,
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    entries = []
+    for row in rows:
+        user = client.get_user(row["user_id"]) if row["user_id"] else None
+        entries.append(
+            {
+                "id": str(row["id"]),
+                "action": discord.enums.try_enum(discord.AuditLogAction, row["action"]).name,
+                "user": {
+                    "id": str(row["user_id"]),
+                    "username": user.name if user else None,
+                }
+                if row["user_id"]
+                else None,
+                "target_id": str(row["target_id"]) if row["target_id"] else None,
+                "reason": row["reason"],
+                "created_at": discord.utils.snowflake_time(row["id"]).isoformat(),
+                "changes": row["changes"],
+            }
+        )
+
+    return {
+        "guild_id": guild_id,
+        "returned_count": len(entries),
+        "has_more": has_more,
+        "next_cursor": str(rows[-1]["id"]) if has_more else None,
+        "entries": entries,
+    }
@@ -1,12 +1,23 @@
+import heapq
+import math
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any, Optional
 
 import discord
 
+from discord_mcp.discord.member_snapshot import MemberSnapshot
 from discord_mcp.mcp.context import get_current_session, update_bot_status
 from discord_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_DAY = 86400.0
+# Members read over REST per list_members call when the guild is not chunked, so a
+# filter that rarely matches cannot page through the whole guild in one call.
+MAX_REST_SCAN = 5000
+
 
 async def _with_status(activity: str):
     await update_bot_status(activity, "playing")
@@ -76,7 +87,81 @@ async def get_member_info(guild_id: str, user_id: str) -> dict[str, Any]:
     }
 
 
-async def list_members(guild_id: str, limit: int = 100) -> list[dict[str, Any]]:
+def _parse_joined_after(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        from discord_mcp.discord.exceptions import MemberException
+
+        raise MemberException(
+            f"Invalid joined_after timestamp: {value}. Use ISO 8601 format.",
+            details={"joined_after": value},
+        )
+    # Member join times are timezone-aware UTC.
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _member_filter(
+    role_id: Optional[str],
+    joined_after: Optional[str],
+    bot: Optional[bool],
+    name_prefix: Optional[str],
+    timed_out: Optional[bool],
+) -> Callable[[discord.Member], bool]:
+    role = int(role_id) if role_id else None
+    since = _parse_joined_after(joined_after)
+    prefix = name_prefix.casefold() if name_prefix else None
+
+    def matches(member: discord.Member) -> bool:
+        if bot is not None and member.bot != bot:
+            return False
+        if role is not None and role not in member._roles:
+            return False
+        if since is not None and (member.joined_at is None or member.joined_at <= since):
+            return False
+        if timed_out is not None and member.is_timed_out() != timed_out:
+            return False
+        if prefix is not None and not any(
+            name.casefold().startswith(prefix)
+            for name in (member.name, member.global_name, member.nick)
+            if name
+        ):
+            return False
+        return True
+
+    return matches
+
+
+def _member_summary(member: discord.Member) -> dict[str, Any]:
+    return {
+        "id": str(member.id),
+        "username": member.name,
+        "display_name": member.display_name,
+        "nick": member.nick,
+        "bot": member.bot,
+        "joined_at": member.joined_at.isoformat() if member.joined_at else None,
+        "top_role": {"id": str(member.top_role.id), "name": member.top_role.name},
+    }
+
+
+async def list_members(
+    guild_id: str,
+    limit: int = 100,
+    after: Optional[str] = None,
+    role_id: Optional[str] = None,
+    joined_after: Optional[str] = None,
+    bot: Optional[bool] = None,
+    name_prefix: Optional[str] = None,
+    timed_out: Optional[bool] = None,
+) -> dict[str, Any]:
+    """List members in ascending ID order, ``after`` being the last ID of the previous page.
+
+    Served from the member cache once the guild is chunked; otherwise pages are read
+    over REST and filtered as they arrive, scanning at most ``MAX_REST_SCAN`` members.
+    A page cut short by that cap still has ``has_more`` and a ``next_cursor`` to resume.
+    """
     session = await get_current_session()
     client = session.client
 
@@ -91,19 +176,218 @@ async def list_members(guild_id: str, limit: int = 100) -> list[dict[str, Any]]:
 
         raise MemberException(f"Guild {guild_id} not found", details={"guild_id": guild_id})
 
+    limit = max(1, min(limit, 1000))
+    after_id = int(after) if after else 0
+    matches = _member_filter(role_id, joined_after, bot, name_prefix, timed_out)
+
+    page: list[discord.Member]
+    scan_cursor: Optional[int] = None
+    if guild.chunked:
+        source = "cache"
+        # One extra member tells whether another page exists.
+        page = heapq.nsmallest(
+            limit + 1,
+            (m for m in guild.members if m.id > after_id and matches(m)),
+            key=lambda m: m.id,
+        )
+    else:
+        source = "rest"
+        page = []
+        scanned = 0
+        last_scanned = after_id
+        try:
+            async for member in guild.fetch_members(
+                limit=MAX_REST_SCAN, after=discord.Object(id=after_id)
+            ):
+                scanned += 1
+                last_scanned = member.id
+                if matches(member):
+                    page.append(member)
+                    if len(page) > limit:
+                        break
+        except discord.HTTPException as e:
+            _handle_discord_error(e)
+            raise
+        if len(page) <= limit and scanned >= MAX_REST_SCAN:
+            # Everything up to the last scanned member has been checked; resume after it.
+            scan_cursor = last_scanned
+
+    has_more = len(page) > limit or scan_cursor is not None
+    page = page[:limit]
+    if scan_cursor is not None:
+        next_cursor: Optional[str] = str(scan_cursor)
+    else:
+        next_cursor = str(page[-1].id) if has_more else None
+
+    await _with_status("Listing members")
+    logger.info(
+        "members_listed",
+        guild_id=guild_id,
+        source=source,
+        returned_count=len(page),
+    )
+
+    return {
+        "guild_id": guild_id,
+        "source": source,
+        "returned_count": len(page),
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "members": [_member_summary(member) for member in page],
+    }
+
+
+async def search_members(
+    guild_id: str,
+    query: str,
+    limit: int = 25,
+    fuzzy: bool = True,
+) -> dict[str, Any]:
+    """Find cached members by username, global name or nickname.
+
+    Prefix matches come first; with ``fuzzy``, remaining slots are filled by trigram
+    similarity, so typos and partial names still match.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import MemberException
+
+        raise MemberException(f"Guild {guild_id} not found", details={"guild_id": guild_id})
+
+    if not query.strip():
+        from discord_mcp.discord.exceptions import MemberException
+
+        raise MemberException("query must not be empty")
+
+    hits = client.member_index.search(guild, query, limit=max(1, min(limit, 100)), fuzzy=fuzzy)
+
     members = []
-    async for member in guild.fetch_members(limit=min(limit, 1000)):
-        members.append({
-            "id": str(member.id),
-            "username": member.name,
-            "display_name": member.display_name,
-            "nick": member.nick,
-            "bot": member.bot,
-            "joined_at": member.joined_at.isoformat() if member.joined_at else None,
-            "top_role": {"id": str(member.top_role.id), "name": member.top_role.name},
-        })
-
-    return members
+    for hit in hits:
+        member = guild.get_member(hit["member_id"])
+        if member is None:
+            continue
+        members.append(
+            {
+                **_member_summary(member),
+                "matched_name": hit["matched_name"],
+                "match": hit["match"],
+                "score": hit["score"],
+            }
+        )
+
+    await _with_status("Searching members")
+    logger.info("members_searched", guild_id=guild_id, hit_count=len(members))
+
+    return {
+        "guild_id": guild_id,
+        "query": query,
+        "member_cache_complete": guild.chunked,
+        "returned_count": len(members),
+        "members": members,
+    }
+
+
+def _window(snapshot: MemberSnapshot, mask: int, start: float, end: float) -> int:
+    return (mask & snapshot.join_range(start, end)).bit_count()
+
+
+async def member_stats(
+    guild_id: str,
+    role_id: Optional[str] = None,
+    include_bots: bool = True,
+    join_bucket_days: int = 7,
+    join_buckets: int = 12,
+    top_roles: int = 20,
+) -> dict[str, Any]:
+    """Aggregate counts over the guild's cached members, optionally limited to one role.
+
+    Computed on a columnar member snapshot, so only the aggregates are serialized.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import MemberException
+
+        raise MemberException(f"Guild {guild_id} not found", details={"guild_id": guild_id})
+
+    if role_id and not guild.get_role(int(role_id)):
+        from discord_mcp.discord.exceptions import MemberException
+
+        raise MemberException(f"Role {role_id} not found", details={"role_id": role_id})
+
+    snapshot = client.member_snapshots.get(guild)
+    mask = snapshot.all
+    if role_id:
+        mask &= snapshot.roles.get(int(role_id), 0)
+    if not include_bots:
+        mask &= ~snapshot.bots
+
+    now = time.time()
+    bucket_seconds = max(1, join_bucket_days) * _DAY
+    histogram = []
+    for k in range(max(1, min(join_buckets, 104)) - 1, -1, -1):
+        start, end = now - (k + 1) * bucket_seconds, now - k * bucket_seconds
+        histogram.append(
+            {
+                "start": datetime.fromtimestamp(start, UTC).isoformat(),
+                "end": datetime.fromtimestamp(end, UTC).isoformat(),
+                "count": _window(snapshot, mask, start, end),
+            }
+        )
+
+    roles = []
+    for role in guild.roles:
+        if role.is_default():
+            continue
+        count = (mask & snapshot.roles.get(role.id, 0)).bit_count()
+        if count:
+            roles.append({"role_id": str(role.id), "role_name": role.name, "count": count})
+    roles.sort(key=lambda row: row["count"], reverse=True)
+
+    await _with_status("Computing member stats")
+    logger.info("member_stats_computed", guild_id=guild_id, role_id=role_id)
+
+    return {
+        "guild_id": guild_id,
+        "role_id": role_id,
+        "include_bots": include_bots,
+        "snapshot_built_at": datetime.fromtimestamp(snapshot.built_at, UTC).isoformat(),
+        "cached_member_count": snapshot.size,
+        "guild_member_count": guild.member_count,
+        "member_cache_complete": guild.chunked,
+        "member_count": mask.bit_count(),
+        "bot_count": (mask & snapshot.bots).bit_count(),
+        "no_role_count": (mask & ~snapshot.any_role).bit_count(),
+        "pending_count": (mask & snapshot.pending).bit_count(),
+        "boosting_count": (mask & snapshot.boosting).bit_count(),
+        "default_avatar_count": (mask & snapshot.default_avatar).bit_count(),
+        "timed_out_count": snapshot.timed_out(now, mask),
+        "joined": {
+            f"last_{days}d": _window(snapshot, mask, now - days * _DAY, math.inf)
+            for days in (1, 7, 30)
+        },
+        "join_histogram": histogram,
+        "account_created": {
+            f"last_{days}d": snapshot.created_since(now - days * _DAY, mask)
+            for days in (1, 7, 30, 365)
+        },
+        "role_distribution": roles[: max(0, top_roles)],
+    }
 
 
 async def edit_member(
@@ -1,12 +1,24 @@
+import base64
+import binascii
+import fnmatch
+import io
+import re
+from pathlib import Path
 from typing import Any, Optional
 
 import discord
 
+from discord_mcp.config import settings
 from discord_mcp.mcp.context import get_current_session, update_bot_status, clear_bot_status
+from discord_mcp.tools.templates import get_message_template, render_placeholders
+from discord_mcp.utils.concurrency import gather_limited
 from discord_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+MESSAGE_CHAR_LIMIT = 2000
+_CODE_FENCE = "```"
+
 
 async def _with_status(activity: str):
     """Helper to update bot status."""
@@ -39,15 +51,209 @@ def _handle_discord_error(e: discord.HTTPException) -> None:
         )
 
 
+def _get_partial_message(
+    client: discord.Client,
+    channel_id: str,
+    message_id: str,
+    exception_type: Optional[type[Exception]] = None,
+) -> discord.PartialMessage:
+    """Build a message handle from IDs alone, without fetching the message.
+
+    ``exception_type`` lets other tool modules raise their own exception for channels
+    without messages; it defaults to ``MessageException``.
+    """
+    channel = client.get_channel(int(channel_id))
+    if not channel:
+        channel = client.get_partial_messageable(int(channel_id))
+
+    if not hasattr(channel, "get_partial_message"):
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise (exception_type or MessageException)(
+            f"Channel {channel_id} does not support messages",
+            details={"channel_id": channel_id, "type": str(channel.type)},
+        )
+
+    return channel.get_partial_message(int(message_id))
+
+
+def _channel_template_variables(channel: discord.abc.Messageable) -> dict[str, str]:
+    guild = getattr(channel, "guild", None)
+    return {
+        "channel_id": str(channel.id),
+        "channel_name": getattr(channel, "name", None) or "",
+        "channel_mention": f"<#{channel.id}>",
+        "guild_id": str(guild.id) if guild else "",
+        "guild_name": guild.name if guild else "",
+    }
+
+
+def _update_fence(text: str, fence: Optional[str]) -> Optional[str]:
+    """Return the code fence left open after ``text`` (e.g. ``"```py"``), or None."""
+    for line in text.splitlines():
+        stripped = line.lstrip()
+        if not stripped.startswith(_CODE_FENCE) or stripped.count(_CODE_FENCE) % 2 == 0:
+            continue
+        if fence:
+            fence = None
+        else:
+            language = stripped[len(_CODE_FENCE) :].split()
+            fence = _CODE_FENCE + (language[0][:32] if language else "")
+    return fence
+
+
+def _split_content(content: str, limit: int = MESSAGE_CHAR_LIMIT) -> list[str]:
+    """Split content into message-sized chunks on paragraph, then line boundaries.
+
+    Code blocks cut by a chunk boundary are closed and reopened with the same language
+    so every chunk renders on its own.
+    """
+    if len(content) <= limit:
+        return [content]
+
+    # Leave room for closing and reopening a code fence around each chunk.
+    unit_limit = limit - 64
+    units: list[str] = []
+    for paragraph in re.split(r"(?<=\n\n)", content):
+        if len(paragraph) <= unit_limit:
+            units.append(paragraph)
+            continue
+        for line in paragraph.splitlines(keepends=True):
+            while len(line) > unit_limit:
+                cut = line.rfind(" ", 0, unit_limit) + 1 or unit_limit
+                units.append(line[:cut])
+                line = line[cut:]
+            if line:
+                units.append(line)
+
+    chunks: list[str] = []
+    current = ""
+    fence: Optional[str] = None
+    for unit in units:
+        if current and len(current) + len(unit) + len(_CODE_FENCE) + 1 > limit:
+            if fence:
+                chunks.append(current.rstrip("\n") + "\n" + _CODE_FENCE)
+                current = fence + "\n"
+            else:
+                chunks.append(current)
+                current = ""
+        current += unit
+        fence = _update_fence(unit, fence)
+    chunks.append(current)
+
+    return [chunk.strip("\n") for chunk in chunks if chunk.strip()]
+
+
+def _resolve_attachment_path(path: str) -> Path:
+    from discord_mcp.discord.exceptions import MessageException
+
+    if not settings.discord.attachment_dir:
+        raise MessageException(
+            "Server-side attachment paths are disabled (attachment_dir is not configured)",
+            details={"path": path},
+        )
+
+    root = Path(settings.discord.attachment_dir).resolve()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise MessageException(
+            f"Attachment path {path} is outside the attachment directory",
+            details={"path": path},
+        )
+    if not resolved.is_file():
+        raise MessageException(f"Attachment file {path} not found", details={"path": path})
+    return resolved
+
+
+def _build_files(attachments: list[dict[str, Any]], size_limit: int) -> list[discord.File]:
+    """Build upload handles, checking the cumulative size before any file is opened.
+
+    Path attachments are handed to discord.py as paths, so the file is streamed from disk
+    during upload rather than read into memory.
+    """
+    from discord_mcp.discord.exceptions import MessageException
+
+    files: list[discord.File] = []
+    total_size = 0
+    try:
+        for index, attachment in enumerate(attachments):
+            filename = attachment.get("filename")
+            path = attachment.get("path")
+            data = attachment.get("data_base64")
+            if path:
+                resolved = _resolve_attachment_path(path)
+                size = resolved.stat().st_size
+                filename = filename or resolved.name
+            elif data:
+                if not filename:
+                    raise MessageException(
+                        "filename is required for base64 attachments",
+                        details={"attachment_index": index},
+                    )
+                # Upper bound of the decoded size, checked before decoding.
+                size = len(data) * 3 // 4
+            else:
+                raise MessageException(
+                    "Each attachment needs either a path or data_base64",
+                    details={"attachment_index": index},
+                )
+
+            total_size += size
+            if total_size > size_limit:
+                raise MessageException(
+                    f"Attachments exceed the upload limit of {size_limit} bytes",
+                    details={"size_limit": size_limit, "filename": filename},
+                )
+
+            if path:
+                source: Any = str(resolved)
+            else:
+                try:
+                    source = io.BytesIO(base64.b64decode(data, validate=True))
+                except binascii.Error:
+                    raise MessageException(
+                        f"Attachment {filename} is not valid base64",
+                        details={"filename": filename},
+                    )
+
+            files.append(
+                discord.File(
+                    source,
+                    filename=filename,
+                    spoiler=bool(attachment.get("spoiler", False)),
+                    description=attachment.get("description"),
+                )
+            )
+    except Exception:
+        for file in files:
+            file.close()
+        raise
+
+    return files
+
+
 async def send_message(
     channel_id: str,
-    content: str,
+    content: Optional[str] = None,
     tts: bool = False,
     embeds: Optional[list[dict[str, Any]]] = None,
     allowed_mentions: Optional[dict[str, list[str]]] = None,
     message_reference: Optional[dict[str, str]] = None,
     components: Optional[list[dict[str, Any]]] = None,
+    attachments: Optional[list[dict[str, Any]]] = None,
+    template: Optional[str] = None,
+    template_variables: Optional[dict[str, str]] = None,
 ) -> dict[str, Any]:
+    """Send a message, splitting content over the 2000 character limit into a chain.
+
+    Each attachment is ``{"path": ...}`` (relative to the configured attachment
+    directory) or ``{"filename": ..., "data_base64": ...}``, with optional
+    ``description`` and ``spoiler``. Embeds and attachments go on the last message of
+    the chain; the reply reference goes on the first.
+
+    ``template`` names a registered message template; explicit arguments override its
+    parts and ``template_variables`` fill its placeholders.
+    """
     session = await get_current_session()
     client = session.client
 
@@ -85,6 +291,25 @@ async def send_message(
             roles=allowed_mentions.get("roles", []),
         )
 
+    if template:
+        message_template = get_message_template(session, template)
+        variables = {**_channel_template_variables(channel), **(template_variables or {})}
+        if content is None:
+            content = message_template.render_content(variables)
+        if embed_objects is None:
+            embed_objects = message_template.render_embeds(variables) or None
+        if allowed_mentions_obj is None:
+            allowed_mentions_obj = message_template.allowed_mentions
+        tts = tts or message_template.tts
+
+    if not content and not embed_objects and not attachments:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            "Message needs content, embeds, attachments or a template",
+            details={"channel_id": channel_id},
+        )
+
     reference = None
     if message_reference:
         reference = discord.MessageReference(
@@ -95,27 +320,54 @@ async def send_message(
             else None,
         )
 
-    # Components need special handling - skip for now to avoid errors
-    send_kwargs: dict[str, Any] = {
-        "content": content,
-        "tts": tts,
-        "allowed_mentions": allowed_mentions_obj,
-        "reference": reference,
-    }
+    guild = getattr(channel, "guild", None)
+    size_limit = guild.filesize_limit if guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+    files = _build_files(attachments, size_limit) if attachments else []
 
-    if embeds:
-        if len(embeds) == 1:
-            send_kwargs["embed"] = embed_objects[0]
-        else:
-            send_kwargs["embeds"] = embed_objects
-
-    message = await channel.send(**send_kwargs)
+    chunks = _split_content(content or "")
+    sent_messages: list[discord.Message] = []
+    try:
+        for index, chunk in enumerate(chunks):
+            # Components need special handling - skip for now to avoid errors
+            send_kwargs: dict[str, Any] = {
+                "content": chunk,
+                "tts": tts,
+                "allowed_mentions": allowed_mentions_obj,
+            }
+            if index == 0:
+                send_kwargs["reference"] = reference
+            if index == len(chunks) - 1:
+                if embed_objects:
+                    if len(embed_objects) == 1:
+                        send_kwargs["embed"] = embed_objects[0]
+                    else:
+                        send_kwargs["embeds"] = embed_objects
+                if files:
+                    send_kwargs["files"] = files
+
+            sent_messages.append(await channel.send(**send_kwargs))
+    finally:
+        for file in files:
+            file.close()
+
+    message = sent_messages[0]
 
     await update_bot_status(f"Sending message", "playing")
 
-    logger.info("message_sent", message_id=str(message.id), channel_id=channel_id)
+    logger.info(
+        "message_sent",
+        message_id=str(message.id),
+        channel_id=channel_id,
+        chunk_count=len(sent_messages),
+        attachment_count=len(files),
+    )
 
     return {
+        "message_ids": [str(m.id) for m in sent_messages],
+        "attachments": [
+            {"id": str(a.id), "filename": a.filename, "size": a.size, "url": a.url}
+            for a in sent_messages[-1].attachments
+        ],
         "id": str(message.id),
         "channel_id": str(message.channel.id),
         "content": message.content,
@@ -128,15 +380,28 @@ async def send_message(
     }
 
 
-async def edit_message(
-    channel_id: str,
-    message_id: str,
+async def send_message_batch(
     content: Optional[str] = None,
+    channel_ids: Optional[list[str]] = None,
+    guild_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    name_pattern: Optional[str] = None,
+    tts: bool = False,
     embeds: Optional[list[dict[str, Any]]] = None,
-    flags: Optional[int] = None,
     allowed_mentions: Optional[dict[str, list[str]]] = None,
-    components: Optional[list[dict[str, Any]]] = None,
+    template: Optional[str] = None,
+    template_variables: Optional[dict[str, str]] = None,
 ) -> dict[str, Any]:
+    """Send one templated message to many channels concurrently.
+
+    Targets are the explicit ``channel_ids`` plus, when ``guild_id`` is given, every text
+    channel of that guild matching ``category_id``/``name_pattern`` that the bot can send
+    in. ``content`` may use ``{channel_name}``, ``{channel_mention}``, ``{channel_id}``,
+    ``{guild_name}`` and ``{guild_id}``.
+
+    ``template`` names a registered message template used for any part not given
+    explicitly; ``template_variables`` are merged over the per-channel variables.
+    """
     session = await get_current_session()
     client = session.client
 
@@ -145,24 +410,134 @@ async def edit_message(
 
         raise SessionException("Client not initialized")
 
-    channel = client.get_channel(int(channel_id))
-    if not channel:
+    if not channel_ids and not guild_id:
         from discord_mcp.discord.exceptions import MessageException
 
         raise MessageException(
-            f"Channel {channel_id} not found",
-            details={"channel_id": channel_id},
+            "Either channel_ids or guild_id must be provided",
+            details={"channel_ids": channel_ids, "guild_id": guild_id},
         )
 
-    try:
-        message = await channel.fetch_message(int(message_id))
-    except discord.NotFound:
+    message_template = get_message_template(session, template) if template else None
+    if content is None and message_template is None:
         from discord_mcp.discord.exceptions import MessageException
 
-        raise MessageException(
-            f"Message {message_id} not found",
-            details={"message_id": message_id},
+        raise MessageException("Either content or template must be provided")
+
+    # Keyed by channel ID so a channel listed twice, or both listed and matched by the
+    # guild filter, gets the message only once.
+    targets: dict[str, Optional[discord.abc.Messageable]] = {}
+    for channel_id in channel_ids or []:
+        channel = client.get_channel(int(channel_id))
+        if not isinstance(channel, discord.abc.Messageable):
+            channel = None
+        targets.setdefault(str(int(channel_id)), channel)
+
+    if guild_id:
+        guild = client.get_guild(int(guild_id))
+        if not guild:
+            from discord_mcp.discord.exceptions import MessageException
+
+            raise MessageException(
+                f"Guild {guild_id} not found",
+                details={"guild_id": guild_id},
+            )
+
+        for channel in guild.text_channels:
+            if category_id and str(channel.category_id) != category_id:
+                continue
+            if name_pattern and not fnmatch.fnmatch(channel.name, name_pattern):
+                continue
+            if not channel.permissions_for(guild.me).send_messages:
+                continue
+            targets.setdefault(str(channel.id), channel)
+
+    # Built once and shared by every send.
+    embed_objects = [discord.Embed.from_dict(e) for e in embeds] if embeds else None
+    allowed_mentions_obj = None
+    if allowed_mentions:
+        allowed_mentions_obj = discord.AllowedMentions(
+            everyone=allowed_mentions.get("everyone", False),
+            users=allowed_mentions.get("users", []),
+            roles=allowed_mentions.get("roles", []),
         )
+    if message_template:
+        if allowed_mentions_obj is None:
+            allowed_mentions_obj = message_template.allowed_mentions
+        tts = tts or message_template.tts
+
+    async def send_one(
+        target: tuple[str, Optional[discord.abc.Messageable]],
+    ) -> list[Any]:
+        channel_id, channel = target
+        if channel is None:
+            return [channel_id, "failed", None, "Channel not found or not messageable"]
+
+        variables = {**_channel_template_variables(channel), **(template_variables or {})}
+        if content is not None:
+            rendered_content = render_placeholders(content, variables)
+        else:
+            rendered_content = message_template.render_content(variables)
+        rendered_embeds = embed_objects
+        if rendered_embeds is None and message_template:
+            rendered_embeds = message_template.render_embeds(variables)
+
+        send_kwargs: dict[str, Any] = {
+            "content": rendered_content,
+            "tts": tts,
+            "allowed_mentions": allowed_mentions_obj,
+        }
+        if rendered_embeds:
+            send_kwargs["embeds"] = rendered_embeds
+
+        try:
+            message = await channel.send(**send_kwargs)
+        except discord.HTTPException as e:
+            return [channel_id, "failed", None, str(e)]
+        return [channel_id, "sent", str(message.id), None]
+
+    await _with_status("Sending batch messages")
+
+    rows = await gather_limited(list(targets.items()), send_one)
+    sent_count = sum(1 for row in rows if row[1] == "sent")
+
+    logger.info(
+        "message_batch_sent",
+        target_count=len(rows),
+        sent_count=sent_count,
+        failed_count=len(rows) - sent_count,
+    )
+
+    return {
+        "total": len(rows),
+        "sent": sent_count,
+        "failed": len(rows) - sent_count,
+        "columns": ["channel_id", "status", "message_id", "error"],
+        "rows": rows,
+    }
+
+
+async def edit_message(
+    channel_id: str,
+    message_id: str,
+    content: Optional[str] = None,
+    embeds: Optional[list[dict[str, Any]]] = None,
+    flags: Optional[int] = None,
+    allowed_mentions: Optional[dict[str, list[str]]] = None,
+    components: Optional[list[dict[str, Any]]] = None,
+    minimal_response: bool = False,
+    template: Optional[str] = None,
+    template_variables: Optional[dict[str, str]] = None,
+) -> dict[str, Any]:
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    partial = _get_partial_message(client, channel_id, message_id)
 
     embed_objects = None
     if embeds:
@@ -176,6 +551,16 @@ async def edit_message(
             roles=allowed_mentions.get("roles", []),
         )
 
+    if template:
+        message_template = get_message_template(session, template)
+        variables = template_variables or {}
+        if content is None:
+            content = message_template.render_content(variables)
+        if embed_objects is None and message_template.embeds:
+            embed_objects = message_template.render_embeds(variables)
+        if allowed_mentions_obj is None:
+            allowed_mentions_obj = message_template.allowed_mentions
+
     component_objects = None
     if components:
         component_objects = [discord.Component.from_dict(c) for c in components]
@@ -192,11 +577,30 @@ async def edit_message(
     if component_objects is not None:
         kwargs["components"] = component_objects
 
-    await message.edit(**kwargs)
+    # The PATCH response already carries the updated message, so no prior fetch is needed.
+    try:
+        message = await partial.edit(**kwargs)
+    except discord.NotFound:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Message {message_id} not found",
+            details={"message_id": message_id},
+        )
+    except discord.HTTPException as e:
+        _handle_discord_error(e)
+        raise
 
     await _with_status(f"Editing message")
     logger.info("message_edited", message_id=message_id, channel_id=channel_id)
 
+    if minimal_response:
+        return {
+            "success": True,
+            "message_id": message_id,
+            "channel_id": channel_id,
+        }
+
     return {
         "id": str(message.id),
         "channel_id": str(message.channel.id),
@@ -216,17 +620,10 @@ async def delete_message(
 
         raise SessionException("Client not initialized")
 
-    channel = client.get_channel(int(channel_id))
-    if not channel:
-        from discord_mcp.discord.exceptions import MessageException
-
-        raise MessageException(
-            f"Channel {channel_id} not found",
-            details={"channel_id": channel_id},
-        )
+    partial = _get_partial_message(client, channel_id, message_id)
 
     try:
-        message = await channel.fetch_message(int(message_id))
+        await partial.delete()
     except discord.NotFound:
         from discord_mcp.discord.exceptions import MessageException
 
@@ -234,8 +631,9 @@ async def delete_message(
             f"Message {message_id} not found",
             details={"message_id": message_id},
         )
-
-    await message.delete()
+    except discord.HTTPException as e:
+        _handle_discord_error(e)
+        raise
 
     await _with_status(f"Deleting message")
     logger.info("message_deleted", message_id=message_id, channel_id=channel_id)
@@ -1,13 +1,25 @@
-from datetime import datetime, timedelta
+import re
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 
 import discord
 
 from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.utils.concurrency import gather_limited
 from discord_mcp.utils.logging import get_logger
+from discord_mcp.utils.storage import data_path, read_json, write_json
 
 logger = get_logger(__name__)
 
+# Discord's bulk-ban endpoint accepts at most this many users per request.
+BULK_BAN_CHUNK_SIZE = 200
+MAX_TIMEOUT_SECONDS = 28 * 24 * 60 * 60
+_MASS_ACTIONS = ("ban", "kick", "timeout", "remove_timeout")
+_SAMPLE_SIZE = 100
+
 
 async def _with_status(activity: str):
     """Helper to update bot status."""
@@ -205,9 +217,9 @@ async def ban_user(
         )
 
     try:
-        user = await client.fetch_user(int(user_id))
+        # The ban endpoint only needs the ID; fetching the user first is a wasted request.
         await guild.ban(
-            user=user,
+            user=discord.Object(id=int(user_id)),
             delete_message_seconds=delete_message_seconds,
             reason=reason,
         )
@@ -252,8 +264,7 @@ async def unban_user(user_id: str, guild_id: str, reason: Optional[str] = None)
         )
 
     try:
-        user = await client.fetch_user(int(user_id))
-        await guild.unban(user, reason=reason)
+        await guild.unban(discord.Object(id=int(user_id)), reason=reason)
     except discord.NotFound:
         from discord_mcp.discord.exceptions import ModerationException
 
@@ -276,6 +287,198 @@ async def unban_user(user_id: str, guild_id: str, reason: Optional[str] = None)
     }
 
 
+async def moderate_members(
+    guild: discord.Guild,
+    user_ids: list[int],
+    action: str,
+    reason: Optional[str] = None,
+    delete_message_seconds: int = 0,
+    duration_seconds: Optional[int] = None,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+) -> dict[int, dict[str, Any]]:
+    """Apply one moderation action to many users; the outcome per user ID.
+
+    Shared by ``mass_moderate`` and the raid responder, so it needs no MCP session.
+    Errors become per-user failures; only a permission error before any ban is raised.
+    """
+    results: dict[int, dict[str, Any]] = {}
+    protected = {guild.owner_id, guild.me.id if guild.me else None}
+    targets: list[int] = []
+    for user_id in dict.fromkeys(user_ids):
+        if user_id in protected:
+            results[user_id] = {"status": "skipped", "error": "Guild owner or bot"}
+        else:
+            targets.append(user_id)
+
+    total = len(targets)
+    done = 0
+
+    async def report() -> None:
+        if progress:
+            await progress(done, total, f"{done}/{total} users processed")
+
+    if action == "ban":
+        for start in range(0, total, BULK_BAN_CHUNK_SIZE):
+            chunk = targets[start : start + BULK_BAN_CHUNK_SIZE]
+            try:
+                outcome = await guild.bulk_ban(
+                    [discord.Object(id=user_id) for user_id in chunk],
+                    reason=reason,
+                    delete_message_seconds=delete_message_seconds,
+                )
+            except discord.Forbidden as e:
+                if start == 0:
+                    # Nothing was banned, so surface the permission error itself.
+                    _handle_discord_error(e)
+                    raise
+                # Every further chunk would fail the same way; keep the earlier outcomes.
+                for user_id in targets[start:]:
+                    results[user_id] = {"status": "failed", "error": str(e)}
+                done = total
+                await report()
+                break
+            except discord.HTTPException as e:
+                # Discord rejects the whole request when no user in it could be banned.
+                for user_id in chunk:
+                    results[user_id] = {"status": "failed", "error": str(e)}
+            else:
+                for user in outcome.banned:
+                    results[user.id] = {"status": "banned"}
+                for user in outcome.failed:
+                    results[user.id] = {
+                        "status": "failed",
+                        "error": "Already banned or not bannable",
+                    }
+            done += len(chunk)
+            await report()
+    else:
+        until = (
+            discord.utils.utcnow() + timedelta(seconds=duration_seconds)
+            if action == "timeout"
+            else None
+        )
+
+        async def moderate(user_id: int) -> None:
+            nonlocal done
+            member = guild.get_member(user_id)
+            try:
+                if member is None:
+                    results[user_id] = {"status": "failed", "error": "Not a member"}
+                elif action == "kick":
+                    await member.kick(reason=reason)
+                    results[user_id] = {"status": "kicked"}
+                else:
+                    await member.timeout(until, reason=reason)
+                    results[user_id] = {"status": "timed_out" if until else "timeout_removed"}
+            except discord.HTTPException as e:
+                results[user_id] = {"status": "failed", "error": str(e)}
+            done += 1
+            if done % BULK_BAN_CHUNK_SIZE == 0 or done == total:
+                await report()
+
+        await gather_limited(targets, moderate)
+
+    return results
+
+
+async def mass_moderate(
+    guild_id: str,
+    user_ids: list[str],
+    action: str,
+    reason: Optional[str] = None,
+    delete_message_seconds: int = 0,
+    duration_seconds: Optional[int] = None,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+) -> dict[str, Any]:
+    """Ban, kick, time out or un-time-out many users, returning an outcome per user.
+
+    Bans go through the bulk-ban endpoint in chunks of ``BULK_BAN_CHUNK_SIZE`` and do not
+    require the users to be members. Kicks and timeouts act on cached members and run
+    concurrently. The guild owner and the bot itself are always skipped.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+
+    action = action.lower()
+    if action not in _MASS_ACTIONS:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Invalid action: {action}. Must be one of {', '.join(_MASS_ACTIONS)}",
+            details={"action": action},
+        )
+
+    if action == "timeout" and not (
+        duration_seconds and 0 < duration_seconds <= MAX_TIMEOUT_SECONDS
+    ):
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"duration_seconds must be between 1 and {MAX_TIMEOUT_SECONDS} for timeouts",
+            details={"duration_seconds": duration_seconds},
+        )
+
+    invalid = [user_id for user_id in user_ids if not user_id.isdigit()]
+    if invalid:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            "user_ids must be numeric Discord IDs",
+            details={"invalid_user_ids": invalid[:50]},
+        )
+
+    await _with_status("Mass moderating members")
+    results = await moderate_members(
+        guild,
+        [int(user_id) for user_id in user_ids],
+        action,
+        reason=reason,
+        delete_message_seconds=delete_message_seconds,
+        duration_seconds=duration_seconds,
+        progress=progress,
+    )
+
+    outcomes = [
+        {"user_id": str(user_id), **results.get(user_id, {"status": "unknown"})}
+        for user_id in dict.fromkeys(int(user_id) for user_id in user_ids)
+    ]
+    counts: dict[str, int] = {}
+    for outcome in outcomes:
+        counts[outcome["status"]] = counts.get(outcome["status"], 0) + 1
+
+    logger.info(
+        "mass_moderation_completed",
+        guild_id=guild_id,
+        action=action,
+        requested=len(outcomes),
+        counts=counts,
+        reason=reason,
+    )
+
+    return {
+        "guild_id": guild_id,
+        "action": action,
+        "requested_count": len(outcomes),
+        "counts": counts,
+        "success": all(o["status"] not in ("failed", "unknown") for o in outcomes),
+        "results": outcomes,
+    }
+
+
 async def enforce_role_policy(
     user_id: str,
     guild_id: str,
@@ -361,7 +564,77 @@ async def enforce_role_policy(
         )
 
 
-async def get_guild_bans(guild_id: str, limit: int = 100) -> list[dict[str, Any]]:
+def _policy_job_path(job_id: str):
+    return data_path("policy_jobs", f"{job_id}.json")
+
+
+def _load_policy_job(job_id: str) -> dict[str, Any]:
+    # Job IDs are token_urlsafe strings; anything else never maps to a file.
+    job = read_json(_policy_job_path(job_id)) if re.fullmatch(r"[\w-]+", job_id) else None
+    if not job:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Role policy job {job_id} not found",
+            details={"job_id": job_id},
+        )
+    return job
+
+
+def _policy_violators(
+    client: discord.Client,
+    guild: discord.Guild,
+    required: set[int],
+    exempt: set[int],
+    include_bots: bool,
+) -> list[int]:
+    index = client.permission_cache.role_members(guild)
+    compliant = set.intersection(*(index.members_of(role_id) for role_id in required))
+    exempted = set().union(*(index.members_of(role_id) for role_id in exempt))
+    violators = index.member_roles.keys() - compliant - exempted - {guild.owner_id}
+    if not include_bots:
+        violators = {
+            member_id
+            for member_id in violators
+            if (member := guild.get_member(member_id)) is not None and not member.bot
+        }
+    return sorted(violators)
+
+
+def _violator_sample(guild: discord.Guild, member_ids: list[int]) -> list[dict[str, Any]]:
+    sample = []
+    for member_id in member_ids[:_SAMPLE_SIZE]:
+        member = guild.get_member(member_id)
+        sample.append(
+            {
+                "user_id": str(member_id),
+                "username": member.name if member else None,
+                "bot": member.bot if member else None,
+            }
+        )
+    return sample
+
+
+async def sweep_role_policy(
+    guild_id: str,
+    required_role_ids: Optional[list[str]] = None,
+    action: str = "kick",
+    reason: Optional[str] = None,
+    exempt_role_ids: Optional[list[str]] = None,
+    include_bots: bool = False,
+    dry_run: bool = True,
+    job_id: Optional[str] = None,
+    batch_size: int = 1000,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+) -> dict[str, Any]:
+    """Enforce a required-roles policy across every cached member of a guild.
+
+    Violators are found with set operations on the role-to-members index. ``dry_run``
+    only reports them. Otherwise a job is checkpointed under ``STORAGE_DATA_DIR/policy_jobs``
+    and each call kicks or bans up to ``batch_size`` violators, rechecking each one first.
+    Pass ``job_id`` with ``dry_run=False`` to resume; with ``dry_run`` it only reports the
+    job's progress.
+    """
     session = await get_current_session()
     client = session.client
 
@@ -370,6 +643,18 @@ async def get_guild_bans(guild_id: str, limit: int = 100) -> list[dict[str, Any]
 
         raise SessionException("Client not initialized")
 
+    if batch_size < 1:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            "batch_size must be greater than 0",
+            details={"batch_size": batch_size},
+        )
+
+    if job_id:
+        job = _load_policy_job(job_id)
+        guild_id = job["guild_id"]
+
     guild = client.get_guild(int(guild_id))
     if not guild:
         from discord_mcp.discord.exceptions import ModerationException
@@ -379,16 +664,337 @@ async def get_guild_bans(guild_id: str, limit: int = 100) -> list[dict[str, Any]
             details={"guild_id": guild_id},
         )
 
-    bans = []
-    async for ban in guild.bans(limit=limit):
-        bans.append(
-            {
-                "user_id": str(ban.user.id),
-                "reason": ban.reason,
+    if not job_id:
+        action = action.lower()
+        if action not in ("kick", "ban"):
+            from discord_mcp.discord.exceptions import ModerationException
+
+            raise ModerationException(
+                f"Invalid action: {action}. Must be 'kick' or 'ban'",
+                details={"action": action},
+            )
+        if not required_role_ids:
+            from discord_mcp.discord.exceptions import ModerationException
+
+            raise ModerationException("required_role_ids must not be empty")
+        unknown = [
+            role_id
+            for role_id in required_role_ids + (exempt_role_ids or [])
+            if not role_id.isdigit() or not guild.get_role(int(role_id))
+        ]
+        if unknown:
+            from discord_mcp.discord.exceptions import ModerationException
+
+            raise ModerationException(
+                f"Roles not found: {', '.join(unknown)}",
+                details={"role_ids": unknown},
+            )
+
+        violators = _policy_violators(
+            client,
+            guild,
+            {int(role_id) for role_id in required_role_ids},
+            {int(role_id) for role_id in exempt_role_ids or []},
+            include_bots,
+        )
+
+        if dry_run:
+            logger.info(
+                "role_policy_swept",
+                guild_id=guild_id,
+                dry_run=True,
+                violator_count=len(violators),
+            )
+            return {
+                "guild_id": guild_id,
+                "dry_run": True,
+                "action": action,
+                "required_role_ids": required_role_ids,
+                "violator_count": len(violators),
+                "cached_member_count": len(guild.members),
+                "member_cache_complete": guild.chunked,
+                "violators": _violator_sample(guild, violators),
             }
+
+        job_id = secrets.token_urlsafe(8)
+        job = {
+            "job_id": job_id,
+            "guild_id": guild_id,
+            "required_role_ids": required_role_ids,
+            "exempt_role_ids": exempt_role_ids or [],
+            "action": action,
+            "reason": reason or "Role policy enforcement: missing required roles",
+            "created_at": time.time(),
+            "total": len(violators),
+            "pending": violators,
+            "actioned": 0,
+            "resolved": 0,
+            "failed": [],
+        }
+        write_json(_policy_job_path(job_id), job)
+    elif dry_run:
+        logger.info("role_policy_swept", guild_id=guild_id, dry_run=True, job_id=job_id)
+        return {
+            "guild_id": guild_id,
+            "dry_run": True,
+            "job_id": job_id,
+            "action": job["action"],
+            "required_role_ids": job["required_role_ids"],
+            "total_count": job["total"],
+            "actioned_count": job["actioned"],
+            "resolved_count": job["resolved"],
+            "failed_count": len(job["failed"]),
+            "remaining_count": len(job["pending"]),
+            "complete": not job["pending"],
+            "violators": _violator_sample(guild, job["pending"]),
+        }
+
+    required = {int(role_id) for role_id in job["required_role_ids"]}
+    exempt = {int(role_id) for role_id in job["exempt_role_ids"]}
+    total = job["total"]
+    batch = job["pending"][:batch_size]
+    processed = 0
+
+    await _with_status("Enforcing role policy")
+    for start in range(0, len(batch), BULK_BAN_CHUNK_SIZE):
+        chunk = batch[start : start + BULK_BAN_CHUNK_SIZE]
+        # Members may have gained the roles or left since the sweep was planned.
+        targets = []
+        for member_id in chunk:
+            member = guild.get_member(member_id)
+            if (
+                member is None
+                or required <= set(member._roles)
+                or not exempt.isdisjoint(member._roles)
+            ):
+                job["resolved"] += 1
+            else:
+                targets.append(member_id)
+
+        results = await moderate_members(guild, targets, job["action"], reason=job["reason"])
+        for member_id, result in results.items():
+            if result["status"] in ("kicked", "banned"):
+                job["actioned"] += 1
+            else:
+                job["failed"].append({"user_id": str(member_id), **result})
+
+        processed += len(chunk)
+        job["pending"] = job["pending"][len(chunk) :]
+        write_json(_policy_job_path(job["job_id"]), job)
+        if progress:
+            done = total - len(job["pending"])
+            await progress(done, total, f"{done}/{total} violators processed")
+
+    remaining = len(job["pending"])
+    logger.info(
+        "role_policy_swept",
+        guild_id=guild_id,
+        dry_run=False,
+        job_id=job["job_id"],
+        processed=processed,
+        remaining=remaining,
+    )
+
+    return {
+        "guild_id": guild_id,
+        "dry_run": False,
+        "job_id": job["job_id"],
+        "action": job["action"],
+        "required_role_ids": job["required_role_ids"],
+        "total_count": total,
+        "processed_this_call": processed,
+        "actioned_count": job["actioned"],
+        "resolved_count": job["resolved"],
+        "failed_count": len(job["failed"]),
+        "failed": job["failed"][:50],
+        "remaining_count": remaining,
+        "complete": remaining == 0,
+    }
+
+
+async def _load_bans(
+    client: discord.Client, guild: discord.Guild, refresh: bool
+) -> dict[int, tuple[str, Optional[str]]]:
+    try:
+        return await client.ban_cache.load(guild, refresh=refresh)
+    except discord.HTTPException as e:
+        _handle_discord_error(e)
+        raise
+
+
+async def get_guild_bans(
+    guild_id: str,
+    limit: int = 100,
+    after: Optional[str] = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """Page through a guild's bans in user ID order, ``after`` being the last ID returned.
+
+    The full list is read once and then kept current from ban events; ``refresh``
+    re-reads it, e.g. to pick up reasons of bans made since the first read.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
         )
 
-    return bans
+    bans = await _load_bans(client, guild, refresh)
+    rows, has_more = client.ban_cache.page(
+        guild.id, after=int(after) if after else 0, limit=max(1, min(limit, 1000))
+    )
+
+    return {
+        "guild_id": guild_id,
+        "ban_count": len(bans),
+        "returned_count": len(rows),
+        "has_more": has_more,
+        "next_cursor": str(rows[-1][0]) if has_more else None,
+        "bans": [
+            {"user_id": str(user_id), "username": username, "reason": reason}
+            for user_id, username, reason in rows
+        ],
+    }
+
+
+async def export_guild_bans(guild_id: str, refresh: bool = False) -> dict[str, Any]:
+    """Write the guild's full ban list to ``STORAGE_DATA_DIR/ban_exports/<guild_id>.json``."""
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+
+    bans = await _load_bans(client, guild, refresh)
+    path = data_path("ban_exports", f"{guild.id}.json")
+    write_json(
+        path,
+        {
+            "guild_id": guild_id,
+            "exported_at": time.time(),
+            "ban_count": len(bans),
+            # [user_id, username, reason] rows in user ID order.
+            "bans": [[str(user_id), *bans[user_id]] for user_id in sorted(bans)],
+        },
+    )
+
+    await _with_status("Exporting bans")
+    logger.info("bans_exported", guild_id=guild_id, ban_count=len(bans))
+
+    return {
+        "guild_id": guild_id,
+        "ban_count": len(bans),
+        "path": str(path),
+    }
+
+
+async def sync_guild_bans(
+    source_guild_id: str,
+    target_guild_id: str,
+    dry_run: bool = True,
+    reason: Optional[str] = None,
+    delete_message_seconds: int = 0,
+    refresh: bool = False,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+) -> dict[str, Any]:
+    """Diff two guilds' ban lists and, unless ``dry_run``, ban the missing users in the target.
+
+    Bans only present in the target are reported but never lifted.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guilds = []
+    for guild_id in (source_guild_id, target_guild_id):
+        guild = client.get_guild(int(guild_id))
+        if not guild:
+            from discord_mcp.discord.exceptions import ModerationException
+
+            raise ModerationException(
+                f"Guild {guild_id} not found",
+                details={"guild_id": guild_id},
+            )
+        guilds.append(guild)
+    source, target = guilds
+
+    source_bans = await _load_bans(client, source, refresh)
+    target_bans = await _load_bans(client, target, refresh)
+    missing = sorted(source_bans.keys() - target_bans.keys())
+    extra = sorted(target_bans.keys() - source_bans.keys())
+
+    result: dict[str, Any] = {
+        "source_guild_id": source_guild_id,
+        "target_guild_id": target_guild_id,
+        "dry_run": dry_run,
+        "source_ban_count": len(source_bans),
+        "target_ban_count": len(target_bans),
+        "missing_in_target_count": len(missing),
+        "only_in_target_count": len(extra),
+        "missing_in_target": [
+            {"user_id": str(user_id), "username": source_bans[user_id][0]}
+            for user_id in missing[:_SAMPLE_SIZE]
+        ],
+        "only_in_target": [
+            {"user_id": str(user_id), "username": target_bans[user_id][0]}
+            for user_id in extra[:_SAMPLE_SIZE]
+        ],
+    }
+    if dry_run or not missing:
+        return result
+
+    await _with_status("Syncing bans")
+    outcomes = await moderate_members(
+        target,
+        missing,
+        "ban",
+        reason=reason or f"Ban synced from guild {source.name}",
+        delete_message_seconds=delete_message_seconds,
+        progress=progress,
+    )
+    failed = [
+        {"user_id": str(user_id), **outcome}
+        for user_id, outcome in outcomes.items()
+        if outcome["status"] != "banned"
+    ]
+    logger.info(
+        "bans_synced",
+        source_guild_id=source_guild_id,
+        target_guild_id=target_guild_id,
+        banned=len(outcomes) - len(failed),
+        failed=len(failed),
+    )
+
+    result["banned_count"] = len(outcomes) - len(failed)
+    result["failed_count"] = len(failed)
+    result["failed"] = failed[:50]
+    return result
 
 
 async def get_member_timeout_status(user_id: str, guild_id: str) -> dict[str, Any]:
@@ -427,3 +1033,51 @@ async def get_member_timeout_status(user_id: str, guild_id: str) -> dict[str, An
         "is_timed_out": is_timed_out,
         "timeout_until": timeout_until.isoformat() if timeout_until else None,
     }
+
+
+async def list_timed_out_members(guild_id: str, limit: int = 100) -> dict[str, Any]:
+    """Members currently timed out, soonest expiry first.
+
+    Served from a per-guild heap kept current by member updates, so the cost scales with
+    the number of timeouts rather than the guild size.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+
+    limit = max(1, min(limit, 1000))
+    timed_out = client.timeout_index.timed_out(guild)
+
+    members = []
+    for member_id, until in timed_out[:limit]:
+        member = guild.get_member(member_id)
+        members.append(
+            {
+                "user_id": str(member_id),
+                "username": member.name if member else None,
+                "display_name": member.display_name if member else None,
+                "timeout_until": datetime.fromtimestamp(until, UTC).isoformat(),
+            }
+        )
+
+    return {
+        "guild_id": guild_id,
+        # Without a chunked member list, members never seen by the bot are missing.
+        "member_cache_complete": client.timeout_index.is_complete(guild.id),
+        "timed_out_count": len(timed_out),
+        "returned_count": len(members),
+        "members": members,
+    }
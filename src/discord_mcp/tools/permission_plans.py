@@ -0,0 +1,522 @@
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.discord.permission_cache import PermissionCache
+from discord_mcp.discord.permission_engine import (
+    PERMISSION_FLAGS,
+    VIEW_CHANNEL,
+    GuildPermissionTable,
+)
+from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.tools.permissions import _current_overwrite, _resolve_target
+from discord_mcp.utils.concurrency import gather_ordered_by_key
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+
+async def _with_status(activity: str):
+    await update_bot_status(activity, "playing")
+
+
+def _plan_error(message: str, **details: Any):
+    from discord_mcp.discord.exceptions import PermissionException
+
+    return PermissionException(message, details=details)
+
+
+def _parse_bits(value: Any, name: str) -> int:
+    if value is None or value == "":
+        return 0
+    try:
+        bits = int(value)
+    except (TypeError, ValueError):
+        raise _plan_error(f"Invalid {name} value: {value}", **{name: value})
+    if bits < 0:
+        raise _plan_error(f"Invalid {name} value: {value}", **{name: value})
+    return bits
+
+
+def _get_guild(client: discord.Client, guild_id: str) -> discord.Guild:
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        raise _plan_error(f"Guild {guild_id} not found", guild_id=guild_id)
+    return guild
+
+
+def _overwrite_dict(pair: Optional[tuple[int, int]]) -> Optional[dict[str, str]]:
+    if pair is None:
+        return None
+    return {"allow": str(pair[0]), "deny": str(pair[1])}
+
+
+def _plan_role_mutations(
+    guild: discord.Guild, roles: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], int]:
+    mutations: list[dict[str, Any]] = []
+    unchanged = 0
+    seen: set[int] = set()
+    for entry in roles:
+        role_id = str(entry.get("role_id", ""))
+        role = guild.get_role(int(role_id)) if role_id.isdigit() else None
+        if not role:
+            raise _plan_error(f"Role {role_id} not found", role_id=role_id)
+        if role.id in seen:
+            raise _plan_error(f"Role {role_id} appears more than once", role_id=role_id)
+        seen.add(role.id)
+
+        desired = _parse_bits(entry.get("permissions"), "permissions")
+        if role.permissions.value == desired:
+            unchanged += 1
+            continue
+        mutations.append(
+            {
+                "kind": "role_permissions",
+                "bucket": f"guild:{guild.id}",
+                "role_id": str(role.id),
+                "role_name": role.name,
+                "before": str(role.permissions.value),
+                "after": str(desired),
+            }
+        )
+    return mutations, unchanged
+
+
+def _plan_overwrite_mutations(
+    guild: discord.Guild, overwrites: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], int]:
+    changes_by_channel: dict[int, list[dict[str, Any]]] = {}
+    channels: dict[int, discord.abc.GuildChannel] = {}
+    unchanged = 0
+    seen: set[tuple[int, int]] = set()
+
+    for entry in overwrites:
+        channel_id = str(entry.get("channel_id", ""))
+        channel = guild.get_channel(int(channel_id)) if channel_id.isdigit() else None
+        if not channel:
+            raise _plan_error(
+                f"Channel {channel_id} not found in guild {guild.id}",
+                channel_id=channel_id,
+            )
+        target_type = entry.get("target_type", "role")
+        target = _resolve_target(guild, str(entry.get("target_id", "")), target_type)
+        if (channel.id, target.id) in seen:
+            raise _plan_error(
+                f"Overwrite for {target.id} in channel {channel.id} appears more than once",
+                channel_id=channel_id,
+                target_id=str(target.id),
+            )
+        seen.add((channel.id, target.id))
+
+        current = _current_overwrite(channel, target.id)
+        if entry.get("remove"):
+            desired = None
+        else:
+            desired = (
+                _parse_bits(entry.get("allow"), "allow"),
+                _parse_bits(entry.get("deny"), "deny"),
+            )
+        if current == desired:
+            unchanged += 1
+            continue
+
+        channels[channel.id] = channel
+        changes_by_channel.setdefault(channel.id, []).append(
+            {
+                "target_id": str(target.id),
+                "target_type": target_type,
+                "action": "remove" if desired is None else "set",
+                "before": _overwrite_dict(current),
+                "after": _overwrite_dict(desired),
+            }
+        )
+
+    mutations = [
+        {
+            "kind": "channel_overwrites",
+            "bucket": f"channel:{channel_id}",
+            "channel_id": str(channel_id),
+            "channel_name": channels[channel_id].name,
+            "changes": changes,
+        }
+        for channel_id, changes in changes_by_channel.items()
+    ]
+    return mutations, unchanged
+
+
+async def plan_permission_changes(
+    guild_id: str,
+    roles: Optional[list[dict[str, Any]]] = None,
+    overwrites: Optional[list[dict[str, Any]]] = None,
+) -> dict[str, Any]:
+    """Diff a desired permission state against the guild and store the resulting plan.
+
+    ``roles`` entries are ``{"role_id", "permissions"}``; ``overwrites`` entries are
+    ``{"channel_id", "target_id", "target_type", "allow", "deny"}`` or ``"remove": true``.
+    Entries that already match produce no mutation, and all overwrite changes for one
+    channel collapse into a single mutation. A plan with nothing to change is not stored
+    and has no ``plan_id``.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    if not roles and not overwrites:
+        raise _plan_error("Provide roles and/or overwrites to plan")
+
+    guild = _get_guild(client, guild_id)
+    role_mutations, unchanged_roles = _plan_role_mutations(guild, roles or [])
+    overwrite_mutations, unchanged_overwrites = _plan_overwrite_mutations(
+        guild, overwrites or []
+    )
+    mutations = role_mutations + overwrite_mutations
+
+    # Only stored plans get an ID, so every returned ID can be applied or discarded.
+    plan_id = secrets.token_urlsafe(8) if mutations else None
+    plan = {
+        "plan_id": plan_id,
+        "guild_id": guild_id,
+        "created_at": time.time(),
+        # Each mutation is exactly one API call.
+        "mutation_count": len(mutations),
+        "unchanged_role_count": unchanged_roles,
+        "unchanged_overwrite_count": unchanged_overwrites,
+        "mutations": mutations,
+    }
+    if plan_id:
+        session.permission_plans[plan_id] = plan
+
+    logger.info(
+        "permission_plan_created",
+        guild_id=guild_id,
+        plan_id=plan_id,
+        mutation_count=len(mutations),
+    )
+
+    return plan
+
+
+def _flag_names(value: int) -> list[str]:
+    return [name for name, flag in PERMISSION_FLAGS if value & flag]
+
+
+def _simulated_table(
+    cache: PermissionCache,
+    guild: discord.Guild,
+    mutations: list[dict[str, Any]],
+    plan_id: Optional[str] = None,
+) -> tuple[GuildPermissionTable, set[int]]:
+    """Apply mutations to a copy of the guild's table; also return members they can touch."""
+    table = cache.table(guild).copy()
+    role_index = cache.role_members(guild)
+    touched_roles: set[int] = set()
+    touched_members: set[int] = set()
+
+    for mutation in mutations:
+        if mutation["kind"] == "role_permissions":
+            role_id = int(mutation["role_id"])
+            table.role_permissions[role_id] = int(mutation["after"])
+            touched_roles.add(role_id)
+            continue
+        index = table.channel_index.get(int(mutation["channel_id"]))
+        if index is None:
+            # A stored plan can outlive the channels it targets.
+            source = f"permission plan {plan_id}" if plan_id else "the requested changes"
+            raise _plan_error(
+                f"Channel {mutation['channel_id']} in {source} no longer exists",
+                plan_id=plan_id,
+                channel_id=mutation["channel_id"],
+            )
+        for change in mutation["changes"]:
+            target_id = int(change["target_id"])
+            is_member = change["target_type"] == "member"
+            after = change["after"]
+            table.set_overwrite(
+                index,
+                target_id,
+                is_member,
+                (int(after["allow"]), int(after["deny"])) if after else None,
+            )
+            (touched_members if is_member else touched_roles).add(target_id)
+
+    if guild.id in touched_roles:
+        return table, {member.id for member in guild.members}
+    for role_id in touched_roles:
+        touched_members.update(role_index.members_of(role_id))
+    return table, touched_members
+
+
+async def simulate_permission_changes(
+    guild_id: str,
+    roles: Optional[list[dict[str, Any]]] = None,
+    overwrites: Optional[list[dict[str, Any]]] = None,
+    plan_id: Optional[str] = None,
+    member_limit: int = 100,
+) -> dict[str, Any]:
+    """Show which channels each member would gain or lose, without calling Discord.
+
+    Takes the same desired-state document as ``plan_permission_changes`` (or the ID of
+    a stored plan), applies it to an in-memory copy of the guild's permission table and
+    re-resolves only the members the change can reach.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    if member_limit < 1:
+        raise _plan_error("member_limit must be greater than 0", member_limit=member_limit)
+
+    guild = _get_guild(client, guild_id)
+    if plan_id:
+        plan = session.permission_plans.get(plan_id)
+        if not plan or plan["guild_id"] != guild_id:
+            raise _plan_error(f"Permission plan {plan_id} not found", plan_id=plan_id)
+        mutations = plan["mutations"]
+    elif roles or overwrites:
+        role_mutations, _ = _plan_role_mutations(guild, roles or [])
+        overwrite_mutations, _ = _plan_overwrite_mutations(guild, overwrites or [])
+        mutations = role_mutations + overwrite_mutations
+    else:
+        raise _plan_error("Provide roles, overwrites or plan_id to simulate")
+
+    cache = client.permission_cache
+    table = cache.table(guild)
+    simulated, member_ids = _simulated_table(cache, guild, mutations, plan_id)
+    members = [
+        member for member in map(guild.get_member, sorted(member_ids)) if member is not None
+    ]
+    before_rows = cache.resolve_members(guild, members)
+    after_rows = simulated.resolve_members(members)
+
+    affected: list[dict[str, Any]] = []
+    affected_count = 0
+    channel_totals: dict[int, dict[str, int]] = {}
+    for member, before_row, after_row in zip(members, before_rows, after_rows):
+        if before_row == after_row:
+            continue
+        changes: list[dict[str, Any]] = []
+        gained_access: list[str] = []
+        lost_access: list[str] = []
+        for index, (before, after) in enumerate(zip(before_row, after_row)):
+            if before == after:
+                continue
+            channel = table.channels[index]
+            gained = after & ~before
+            lost = before & ~after
+            changes.append(
+                {
+                    "channel_id": str(channel.id),
+                    "channel_name": channel.name,
+                    "gained": _flag_names(gained),
+                    "lost": _flag_names(lost),
+                }
+            )
+            totals = channel_totals.setdefault(
+                index, {"members_changed": 0, "gained_view": 0, "lost_view": 0}
+            )
+            totals["members_changed"] += 1
+            if gained & VIEW_CHANNEL:
+                totals["gained_view"] += 1
+                gained_access.append(str(channel.id))
+            if lost & VIEW_CHANNEL:
+                totals["lost_view"] += 1
+                lost_access.append(str(channel.id))
+        affected_count += 1
+        if len(affected) < member_limit:
+            affected.append(
+                {
+                    "member_id": str(member.id),
+                    "member_name": member.display_name,
+                    "gained_access": gained_access,
+                    "lost_access": lost_access,
+                    "channels": changes,
+                }
+            )
+
+    logger.info(
+        "permission_changes_simulated",
+        guild_id=guild_id,
+        mutation_count=len(mutations),
+        evaluated_member_count=len(members),
+        affected_member_count=affected_count,
+    )
+
+    return {
+        "guild_id": guild_id,
+        "mutation_count": len(mutations),
+        "evaluated_member_count": len(members),
+        "affected_member_count": affected_count,
+        "member_limit": member_limit,
+        "has_more": affected_count > len(affected),
+        "members": affected,
+        "channels": [
+            {
+                "channel_id": str(table.channels[index].id),
+                "channel_name": table.channels[index].name,
+                **totals,
+            }
+            for index, totals in sorted(channel_totals.items())
+        ],
+    }
+
+
+async def _apply_role_mutation(
+    guild: discord.Guild, mutation: dict[str, Any]
+) -> dict[str, Any]:
+    role = guild.get_role(int(mutation["role_id"]))
+    if not role:
+        return {"status": "failed", "error": "Role no longer exists"}
+    desired = int(mutation["after"])
+    if role.permissions.value == desired:
+        return {"status": "skipped"}
+    await role.edit(permissions=discord.Permissions(desired))
+    return {"status": "applied"}
+
+
+async def _apply_channel_mutation(
+    guild: discord.Guild, mutation: dict[str, Any]
+) -> dict[str, Any]:
+    channel = guild.get_channel(int(mutation["channel_id"]))
+    if not channel:
+        return {"status": "failed", "error": "Channel no longer exists"}
+
+    # Re-diff against the live channel so changes made since planning are not redone.
+    pending: list[tuple[discord.Role | discord.Member, Optional[discord.PermissionOverwrite]]] = []
+    for change in mutation["changes"]:
+        target = (
+            guild.get_role(int(change["target_id"]))
+            if change["target_type"] == "role"
+            else guild.get_member(int(change["target_id"]))
+        )
+        if not target:
+            return {"status": "failed", "error": f"Target {change['target_id']} no longer exists"}
+        after = change["after"]
+        desired = (int(after["allow"]), int(after["deny"])) if after else None
+        if _current_overwrite(channel, target.id) == desired:
+            continue
+        overwrite = (
+            discord.PermissionOverwrite.from_pair(
+                discord.Permissions(desired[0]), discord.Permissions(desired[1])
+            )
+            if desired
+            else None
+        )
+        pending.append((target, overwrite))
+
+    if not pending:
+        return {"status": "skipped"}
+
+    if len(pending) == 1:
+        target, overwrite = pending[0]
+        await channel.set_permissions(target, overwrite=overwrite)
+    else:
+        # One PATCH replaces the whole overwrite list instead of one PUT per target.
+        merged = dict(channel.overwrites)
+        for target, overwrite in pending:
+            if overwrite is None:
+                merged.pop(target, None)
+            else:
+                merged[target] = overwrite
+        await channel.edit(overwrites=merged)
+    return {"status": "applied", "changed_overwrite_count": len(pending)}
+
+
+async def apply_permission_plan(
+    plan_id: str,
+    progress: Optional[ProgressCallback] = None,
+) -> dict[str, Any]:
+    """Execute a stored plan; mutations in different rate-limit buckets run concurrently."""
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    plan = session.permission_plans.get(plan_id)
+    if not plan:
+        raise _plan_error(f"Permission plan {plan_id} not found", plan_id=plan_id)
+
+    guild = _get_guild(client, plan["guild_id"])
+    mutations = plan["mutations"]
+    total = len(mutations)
+    done = 0
+
+    await _with_status("Applying permission plan")
+
+    async def apply_one(mutation: dict[str, Any]) -> dict[str, Any]:
+        nonlocal done
+        try:
+            if mutation["kind"] == "role_permissions":
+                result = await _apply_role_mutation(guild, mutation)
+            else:
+                result = await _apply_channel_mutation(guild, mutation)
+        except discord.HTTPException as e:
+            result = {"status": "failed", "error": str(e)}
+
+        done += 1
+        if progress:
+            label = mutation.get("role_name") or mutation.get("channel_name")
+            await progress(done, total, f"{result['status']}: {label}")
+
+        row = {key: mutation[key] for key in ("kind", "role_id", "channel_id") if key in mutation}
+        row.update(result)
+        return row
+
+    # Role edits share the guild bucket and each channel is its own bucket, so
+    # mutations on the same bucket are serialized and distinct buckets run in parallel.
+    results = await gather_ordered_by_key(mutations, key=lambda m: m["bucket"], worker=apply_one)
+
+    applied = sum(1 for r in results if r["status"] == "applied")
+    skipped = sum(1 for r in results if r["status"] == "skipped")
+    failed = [r for r in results if r["status"] == "failed"]
+
+    # Failed mutations stay under the same ID so the plan can be applied again.
+    remaining = [m for m, r in zip(mutations, results) if r["status"] == "failed"]
+    if remaining:
+        plan["mutations"] = remaining
+        plan["mutation_count"] = len(remaining)
+    else:
+        session.permission_plans.pop(plan_id, None)
+
+    logger.info(
+        "permission_plan_applied",
+        guild_id=plan["guild_id"],
+        plan_id=plan_id,
+        applied_count=applied,
+        skipped_count=skipped,
+        failed_count=len(failed),
+    )
+
+    return {
+        "plan_id": plan_id,
+        "guild_id": plan["guild_id"],
+        "success": not failed,
+        "applied_count": applied,
+        "skipped_count": skipped,
+        "failed_count": len(failed),
+        "plan_retained": bool(remaining),
+        "results": results,
+    }
+
+
+async def discard_permission_plan(plan_id: str) -> dict[str, Any]:
+    session = await get_current_session()
+    if session.permission_plans.pop(plan_id, None) is None:
+        raise _plan_error(f"Permission plan {plan_id} not found", plan_id=plan_id)
+    return {"success": True, "plan_id": plan_id}
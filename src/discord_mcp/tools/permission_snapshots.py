@@ -0,0 +1,322 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.discord.permission_engine import PERMISSION_FLAGS, split_overwrites
+from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.utils.logging import get_logger
+from discord_mcp.utils.storage import data_path, read_json, write_json
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+async def _with_status(activity: str):
+    await update_bot_status(activity, "playing")
+
+
+def _snapshot_dir(guild_id: str) -> Path:
+    if not guild_id.isdigit():
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            f"Invalid guild ID: {guild_id}",
+            details={"guild_id": guild_id},
+        )
+    return data_path("permission_snapshots", guild_id)
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, separators=(",", ":"), sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _flag_names(value: int) -> list[str]:
+    return [name for name, flag in PERMISSION_FLAGS if value & flag]
+
+
+def _channel_state(guild_id: int, channel: discord.abc.GuildChannel) -> dict[str, Any]:
+    everyone, roles, members = split_overwrites(guild_id, channel)
+    # [target_id, type, allow, deny] with type 0 = role, 1 = member, sorted for hashing.
+    overwrites = [[str(guild_id), 0, everyone[0], everyone[1]]] if everyone != (0, 0) else []
+    overwrites += [[str(i), 0, a, d] for i, (a, d) in roles.items()]
+    overwrites += [[str(i), 1, a, d] for i, (a, d) in members.items()]
+    overwrites.sort()
+    parent_id = str(channel.category_id) if channel.category_id else None
+    return {
+        "name": channel.name,
+        "type": str(channel.type),
+        "parent_id": parent_id,
+        "overwrites": overwrites,
+        # Names are informational; only permission-relevant fields feed the hash.
+        "hash": _digest([parent_id, overwrites])[:16],
+    }
+
+
+def build_permission_snapshot(guild: discord.Guild) -> dict[str, Any]:
+    """Role permissions and channel overwrites of a guild from the client cache."""
+    roles = {
+        str(role.id): {"name": role.name, "permissions": role.permissions.value}
+        for role in guild.roles
+    }
+    channels = {str(channel.id): _channel_state(guild.id, channel) for channel in guild.channels}
+    roles_hash = _digest({role_id: role["permissions"] for role_id, role in roles.items()})[:16]
+    channels_hash = _digest(
+        sorted((channel_id, channel["hash"]) for channel_id, channel in channels.items())
+    )[:16]
+    return {
+        "version": SNAPSHOT_VERSION,
+        "guild_id": str(guild.id),
+        "snapshot_id": _digest([roles_hash, channels_hash])[:16],
+        "roles_hash": roles_hash,
+        "channels_hash": channels_hash,
+        "roles": roles,
+        "channels": channels,
+    }
+
+
+def _load_snapshot(guild_id: str, snapshot_id: str) -> dict[str, Any]:
+    # IDs are hex digests, which also keeps the path inside the snapshot directory.
+    snapshot = (
+        read_json(_snapshot_dir(guild_id) / f"{snapshot_id}.json")
+        if snapshot_id.isalnum()
+        else None
+    )
+    if snapshot is None:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            f"Permission snapshot {snapshot_id} not found for guild {guild_id}",
+            details={"guild_id": guild_id, "snapshot_id": snapshot_id},
+        )
+    return snapshot
+
+
+def _get_guild(client: discord.Client, guild_id: str) -> discord.Guild:
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+    return guild
+
+
+async def snapshot_guild_permissions(
+    guild_id: str,
+    label: Optional[str] = None,
+) -> dict[str, Any]:
+    """Write the guild's permission state to ``<data_dir>/permission_snapshots``.
+
+    The snapshot ID is a hash of the content, so taking a snapshot of unchanged state
+    returns the existing file instead of writing a duplicate.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = _get_guild(client, guild_id)
+    snapshot = build_permission_snapshot(guild)
+    snapshot_id = snapshot["snapshot_id"]
+
+    path = _snapshot_dir(guild_id) / f"{snapshot_id}.json"
+    created = not path.exists()
+    if created:
+        snapshot["created_at"] = time.time()
+        snapshot["label"] = label
+        write_json(path, snapshot)
+
+    await _with_status("Snapshotting permissions")
+    logger.info(
+        "permission_snapshot_taken",
+        guild_id=guild_id,
+        snapshot_id=snapshot_id,
+        created=created,
+    )
+
+    return {
+        "guild_id": guild_id,
+        "snapshot_id": snapshot_id,
+        "created": created,
+        "path": str(path),
+        "role_count": len(snapshot["roles"]),
+        "channel_count": len(snapshot["channels"]),
+    }
+
+
+async def list_permission_snapshots(guild_id: str) -> list[dict[str, Any]]:
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    _get_guild(client, guild_id)
+    rows = []
+    for path in _snapshot_dir(guild_id).glob("*.json"):
+        snapshot = read_json(path)
+        rows.append(
+            {
+                "snapshot_id": snapshot["snapshot_id"],
+                "label": snapshot.get("label"),
+                "created_at": snapshot.get("created_at"),
+                "role_count": len(snapshot["roles"]),
+                "channel_count": len(snapshot["channels"]),
+            }
+        )
+    rows.sort(key=lambda row: row["created_at"] or 0, reverse=True)
+    return rows
+
+
+def _diff_roles(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    changed = []
+    for role_id in before.keys() & after.keys():
+        old, new = before[role_id]["permissions"], after[role_id]["permissions"]
+        if old != new:
+            changed.append(
+                {
+                    "role_id": role_id,
+                    "role_name": after[role_id]["name"],
+                    "gained": _flag_names(new & ~old),
+                    "lost": _flag_names(old & ~new),
+                }
+            )
+    return {
+        "added": [
+            {"role_id": role_id, "role_name": after[role_id]["name"]}
+            for role_id in after.keys() - before.keys()
+        ],
+        "removed": [
+            {"role_id": role_id, "role_name": before[role_id]["name"]}
+            for role_id in before.keys() - after.keys()
+        ],
+        "permissions_changed": changed,
+    }
+
+
+def _diff_overwrites(before: list[list[Any]], after: list[list[Any]]) -> list[dict[str, Any]]:
+    old = {(row[0], row[1]): (row[2], row[3]) for row in before}
+    new = {(row[0], row[1]): (row[2], row[3]) for row in after}
+    changes = []
+    for key in sorted(old.keys() | new.keys()):
+        if old.get(key) == new.get(key):
+            continue
+        old_allow, old_deny = old.get(key, (0, 0))
+        new_allow, new_deny = new.get(key, (0, 0))
+        changes.append(
+            {
+                "target_id": key[0],
+                "target_type": "member" if key[1] else "role",
+                "change": (
+                    "added" if key not in old else "removed" if key not in new else "changed"
+                ),
+                "allow_added": _flag_names(new_allow & ~old_allow),
+                "allow_removed": _flag_names(old_allow & ~new_allow),
+                "deny_added": _flag_names(new_deny & ~old_deny),
+                "deny_removed": _flag_names(old_deny & ~new_deny),
+            }
+        )
+    return changes
+
+
+def diff_snapshots(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    roles = (
+        {"added": [], "removed": [], "permissions_changed": []}
+        if before["roles_hash"] == after["roles_hash"]
+        else _diff_roles(before["roles"], after["roles"])
+    )
+
+    added: list[dict[str, Any]] = []
+    removed: list[dict[str, Any]] = []
+    changed: list[dict[str, Any]] = []
+    unchanged = 0
+    if before["channels_hash"] == after["channels_hash"]:
+        unchanged = len(after["channels"])
+    else:
+        old_channels, new_channels = before["channels"], after["channels"]
+        for channel_id, new in new_channels.items():
+            old = old_channels.get(channel_id)
+            if old is None:
+                added.append({"channel_id": channel_id, "channel_name": new["name"]})
+            elif old["hash"] == new["hash"]:
+                unchanged += 1
+            else:
+                entry: dict[str, Any] = {
+                    "channel_id": channel_id,
+                    "channel_name": new["name"],
+                    "overwrites": _diff_overwrites(old["overwrites"], new["overwrites"]),
+                }
+                if old["parent_id"] != new["parent_id"]:
+                    entry["parent_id"] = {"before": old["parent_id"], "after": new["parent_id"]}
+                changed.append(entry)
+        removed = [
+            {"channel_id": channel_id, "channel_name": old_channels[channel_id]["name"]}
+            for channel_id in old_channels.keys() - new_channels.keys()
+        ]
+
+    return {
+        "identical": before["snapshot_id"] == after["snapshot_id"],
+        "roles": roles,
+        "channels": {
+            "added": added,
+            "removed": removed,
+            "changed": changed,
+            "unchanged_count": unchanged,
+        },
+    }
+
+
+async def diff_permission_snapshots(
+    guild_id: str,
+    from_snapshot_id: str,
+    to_snapshot_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Diff two snapshots, or a snapshot against live state when ``to_snapshot_id`` is omitted.
+
+    Channels whose overwrite hash matches are skipped without comparing overwrites.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    before = _load_snapshot(guild_id, from_snapshot_id)
+    if to_snapshot_id:
+        after = _load_snapshot(guild_id, to_snapshot_id)
+    else:
+        after = build_permission_snapshot(_get_guild(client, guild_id))
+
+    diff = diff_snapshots(before, after)
+
+    await _with_status("Diffing permission snapshots")
+    logger.info(
+        "permission_snapshots_diffed",
+        guild_id=guild_id,
+        from_snapshot_id=from_snapshot_id,
+        to_snapshot_id=to_snapshot_id or "live",
+        changed_channel_count=len(diff["channels"]["changed"]),
+    )
+
+    return {
+        "guild_id": guild_id,
+        "from_snapshot_id": from_snapshot_id,
+        "to_snapshot_id": to_snapshot_id or after["snapshot_id"],
+        "to_live": to_snapshot_id is None,
+        **diff,
+    }
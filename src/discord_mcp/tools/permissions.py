@@ -1,8 +1,18 @@
+import bisect
 from typing import Any, Optional
 
 import discord
 
+from discord_mcp.discord.permission_engine import (
+    ADMINISTRATOR,
+    CONNECT,
+    PERMISSION_FLAGS,
+    SEND_MESSAGES,
+    VIEW_CHANNEL,
+    apply_channel_kind,
+)
 from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.utils.concurrency import gather_limited
 from discord_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,6 +49,15 @@ def _handle_discord_error(e: discord.HTTPException) -> None:
         )
 
 
+def _current_overwrite(
+    channel: discord.abc.GuildChannel, target_id: int
+) -> Optional[tuple[int, int]]:
+    for overwrite in channel._overwrites:
+        if overwrite.id == target_id:
+            return (overwrite.allow, overwrite.deny)
+    return None
+
+
 async def set_channel_permissions(
     channel_id: str,
     target_id: str,
@@ -162,17 +181,37 @@ async def set_category_permissions(
 
     overwrite = discord.PermissionOverwrite.from_pair(allow_perms, deny_perms)
 
-    await category.set_permissions(target, overwrite=overwrite)
-
-    synced_channels: list[dict[str, str]] = []
-    for child_channel in category.channels:
-        await child_channel.set_permissions(target, overwrite=overwrite)
-        synced_channels.append(
-            {
-                "channel_id": str(child_channel.id),
-                "channel_name": child_channel.name,
-            }
-        )
+    desired = (allow_perms.value, deny_perms.value)
+    category_updated = _current_overwrite(category, target.id) != desired
+    if category_updated:
+        await category.set_permissions(target, overwrite=overwrite)
+
+    async def sync_child(child_channel: discord.abc.GuildChannel) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "channel_id": str(child_channel.id),
+            "channel_name": child_channel.name,
+        }
+        if _current_overwrite(child_channel, target.id) == desired:
+            row["status"] = "skipped"
+            return row
+        try:
+            await child_channel.set_permissions(target, overwrite=overwrite)
+        except discord.HTTPException as e:
+            row["status"] = "failed"
+            row["error"] = str(e)
+            return row
+        row["status"] = "updated"
+        return row
+
+    results = await gather_limited(category.channels, sync_child)
+    # Same shape and meaning as before skipping: the children the overwrite was written to.
+    synced = [
+        {"channel_id": row["channel_id"], "channel_name": row["channel_name"]}
+        for row in results
+        if row["status"] == "updated"
+    ]
+    skipped = [row for row in results if row["status"] == "skipped"]
+    failed = [row for row in results if row["status"] == "failed"]
 
     await _with_status(f"Setting category permissions")
     logger.info(
@@ -180,16 +219,23 @@ async def set_category_permissions(
         category_id=category_id,
         target_id=target_id,
         target_type=target_type,
-        synced_channel_count=len(synced_channels),
+        synced_channel_count=len(synced),
+        skipped_count=len(skipped),
+        failed_count=len(failed),
     )
 
     return {
-        "success": True,
+        "success": not failed,
         "category_id": category_id,
         "target_id": target_id,
         "target_type": target_type,
-        "synced_channel_count": len(synced_channels),
-        "synced_channels": synced_channels,
+        "category_updated": category_updated,
+        "synced_channel_count": len(synced),
+        "synced_channels": synced,
+        "skipped_count": len(skipped),
+        "failed_count": len(failed),
+        "skipped_channels": skipped,
+        "failed_channels": failed,
     }
 
 
@@ -368,21 +414,25 @@ async def remove_channel_permissions(
     }
 
 
-def _permissions_to_dict(perms: discord.Permissions) -> dict[str, bool]:
-    return {name: value for name, value in perms}
+def _permissions_to_dict(perms: int) -> dict[str, bool]:
+    return {name: bool(perms & flag) for name, flag in PERMISSION_FLAGS}
 
 
-def _summarize_allowed_denied(perms: discord.Permissions) -> tuple[list[str], list[str]]:
+def _summarize_allowed_denied(perms: int) -> tuple[list[str], list[str]]:
     allowed = []
     denied = []
-    for name, value in perms:
-        if value:
+    for name, flag in PERMISSION_FLAGS:
+        if perms & flag:
             allowed.append(name)
         else:
             denied.append(name)
     return allowed, denied
 
 
+def _has(perms: int, name: str) -> bool:
+    return bool(perms & getattr(discord.Permissions, name).flag)
+
+
 def _resolve_target(
     guild: discord.Guild, target_id: str, target_type: str
 ) -> discord.Role | discord.Member:
@@ -409,31 +459,30 @@ def _resolve_target(
     return target
 
 
-def _channel_sort_key(channel: discord.abc.GuildChannel) -> tuple[int, int, int, int]:
-    category = getattr(channel, "category", None)
-    category_position = category.position if category else -1
-    category_id = category.id if category else 0
-    return (category_position, category_id, channel.position, channel.id)
+_BASIC_CAPABILITIES: list[tuple[str, int]] = [
+    (key, getattr(discord.Permissions, name).flag)
+    for key, name in (
+        ("can_send_messages", "send_messages"),
+        ("can_read_history", "read_message_history"),
+        ("can_connect_voice", "connect"),
+        ("can_speak_voice", "speak"),
+        ("can_manage_channel", "manage_channels"),
+        ("can_manage_permissions", "manage_roles"),
+        ("can_manage_messages", "manage_messages"),
+        ("can_manage_threads", "manage_threads"),
+        ("can_create_public_threads", "create_public_threads"),
+        ("can_create_private_threads", "create_private_threads"),
+    )
+]
 
 
-def _basic_channel_capabilities(perms: discord.Permissions) -> dict[str, bool]:
-    return {
-        "can_send_messages": getattr(perms, "send_messages", False),
-        "can_read_history": getattr(perms, "read_message_history", False),
-        "can_connect_voice": getattr(perms, "connect", False),
-        "can_speak_voice": getattr(perms, "speak", False),
-        "can_manage_channel": getattr(perms, "manage_channels", False),
-        "can_manage_permissions": getattr(perms, "manage_roles", False),
-        "can_manage_messages": getattr(perms, "manage_messages", False),
-        "can_manage_threads": getattr(perms, "manage_threads", False),
-        "can_create_public_threads": getattr(perms, "create_public_threads", False),
-        "can_create_private_threads": getattr(perms, "create_private_threads", False),
-    }
+def _basic_channel_capabilities(perms: int) -> dict[str, bool]:
+    return {key: bool(perms & flag) for key, flag in _BASIC_CAPABILITIES}
 
 
 def _channel_summary_row(
     channel: discord.abc.GuildChannel,
-    perms: discord.Permissions,
+    perms: int,
     include_basic_capabilities: bool = False,
 ) -> dict[str, Any]:
     row = {
@@ -442,7 +491,7 @@ def _channel_summary_row(
         "channel_type": str(channel.type),
         "category_id": str(channel.category_id) if channel.category_id else None,
         "position": channel.position,
-        "can_view": getattr(perms, "view_channel", False),
+        "can_view": bool(perms & VIEW_CHANNEL),
     }
     if include_basic_capabilities:
         row.update(_basic_channel_capabilities(perms))
@@ -451,7 +500,7 @@ def _channel_summary_row(
 
 def _channel_detail_row(
     channel: discord.abc.GuildChannel,
-    perms: discord.Permissions,
+    perms: int,
     include_permission_map: bool = True,
 ) -> dict[str, Any]:
     row = _channel_summary_row(channel=channel, perms=perms, include_basic_capabilities=True)
@@ -470,7 +519,17 @@ async def inspect_effective_permissions(
     preview_limit: int = 20,
     include_permission_maps: bool = False,
     max_channels: int | None = None,
+    channel_page_size: int = 100,
+    channel_cursor: Optional[str] = None,
+    only_differing: bool = False,
 ) -> dict[str, Any]:
+    """Summarize a target's permissions across the guild.
+
+    With ``include_permission_maps`` the per-channel detail rows are paginated:
+    ``channel_page_size`` rows per call, continued from ``next_channel_cursor``.
+    ``only_differing`` keeps only channels whose permissions differ from the target's
+    guild-level baseline, i.e. where overwrites actually change something.
+    """
     session = await get_current_session()
     client = session.client
 
@@ -504,27 +563,61 @@ async def inspect_effective_permissions(
             details={"max_channels": max_channels},
         )
 
+    if include_permission_maps and channel_page_size < 1:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            "channel_page_size must be greater than 0",
+            details={"channel_page_size": channel_page_size},
+        )
+
     target = _resolve_target(guild=guild, target_id=target_id, target_type=target_type)
     guild_permissions = (
         target.permissions
         if isinstance(target, discord.Role)
         else target.guild_permissions
-    )
+    ).value
     guild_allowed, guild_denied = _summarize_allowed_denied(guild_permissions)
 
-    all_channels = sorted(guild.channels, key=_channel_sort_key)
+    table = client.permission_cache.table(guild)
+    all_channels = table.channels
+    channel_perms = client.permission_cache.resolve(guild, target)
     evaluated_channels = (
         all_channels[:max_channels] if max_channels is not None else all_channels
     )
+
+    page_start = 0
+    if include_permission_maps and channel_cursor:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        try:
+            cursor_id = int(channel_cursor)
+        except ValueError:
+            raise PermissionException(
+                f"Invalid channel cursor: {channel_cursor}",
+                details={"channel_cursor": channel_cursor},
+            )
+        cursor_index = table.channel_index.get(cursor_id)
+        if cursor_index is None:
+            raise PermissionException(
+                f"Channel cursor {channel_cursor} is no longer in guild {guild_id}",
+                details={"channel_cursor": channel_cursor},
+            )
+        page_start = cursor_index + 1
+    baseline = table.baseline_permissions(target)
+
     channel_details: list[dict[str, Any]] = []
+    details_have_more = False
+    differing_count = 0
     accessible_preview: list[dict[str, Any]] = []
     inaccessible_preview: list[dict[str, Any]] = []
     accessible_count = 0
     inaccessible_count = 0
 
-    for channel in evaluated_channels:
-        perms = channel.permissions_for(target)
-        can_view = perms.view_channel
+    for index, (channel, perms, kind) in enumerate(
+        zip(evaluated_channels, channel_perms, table.kinds)
+    ):
+        can_view = perms & VIEW_CHANNEL
         if can_view:
             accessible_count += 1
             if len(accessible_preview) < preview_limit:
@@ -537,14 +630,28 @@ async def inspect_effective_permissions(
                 inaccessible_preview.append(
                     _channel_summary_row(channel=channel, perms=perms)
                 )
-        if include_permission_maps:
-            channel_details.append(
-                _channel_detail_row(
-                    channel=channel,
-                    perms=perms,
-                    include_permission_map=include_permission_maps,
-                )
+        channel_baseline = apply_channel_kind(baseline, kind)
+        differs = perms != channel_baseline
+        if differs:
+            differing_count += 1
+        if not include_permission_maps or index < page_start:
+            continue
+        if only_differing and not differs:
+            continue
+        if len(channel_details) >= channel_page_size:
+            details_have_more = True
+            continue
+        if only_differing:
+            # Only the delta against the baseline, not the full allowed/denied lists.
+            row = _channel_summary_row(
+                channel=channel, perms=perms, include_basic_capabilities=True
             )
+            row["gained_vs_baseline"], _ = _summarize_allowed_denied(perms & ~channel_baseline)
+            row["lost_vs_baseline"], _ = _summarize_allowed_denied(channel_baseline & ~perms)
+        else:
+            row = _channel_detail_row(channel=channel, perms=perms)
+            row["differs_from_baseline"] = differs
+        channel_details.append(row)
 
     await _with_status("Inspecting effective permissions")
     logger.info(
@@ -562,13 +669,13 @@ async def inspect_effective_permissions(
         "guild_permissions": _permissions_to_dict(guild_permissions),
         "guild_allowed_permissions": guild_allowed,
         "guild_denied_permissions": guild_denied,
-        "can_administrator": getattr(guild_permissions, "administrator", False),
-        "can_manage_guild": getattr(guild_permissions, "manage_guild", False),
-        "can_manage_roles": getattr(guild_permissions, "manage_roles", False),
-        "can_manage_channels": getattr(guild_permissions, "manage_channels", False),
-        "can_kick_members": getattr(guild_permissions, "kick_members", False),
-        "can_ban_members": getattr(guild_permissions, "ban_members", False),
-        "can_moderate_members": getattr(guild_permissions, "moderate_members", False),
+        "can_administrator": _has(guild_permissions, "administrator"),
+        "can_manage_guild": _has(guild_permissions, "manage_guild"),
+        "can_manage_roles": _has(guild_permissions, "manage_roles"),
+        "can_manage_channels": _has(guild_permissions, "manage_channels"),
+        "can_kick_members": _has(guild_permissions, "kick_members"),
+        "can_ban_members": _has(guild_permissions, "ban_members"),
+        "can_moderate_members": _has(guild_permissions, "moderate_members"),
         "total_channel_count": len(all_channels),
         "evaluated_channel_count": len(evaluated_channels),
         "max_channels_applied": max_channels,
@@ -579,9 +686,16 @@ async def inspect_effective_permissions(
         "inaccessible_channels_preview": inaccessible_preview,
         "accessible_preview_has_more": accessible_count > len(accessible_preview),
         "inaccessible_preview_has_more": inaccessible_count > len(inaccessible_preview),
+        "baseline_differing_channel_count": differing_count,
     }
     if include_permission_maps:
         response["channels"] = channel_details
+        response["channel_page_size"] = channel_page_size
+        response["only_differing"] = only_differing
+        response["channels_have_more"] = details_have_more
+        response["next_channel_cursor"] = (
+            channel_details[-1]["channel_id"] if details_have_more and channel_details else None
+        )
     return response
 
 
@@ -620,7 +734,7 @@ async def inspect_target_channel_permissions(
             details={"guild_id": guild_id, "channel_id": channel_id},
         )
 
-    perms = channel.permissions_for(target)
+    perms = client.permission_cache.channel_permissions(guild, target, channel)
 
     await _with_status("Inspecting channel permissions")
     logger.info(
@@ -680,9 +794,9 @@ async def list_target_accessible_channels(
 
     rows: list[dict[str, Any]] = []
     total_accessible = 0
-    for channel in sorted(guild.channels, key=_channel_sort_key):
-        perms = channel.permissions_for(target)
-        if not perms.view_channel:
+    cache = client.permission_cache
+    for channel, perms in zip(cache.table(guild).channels, cache.resolve(guild, target)):
+        if not perms & VIEW_CHANNEL:
             continue
         total_accessible += 1
         if max_channels is not None and len(rows) >= max_channels:
@@ -754,9 +868,9 @@ async def list_target_inaccessible_channels(
 
     rows: list[dict[str, Any]] = []
     total_inaccessible = 0
-    for channel in sorted(guild.channels, key=_channel_sort_key):
-        perms = channel.permissions_for(target)
-        if perms.view_channel:
+    cache = client.permission_cache
+    for channel, perms in zip(cache.table(guild).channels, cache.resolve(guild, target)):
+        if perms & VIEW_CHANNEL:
             continue
         total_inaccessible += 1
         if max_channels is not None and len(rows) >= max_channels:
@@ -790,3 +904,253 @@ async def list_target_inaccessible_channels(
         "has_more": total_inaccessible > len(rows),
         "channels": rows,
     }
+
+
+def _permission_mask(permissions: Optional[list[str]]) -> int:
+    if not permissions:
+        return 0
+    valid = discord.Permissions.VALID_FLAGS
+    mask = 0
+    for name in permissions:
+        if name not in valid:
+            from discord_mcp.discord.exceptions import PermissionException
+
+            raise PermissionException(
+                f"Unknown permission: {name}",
+                details={"permission": name},
+            )
+        mask |= valid[name]
+    return mask
+
+
+async def get_permission_matrix(
+    guild_id: str,
+    include_members: bool = False,
+    member_limit: int = 1000,
+    permissions: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """Effective permissions of every role (and optionally member) in every channel.
+
+    ``matrix[i][j]`` is the permission bitmask of row ``i`` in ``channel_ids[j]``; decode
+    bits with ``permission_flags``. ``permissions`` restricts the bits kept in the matrix.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+
+    if include_members and member_limit < 1:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            "member_limit must be greater than 0",
+            details={"member_limit": member_limit},
+        )
+
+    mask = _permission_mask(permissions)
+    flags = [(name, flag) for name, flag in PERMISSION_FLAGS if not mask or flag & mask]
+
+    cache = client.permission_cache
+    table = cache.table(guild)
+    roles = sorted(guild.roles, key=lambda r: r.position, reverse=True)
+    role_rows = [cache.resolve_role(guild, role.id) for role in roles]
+    if mask:
+        role_rows = [[value & mask for value in row] for row in role_rows]
+
+    response: dict[str, Any] = {
+        "guild_id": guild_id,
+        "channel_ids": [str(channel.id) for channel in table.channels],
+        "channel_names": [channel.name for channel in table.channels],
+        "permission_flags": dict(flags),
+        "roles": {
+            "ids": [str(role.id) for role in roles],
+            "names": [role.name for role in roles],
+            "matrix": role_rows,
+        },
+    }
+
+    if include_members:
+        members = guild.members[:member_limit]
+        member_rows = cache.resolve_members(guild, members)
+        if mask:
+            member_rows = [[value & mask for value in row] for row in member_rows]
+        response["members"] = {
+            "ids": [str(member.id) for member in members],
+            "names": [member.display_name for member in members],
+            "matrix": member_rows,
+            "total_member_count": len(guild.members),
+            "has_more": len(guild.members) > len(members),
+        }
+
+    await _with_status("Computing permission matrix")
+    logger.info(
+        "permission_matrix_computed",
+        guild_id=guild_id,
+        role_count=len(roles),
+        channel_count=len(table.channels),
+        include_members=include_members,
+    )
+
+    return response
+
+
+async def list_channel_audience(
+    channel_id: str,
+    permission: str = "view_channel",
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> dict[str, Any]:
+    """Cached members that hold ``permission`` in a channel, paginated by member ID.
+
+    Only roles that can influence the answer (an overwrite in the channel touching the
+    relevant bits, or base permissions carrying them) are walked, via the cache's
+    role -> members index. Members are then grouped by that reduced role set, so each
+    distinct combination is resolved once; members with a personal overwrite in the
+    channel, the owner and timed out members are resolved individually.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    channel = client.get_channel(int(channel_id))
+    if not channel or not hasattr(channel, "guild"):
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            f"Channel {channel_id} not found",
+            details={"channel_id": channel_id},
+        )
+
+    if limit < 1:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            "limit must be greater than 0",
+            details={"limit": limit},
+        )
+
+    mask = _permission_mask([permission])
+    guild = channel.guild
+    cache = client.permission_cache
+    table = cache.table(guild)
+    index = table.channel_index.get(channel.id)
+    if index is None:
+        from discord_mcp.discord.exceptions import PermissionException
+
+        raise PermissionException(
+            f"Channel {channel_id} has no permission overwrites of its own "
+            "(threads are not supported)",
+            details={"channel_id": channel_id},
+        )
+
+    # Bits the implicit channel rules read, in addition to the requested one.
+    relevant_bits = mask | ADMINISTRATOR | VIEW_CHANNEL | SEND_MESSAGES | CONNECT
+    relevant_roles = {
+        role_id
+        for role_id, (allow, deny) in table.role_overwrites[index].items()
+        if (allow | deny) & relevant_bits
+    }
+    relevant_roles.update(
+        role_id
+        for role_id, value in table.role_permissions.items()
+        if value & relevant_bits and role_id != guild.id
+    )
+
+    role_index = cache.role_members(guild)
+    reduced_roles: dict[int, list[int]] = {}
+    for role_id in relevant_roles:
+        for member_id in role_index.members_of(role_id):
+            reduced_roles.setdefault(member_id, []).append(role_id)
+
+    individual = set(table.member_overwrites[index])
+    if table.owner_id is not None:
+        individual.add(table.owner_id)
+
+    outcomes: dict[frozenset[int], bool] = {}
+    no_roles = frozenset()
+    outcomes[no_roles] = table.resolve_channel(index, None, no_roles) & mask == mask
+    if outcomes[no_roles]:
+        candidates = guild.members
+    else:
+        # Timeouts only remove permissions, so members without a relevant role can be
+        # skipped unless a personal overwrite or ownership grants them access.
+        candidates = [
+            member
+            for member in map(guild.get_member, reduced_roles.keys() | individual)
+            if member is not None
+        ]
+
+    audience: list[int] = []
+    for member in candidates:
+        role_ids = frozenset(reduced_roles.get(member.id, no_roles))
+        timed_out = member.timed_out_until is not None and member.is_timed_out()
+        if timed_out or member.id in individual:
+            value = table.resolve_channel(index, member.id, role_ids, timed_out=timed_out)
+            allowed = value & mask == mask
+        else:
+            allowed = outcomes.get(role_ids)
+            if allowed is None:
+                value = table.resolve_channel(index, None, role_ids)
+                allowed = value & mask == mask
+                outcomes[role_ids] = allowed
+        if allowed:
+            audience.append(member.id)
+
+    audience.sort()
+    start = 0
+    if after:
+        start = bisect.bisect_right(audience, int(after))
+    page = audience[start : start + limit]
+    has_more = start + limit < len(audience)
+
+    members = []
+    for member_id in page:
+        member = guild.get_member(member_id)
+        members.append(
+            {
+                "id": str(member_id),
+                "name": member.name if member else None,
+                "display_name": member.display_name if member else None,
+                "bot": member.bot if member else None,
+            }
+        )
+
+    await _with_status("Listing channel audience")
+    logger.info(
+        "channel_audience_listed",
+        channel_id=channel_id,
+        permission=permission,
+        audience_count=len(audience),
+        role_combinations=len(outcomes),
+    )
+
+    return {
+        "guild_id": str(guild.id),
+        "channel_id": channel_id,
+        "channel_name": channel.name,
+        "permission": permission,
+        "audience_count": len(audience),
+        "cached_member_count": len(guild.members),
+        "guild_member_count": guild.member_count,
+        "member_cache_complete": guild.chunked,
+        "returned_count": len(members),
+        "has_more": has_more,
+        "next_cursor": str(page[-1]) if has_more and page else None,
+        "members": members,
+    }
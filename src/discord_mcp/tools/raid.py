@@ -0,0 +1,112 @@
+from typing import Any, Optional
+
+import discord
+from pydantic import ValidationError
+
+from discord_mcp.config import settings
+from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.models.moderation import RaidPolicy
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _with_status(activity: str):
+    await update_bot_status(activity, "playing")
+
+
+def _get_guild(client: discord.Client, guild_id: str) -> discord.Guild:
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+    return guild
+
+
+async def get_raid_status(guild_id: str) -> dict[str, Any]:
+    """Join-window statistics, name clusters and recent raids for a guild."""
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = _get_guild(client, guild_id)
+    status = client.raid_detector.status(guild.id)
+
+    return {
+        "guild_id": guild_id,
+        "detection_enabled": settings.raid.detection_enabled and status["policy"]["enabled"],
+        **status,
+        "raids": [
+            {**raid, "member_ids": [str(member_id) for member_id in raid["member_ids"]]}
+            for raid in status["raids"]
+        ],
+    }
+
+
+async def configure_raid_detection(
+    guild_id: str,
+    enabled: Optional[bool] = None,
+    join_threshold: Optional[int] = None,
+    window_seconds: Optional[int] = None,
+    new_account_days: Optional[int] = None,
+    cluster_min_size: Optional[int] = None,
+    response: Optional[str] = None,
+    timeout_seconds: Optional[int] = None,
+    raise_verification: Optional[bool] = None,
+) -> dict[str, Any]:
+    """Update the guild's raid policy; omitted fields keep their current values.
+
+    Policies are stored under ``STORAGE_DATA_DIR/raid_policies`` and survive restarts.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    guild = _get_guild(client, guild_id)
+    changes = {
+        key: value
+        for key, value in {
+            "enabled": enabled,
+            "join_threshold": join_threshold,
+            "window_seconds": window_seconds,
+            "new_account_days": new_account_days,
+            "cluster_min_size": cluster_min_size,
+            "response": response.lower() if response else None,
+            "timeout_seconds": timeout_seconds,
+            "raise_verification": raise_verification,
+        }.items()
+        if value is not None
+    }
+
+    current = client.raid_detector.policy(guild.id)
+    try:
+        policy = RaidPolicy(**{**current.model_dump(), **changes})
+    except ValidationError as e:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            "Invalid raid policy",
+            details={"errors": [error["msg"] for error in e.errors()]},
+        )
+    client.raid_detector.set_policy(guild.id, policy)
+
+    await _with_status("Configuring raid detection")
+    logger.info("raid_policy_updated", guild_id=guild_id, changes=changes)
+
+    return {
+        "success": True,
+        "guild_id": guild_id,
+        "policy": policy.model_dump(),
+    }
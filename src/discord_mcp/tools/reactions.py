@@ -2,7 +2,9 @@ from typing import Any, Optional
 
 import discord
 
+from discord_mcp.discord.exceptions import ReactionException
 from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.tools.messages import _get_partial_message
 from discord_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -56,7 +58,7 @@ async def add_reaction(
 
         raise SessionException("Client not initialized")
 
-    message = await _get_message(client, channel_id, message_id)
+    message = _get_partial_message(client, channel_id, message_id, ReactionException)
 
     try:
         await message.add_reaction(emoji)
@@ -89,16 +91,12 @@ async def remove_reaction(
 
         raise SessionException("Client not initialized")
 
-    message = await _get_message(client, channel_id, message_id)
+    message = _get_partial_message(client, channel_id, message_id, ReactionException)
 
     try:
         if user_id:
-            member = message.guild.get_member(int(user_id)) if message.guild else None
-            if member:
-                await message.remove_reaction(emoji, member)
-            else:
-                user = await client.fetch_user(int(user_id))
-                await message.remove_reaction(emoji, user)
+            # Only the snowflake is sent to Discord, so there is no need to resolve the user.
+            await message.remove_reaction(emoji, discord.Object(id=int(user_id)))
         else:
             await message.remove_reaction(emoji, client.user)
     except discord.HTTPException as e:
@@ -168,7 +166,7 @@ async def clear_reactions(
 
         raise SessionException("Client not initialized")
 
-    message = await _get_message(client, channel_id, message_id)
+    message = _get_partial_message(client, channel_id, message_id, ReactionException)
 
     try:
         if emoji:
@@ -1,9 +1,15 @@
+import re
+import secrets
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any, Optional
 
 import discord
 
 from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.utils.concurrency import gather_limited
 from discord_mcp.utils.logging import get_logger
+from discord_mcp.utils.storage import data_path, read_json, write_json
 
 logger = get_logger(__name__)
 
@@ -315,6 +321,235 @@ async def remove_role(user_id: str, role_id: str, guild_id: str) -> dict[str, An
     }
 
 
+_ROLE_JOB_CHECKPOINT_INTERVAL = 100
+_ROLE_JOB_PROGRESS_INTERVAL = 25
+
+
+def _role_job_path(job_id: str):
+    return data_path("role_jobs", f"{job_id}.json")
+
+
+def _load_role_job(job_id: str) -> dict[str, Any]:
+    # Job IDs are token_urlsafe strings; anything else never maps to a file.
+    job = read_json(_role_job_path(job_id)) if re.fullmatch(r"[\w-]+", job_id) else None
+    if not job:
+        from discord_mcp.discord.exceptions import RoleException
+
+        raise RoleException(
+            f"Role job {job_id} not found",
+            details={"job_id": job_id},
+        )
+    return job
+
+
+def _validate_bulk_roles(guild: discord.Guild, role_ids: list[str]) -> list[discord.Role]:
+    roles = []
+    for role_id in role_ids:
+        role = guild.get_role(int(role_id))
+        if not role:
+            from discord_mcp.discord.exceptions import RoleException
+
+            raise RoleException(
+                f"Role {role_id} not found",
+                details={"role_id": role_id},
+            )
+        if role.is_default() or role.managed or not role.is_assignable():
+            from discord_mcp.discord.exceptions import RoleException
+
+            raise RoleException(
+                f"Role {role.name} cannot be assigned by the bot",
+                details={"role_id": role_id},
+            )
+        roles.append(role)
+    return roles
+
+
+def _select_members(
+    guild: discord.Guild,
+    member_ids: Optional[list[str]],
+    has_role_id: Optional[str],
+    missing_role_id: Optional[str],
+    include_bots: bool,
+) -> list[int]:
+    if member_ids:
+        candidates = [guild.get_member(int(member_id)) for member_id in member_ids]
+        missing = [m for m, member in zip(member_ids, candidates) if member is None]
+        if missing:
+            from discord_mcp.discord.exceptions import RoleException
+
+            raise RoleException(
+                f"{len(missing)} members not found in guild {guild.id}",
+                details={"missing_member_ids": missing[:50]},
+            )
+    else:
+        candidates = guild.members
+
+    has_role = int(has_role_id) if has_role_id else None
+    missing_role = int(missing_role_id) if missing_role_id else None
+    selected = []
+    for member in candidates:
+        if not include_bots and member.bot:
+            continue
+        if has_role is not None and not member._roles.has(has_role):
+            continue
+        if missing_role is not None and member._roles.has(missing_role):
+            continue
+        selected.append(member.id)
+    return sorted(set(selected))
+
+
+async def bulk_update_member_roles(
+    guild_id: str,
+    add_role_ids: Optional[list[str]] = None,
+    remove_role_ids: Optional[list[str]] = None,
+    member_ids: Optional[list[str]] = None,
+    has_role_id: Optional[str] = None,
+    missing_role_id: Optional[str] = None,
+    include_bots: bool = True,
+    job_id: Optional[str] = None,
+    batch_size: int = 1000,
+    progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+) -> dict[str, Any]:
+    """Add and/or remove roles for many members, one ``member.edit`` call per member.
+
+    Targets are ``member_ids`` or every cached member matching the filters. The job is
+    checkpointed under ``STORAGE_DATA_DIR/role_jobs``; each call processes up to
+    ``batch_size`` members, and passing ``job_id`` resumes where the last call (or an
+    interrupted one) stopped.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    if batch_size < 1:
+        from discord_mcp.discord.exceptions import RoleException
+
+        raise RoleException(
+            "batch_size must be greater than 0",
+            details={"batch_size": batch_size},
+        )
+
+    if job_id:
+        job = _load_role_job(job_id)
+        guild_id = job["guild_id"]
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import RoleException
+
+        raise RoleException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+
+    if not job_id:
+        add_ids = list(dict.fromkeys(add_role_ids or []))
+        remove_ids = list(dict.fromkeys(remove_role_ids or []))
+        if not add_ids and not remove_ids:
+            from discord_mcp.discord.exceptions import RoleException
+
+            raise RoleException("Provide add_role_ids and/or remove_role_ids")
+        if set(add_ids) & set(remove_ids):
+            from discord_mcp.discord.exceptions import RoleException
+
+            raise RoleException(
+                "A role cannot be both added and removed",
+                details={"role_ids": sorted(set(add_ids) & set(remove_ids))},
+            )
+        _validate_bulk_roles(guild, add_ids + remove_ids)
+
+        job_id = secrets.token_urlsafe(8)
+        job = {
+            "job_id": job_id,
+            "guild_id": guild_id,
+            "add_role_ids": add_ids,
+            "remove_role_ids": remove_ids,
+            "created_at": time.time(),
+            "total": 0,
+            "pending": _select_members(
+                guild, member_ids, has_role_id, missing_role_id, include_bots
+            ),
+            "updated": 0,
+            "unchanged": 0,
+            "failed": [],
+        }
+        job["total"] = len(job["pending"])
+        write_json(_role_job_path(job_id), job)
+
+    add = {int(role_id) for role_id in job["add_role_ids"]}
+    remove = {int(role_id) for role_id in job["remove_role_ids"]}
+    batch = job["pending"][:batch_size]
+    completed: set[int] = set()
+    total = job["total"]
+    done_before = total - len(job["pending"])
+
+    def checkpoint() -> None:
+        job["pending"] = [m for m in job["pending"] if m not in completed]
+        write_json(_role_job_path(job["job_id"]), job)
+
+    async def apply_change(member_id: int) -> None:
+        member = guild.get_member(member_id)
+        if member is None:
+            job["failed"].append({"member_id": str(member_id), "error": "Member left"})
+            return
+        current = set(member._roles)
+        desired = (current | add) - remove
+        if desired == current:
+            job["unchanged"] += 1
+            return
+        try:
+            # All role changes for the member go out as one PATCH.
+            await member.edit(roles=[discord.Object(id=role_id) for role_id in desired])
+        except discord.HTTPException as e:
+            job["failed"].append({"member_id": str(member_id), "error": str(e)})
+            return
+        job["updated"] += 1
+
+    async def update_member(member_id: int) -> None:
+        await apply_change(member_id)
+        completed.add(member_id)
+        if len(completed) % _ROLE_JOB_CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+        if progress and len(completed) % _ROLE_JOB_PROGRESS_INTERVAL == 0:
+            done = done_before + len(completed)
+            await progress(done, total, f"{done}/{total} members processed")
+
+    await _with_status("Updating member roles")
+    try:
+        await gather_limited(batch, update_member)
+    finally:
+        # Also runs on cancellation, so an interrupted call resumes without redoing work.
+        checkpoint()
+
+    remaining = len(job["pending"])
+    logger.info(
+        "member_roles_bulk_updated",
+        guild_id=guild_id,
+        job_id=job["job_id"],
+        processed=len(completed),
+        remaining=remaining,
+    )
+
+    return {
+        "job_id": job["job_id"],
+        "guild_id": guild_id,
+        "add_role_ids": job["add_role_ids"],
+        "remove_role_ids": job["remove_role_ids"],
+        "total_count": total,
+        "processed_this_call": len(completed),
+        "updated_count": job["updated"],
+        "unchanged_count": job["unchanged"],
+        "failed_count": len(job["failed"]),
+        "failed": job["failed"][:50],
+        "remaining_count": remaining,
+        "complete": remaining == 0,
+    }
+
+
 async def get_roles(guild_id: str) -> list[dict[str, Any]]:
     session = await get_current_session()
     client = session.client
@@ -0,0 +1,201 @@
+import time
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.discord.scheduler import SCHEDULED_ACTIONS, ActionScheduler
+from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _with_status(activity: str):
+    await update_bot_status(activity, "playing")
+
+
+def _get_scheduler(client: discord.Client) -> ActionScheduler:
+    scheduler = getattr(client, "scheduler", None)
+    if scheduler is None:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException("Action scheduler is not running; the bot is not ready yet")
+    return scheduler
+
+
+def _action_dict(row: dict[str, Any]) -> dict[str, Any]:
+    def iso(value: Optional[float]) -> Optional[str]:
+        return datetime.fromtimestamp(value, UTC).isoformat() if value else None
+
+    return {
+        "action_id": str(row["id"]),
+        "guild_id": str(row["guild_id"]),
+        "action": row["action"],
+        "due_at": iso(row["due_at"]),
+        "user_id": str(row["user_id"]) if row["user_id"] else None,
+        "role_id": str(row["role_id"]) if row["role_id"] else None,
+        "channel_id": str(row["channel_id"]) if row["channel_id"] else None,
+        "message_id": str(row["message_id"]) if row["message_id"] else None,
+        "reason": row["reason"],
+        "status": row["status"],
+        "created_at": iso(row["created_at"]),
+        "executed_at": iso(row["executed_at"]),
+        "error": row["error"],
+    }
+
+
+async def schedule_action(
+    guild_id: str,
+    action: str,
+    delay_seconds: Optional[int] = None,
+    due_at: Optional[str] = None,
+    user_id: Optional[str] = None,
+    role_id: Optional[str] = None,
+    channel_id: Optional[str] = None,
+    message_id: Optional[str] = None,
+    reason: Optional[str] = None,
+) -> dict[str, Any]:
+    """Schedule an ``unban``, ``remove_role`` or ``delete_message`` for later.
+
+    Give either ``delay_seconds`` or an ISO 8601 ``due_at``. Actions are stored on disk
+    and still run if the server restarts before they are due.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    scheduler = _get_scheduler(client)
+
+    guild = client.get_guild(int(guild_id))
+    if not guild:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Guild {guild_id} not found",
+            details={"guild_id": guild_id},
+        )
+
+    action = action.lower()
+    if action not in SCHEDULED_ACTIONS:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Invalid action: {action}. Must be one of {', '.join(SCHEDULED_ACTIONS)}",
+            details={"action": action},
+        )
+
+    required = {
+        "unban": {"user_id": user_id},
+        "remove_role": {"user_id": user_id, "role_id": role_id},
+        "delete_message": {"channel_id": channel_id, "message_id": message_id},
+    }[action]
+    missing = [name for name, value in required.items() if not value]
+    if missing:
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"{action} requires {', '.join(required)}",
+            details={"missing": missing},
+        )
+
+    if (delay_seconds is None) == (due_at is None):
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException("Provide exactly one of delay_seconds or due_at")
+    if due_at is not None:
+        try:
+            parsed = datetime.fromisoformat(due_at)
+        except ValueError:
+            from discord_mcp.discord.exceptions import ModerationException
+
+            raise ModerationException(
+                f"Invalid due_at timestamp: {due_at}. Use ISO 8601 format.",
+                details={"due_at": due_at},
+            )
+        due = (parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)).timestamp()
+    else:
+        due = time.time() + max(0, delay_seconds)
+
+    action_id = scheduler.schedule(
+        guild.id,
+        action,
+        due,
+        user_id=int(user_id) if user_id else None,
+        role_id=int(role_id) if role_id else None,
+        channel_id=int(channel_id) if channel_id else None,
+        message_id=int(message_id) if message_id else None,
+        reason=reason,
+    )
+
+    await _with_status("Scheduling moderation action")
+    logger.info(
+        "action_scheduled",
+        guild_id=guild_id,
+        action_id=action_id,
+        action=action,
+        due_at=due,
+    )
+
+    return {"success": True, **_action_dict(scheduler.get(action_id))}
+
+
+async def list_scheduled_actions(
+    guild_id: str,
+    status: Optional[str] = "pending",
+    after: Optional[str] = None,
+    limit: int = 100,
+) -> dict[str, Any]:
+    """List a guild's scheduled actions by ID; ``status`` of ``None`` includes finished ones."""
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    scheduler = _get_scheduler(client)
+    limit = max(1, min(limit, 1000))
+    rows = scheduler.list_actions(
+        int(guild_id), status=status, after_id=int(after) if after else 0, limit=limit + 1
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "guild_id": guild_id,
+        "pending_count": scheduler.pending_count(int(guild_id)),
+        "returned_count": len(rows),
+        "has_more": has_more,
+        "next_cursor": str(rows[-1]["id"]) if has_more else None,
+        "actions": [_action_dict(row) for row in rows],
+    }
+
+
+async def cancel_scheduled_action(action_id: str) -> dict[str, Any]:
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    scheduler = _get_scheduler(client)
+    if not action_id.isdigit() or not scheduler.cancel(int(action_id)):
+        from discord_mcp.discord.exceptions import ModerationException
+
+        raise ModerationException(
+            f"Scheduled action {action_id} not found or no longer pending",
+            details={"action_id": action_id},
+        )
+
+    await _with_status("Cancelling scheduled action")
+    logger.info("scheduled_action_cancelled", action_id=action_id)
+
+    return {"success": True, "action_id": action_id, "status": "cancelled"}
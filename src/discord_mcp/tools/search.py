@@ -0,0 +1,174 @@
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.discord.search_index import MessageSearchIndex
+from discord_mcp.mcp.context import get_current_session, update_bot_status
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_BACKFILL_BATCH_SIZE = 100
+
+
+async def _with_status(activity: str):
+    await update_bot_status(activity, "playing")
+
+
+def _get_index(client: discord.Client) -> MessageSearchIndex:
+    index = getattr(client, "search_index", None)
+    if index is None:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            "Message search index is disabled. Set SEARCH_MESSAGE_INDEX_ENABLED=true to enable it.",
+        )
+    return index
+
+
+def _parse_timestamp(value: Optional[str], name: str) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Invalid {name} timestamp: {value}. Use ISO 8601 format.",
+            details={name: value},
+        )
+    # Timestamps without an offset are UTC, not the server's local time.
+    return (parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)).timestamp()
+
+
+async def backfill_message_index(
+    channel_id: str,
+    limit: int = 1000,
+    direction: str = "older",
+) -> dict[str, Any]:
+    """Index channel history into the local search index.
+
+    ``older`` continues backwards from the oldest indexed message; ``newer`` catches up
+    from the newest indexed message, e.g. after downtime.
+    """
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    index = _get_index(client)
+
+    channel = client.get_channel(int(channel_id))
+    if not channel or not hasattr(channel, "history"):
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Channel {channel_id} not found or has no message history",
+            details={"channel_id": channel_id},
+        )
+
+    if direction not in ("older", "newer"):
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Invalid direction: {direction}. Must be 'older' or 'newer'",
+            details={"direction": direction},
+        )
+
+    state = index.channel_state(channel.id)
+    history_kwargs: dict[str, Any] = {"limit": limit}
+    if state and direction == "older":
+        history_kwargs["before"] = discord.Object(id=state["oldest_id"])
+    elif state and direction == "newer":
+        history_kwargs["after"] = discord.Object(id=state["newest_id"])
+
+    await _with_status("Indexing message history")
+
+    fetched = 0
+    indexed = 0
+    batch: list[discord.Message] = []
+    try:
+        async for message in channel.history(**history_kwargs):
+            batch.append(message)
+            if len(batch) >= _BACKFILL_BATCH_SIZE:
+                indexed += index.add_messages(batch)
+                index.record_backfill(channel.id, channel.guild, [m.id for m in batch])
+                fetched += len(batch)
+                batch = []
+    except discord.Forbidden as e:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Bot cannot read history in channel {channel_id}",
+            details={"channel_id": channel_id, "original_error": str(e)},
+        )
+    finally:
+        if batch:
+            indexed += index.add_messages(batch)
+            index.record_backfill(channel.id, channel.guild, [m.id for m in batch])
+            fetched += len(batch)
+
+    logger.info(
+        "message_index_backfilled",
+        channel_id=channel_id,
+        direction=direction,
+        fetched=fetched,
+        indexed=indexed,
+    )
+
+    return {
+        "channel_id": channel_id,
+        "direction": direction,
+        "fetched_count": fetched,
+        "indexed_count": indexed,
+        "exhausted": fetched < limit,
+        "state": index.channel_state(channel.id),
+    }
+
+
+async def search_messages(
+    query: str,
+    guild_id: Optional[str] = None,
+    channel_id: Optional[str] = None,
+    author_id: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: int = 25,
+) -> dict[str, Any]:
+    session = await get_current_session()
+    client = session.client
+
+    if not client:
+        from discord_mcp.discord.exceptions import SessionException
+
+        raise SessionException("Client not initialized")
+
+    index = _get_index(client)
+
+    if not query.strip():
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException("query must not be empty")
+
+    hits = index.search(
+        query=query,
+        guild_id=int(guild_id) if guild_id else None,
+        channel_id=int(channel_id) if channel_id else None,
+        author_id=int(author_id) if author_id else None,
+        after=_parse_timestamp(after, "after"),
+        before=_parse_timestamp(before, "before"),
+        limit=max(1, min(limit, 100)),
+    )
+
+    logger.info("messages_searched", guild_id=guild_id, hit_count=len(hits))
+
+    return {
+        "query": query,
+        "returned_count": len(hits),
+        "hits": hits,
+    }
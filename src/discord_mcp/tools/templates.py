@@ -0,0 +1,210 @@
+import re
+from typing import Any, Optional
+
+import discord
+
+from discord_mcp.discord.session import DiscordSession
+from discord_mcp.mcp.context import get_current_session
+from discord_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_TEMPLATE_VARIABLE = re.compile(r"\{(\w+)\}")
+
+MAX_EMBEDS = 10
+MAX_EMBED_TOTAL_LENGTH = 6000
+MAX_EMBED_FIELDS = 25
+
+
+def render_placeholders(template: str, variables: dict[str, str]) -> str:
+    """Substitute ``{name}`` placeholders, leaving unknown placeholders untouched."""
+    return _TEMPLATE_VARIABLE.sub(
+        lambda m: variables.get(m.group(1), m.group(0)),
+        template,
+    )
+
+
+def _collect_placeholders(value: Any, found: set[str]) -> None:
+    if isinstance(value, str):
+        found.update(_TEMPLATE_VARIABLE.findall(value))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_placeholders(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_placeholders(item, found)
+
+
+def _render_value(value: Any, variables: dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return render_placeholders(value, variables)
+    if isinstance(value, dict):
+        return {key: _render_value(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_render_value(item, variables) for item in value]
+    return value
+
+
+def _validate_embed(embed: discord.Embed, index: int) -> None:
+    from discord_mcp.discord.exceptions import MessageException
+
+    problems = []
+    if embed.title and len(embed.title) > 256:
+        problems.append("title exceeds 256 characters")
+    if embed.description and len(embed.description) > 4096:
+        problems.append("description exceeds 4096 characters")
+    if len(embed.fields) > MAX_EMBED_FIELDS:
+        problems.append(f"more than {MAX_EMBED_FIELDS} fields")
+    if len(embed) > MAX_EMBED_TOTAL_LENGTH:
+        problems.append(f"total length exceeds {MAX_EMBED_TOTAL_LENGTH} characters")
+
+    if problems:
+        raise MessageException(
+            f"Embed {index} is invalid: {', '.join(problems)}",
+            details={"embed_index": index, "problems": problems},
+        )
+
+
+class MessageTemplate:
+    """A validated, pre-built message skeleton registered for a session.
+
+    Embeds without placeholders are built once and reused on every send; embeds with
+    placeholders keep their validated dict form and only substitute strings at send time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        content: Optional[str] = None,
+        embeds: Optional[list[dict[str, Any]]] = None,
+        allowed_mentions: Optional[dict[str, Any]] = None,
+        tts: bool = False,
+    ):
+        self.name = name
+        self.content = content
+        self.tts = tts
+
+        self.allowed_mentions: Optional[discord.AllowedMentions] = None
+        if allowed_mentions:
+            self.allowed_mentions = discord.AllowedMentions(
+                everyone=allowed_mentions.get("everyone", False),
+                users=allowed_mentions.get("users", []),
+                roles=allowed_mentions.get("roles", []),
+            )
+
+        self.embeds = [discord.Embed.from_dict(e) for e in embeds or []]
+        self._embed_dicts = [embed.to_dict() for embed in self.embeds]
+        self._embed_placeholders: list[set[str]] = []
+        for embed_dict in self._embed_dicts:
+            found: set[str] = set()
+            _collect_placeholders(embed_dict, found)
+            self._embed_placeholders.append(found)
+
+        variables: set[str] = set()
+        if content:
+            variables.update(_TEMPLATE_VARIABLE.findall(content))
+        for found in self._embed_placeholders:
+            variables.update(found)
+        self.variables = sorted(variables)
+
+    def validate(self) -> None:
+        from discord_mcp.discord.exceptions import MessageException
+
+        if not self.content and not self.embeds:
+            raise MessageException(
+                f"Template {self.name} needs content or at least one embed",
+                details={"template": self.name},
+            )
+        if len(self.embeds) > MAX_EMBEDS:
+            raise MessageException(
+                f"Template {self.name} has more than {MAX_EMBEDS} embeds",
+                details={"template": self.name, "embed_count": len(self.embeds)},
+            )
+        for index, embed in enumerate(self.embeds):
+            _validate_embed(embed, index)
+
+    def render_content(self, variables: dict[str, str]) -> Optional[str]:
+        if self.content is None:
+            return None
+        return render_placeholders(self.content, variables)
+
+    def render_embeds(self, variables: dict[str, str]) -> list[discord.Embed]:
+        rendered = []
+        for embed, embed_dict, placeholders in zip(
+            self.embeds, self._embed_dicts, self._embed_placeholders
+        ):
+            if placeholders:
+                rendered.append(discord.Embed.from_dict(_render_value(embed_dict, variables)))
+            else:
+                rendered.append(embed)
+        return rendered
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "content": self.content,
+            "embed_count": len(self.embeds),
+            "tts": self.tts,
+            "has_allowed_mentions": self.allowed_mentions is not None,
+            "variables": self.variables,
+        }
+
+
+def get_message_template(session: DiscordSession, name: str) -> MessageTemplate:
+    template = session.message_templates.get(name)
+    if not template:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Message template {name} not found",
+            details={"template": name},
+        )
+    return template
+
+
+async def register_message_template(
+    name: str,
+    content: Optional[str] = None,
+    embeds: Optional[list[dict[str, Any]]] = None,
+    allowed_mentions: Optional[dict[str, Any]] = None,
+    tts: bool = False,
+    overwrite: bool = True,
+) -> dict[str, Any]:
+    session = await get_current_session()
+
+    if not overwrite and name in session.message_templates:
+        from discord_mcp.discord.exceptions import MessageException
+
+        raise MessageException(
+            f"Message template {name} already exists",
+            details={"template": name},
+        )
+
+    template = MessageTemplate(
+        name=name,
+        content=content,
+        embeds=embeds,
+        allowed_mentions=allowed_mentions,
+        tts=tts,
+    )
+    template.validate()
+    session.message_templates[name] = template
+
+    logger.info("message_template_registered", template=name, session_id=session.session_id)
+
+    return template.to_dict()
+
+
+async def list_message_templates() -> list[dict[str, Any]]:
+    session = await get_current_session()
+    return [template.to_dict() for template in session.message_templates.values()]
+
+
+async def delete_message_template(name: str) -> dict[str, Any]:
+    session = await get_current_session()
+    get_message_template(session, name)
+    del session.message_templates[name]
+
+    logger.info("message_template_deleted", template=name, session_id=session.session_id)
+
+    return {"success": True, "name": name}
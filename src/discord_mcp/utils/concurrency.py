@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TypeVar
+
+from discord_mcp.config import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_limited(
+    items: Sequence[T],
+    worker: Callable[[T], Awaitable[R]],
+    limit: int | None = None,
+) -> list[R]:
+    """Run ``worker`` over ``items`` with at most ``limit`` calls in flight.
+
+    Per-route rate limits are enforced by discord.py's HTTP client; the limit here only
+    bounds how many requests are queued against it at once. Results keep input order.
+    """
+    semaphore = asyncio.Semaphore(limit or settings.discord.max_concurrent_requests)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await worker(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+async def gather_ordered_by_key(
+    items: Sequence[T],
+    key: Callable[[T], Hashable],
+    worker: Callable[[T], Awaitable[R]],
+    limit: int | None = None,
+) -> list[R]:
+    """Like ``gather_limited``, but items sharing a key run sequentially in input order."""
+    groups: dict[Hashable, list[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(key(item), []).append(index)
+
+    results: list[R | None] = [None] * len(items)
+
+    async def run_group(indexes: list[int]) -> None:
+        for index in indexes:
+            results[index] = await worker(items[index])
+
+    await gather_limited(list(groups.values()), run_group, limit=limit)
+    return results  # type: ignore[return-value]
@@ -0,0 +1,25 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from discord_mcp.config import settings
+
+
+def data_path(*parts: str) -> Path:
+    """Path under ``STORAGE_DATA_DIR``."""
+    return Path(settings.storage.data_dir).joinpath(*parts)
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write compact JSON atomically, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+    os.replace(tmp_path, path)
+
+
+def read_json(path: Path) -> Optional[Any]:
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text())